@@ -1,14 +1,32 @@
 import sys
 sys.path.append("src")  # Para que Streamlit encuentre el paquete local
 
+import time
+import numpy as np
 import streamlit as st
-from campo_estatico_mdf.solver import LaplaceSolver2D
-from campo_estatico_mdf.visual import plot_potential, plot_field
-import io
+from campo_estatico_mdf.cache import SolutionCache
+from campo_estatico_mdf.service import ServiceThread
+from campo_estatico_mdf.visual import plot_potential, plot_field, to_png
 
 st.set_page_config(page_title="Simulación Electroestática 2D", layout="wide")
 st.title("Simulación Electroestática en Región Cuadrada")
 
+
+@st.cache_resource
+def get_solution_cache() -> SolutionCache:
+    """Caché de soluciones compartida entre reejecuciones y sesiones."""
+    return SolutionCache(max_bytes=512 * 2**20)
+
+
+@st.cache_resource
+def get_service() -> ServiceThread:
+    """
+    Servicio de soluciones compartido entre sesiones: une las peticiones
+    idénticas en curso y limita las soluciones simultáneas.
+    """
+    return ServiceThread(workers=2, max_queue=32, cache=get_solution_cache())
+
+
 # --- Inputs del usuario (sidebar) ---
 st.sidebar.header("Parámetros de simulación")
 N = st.sidebar.number_input("Tamaño de la malla (N x N)", min_value=3, max_value=200, value=50, step=1)
@@ -17,7 +35,8 @@ right = st.sidebar.number_input("Voltaje borde derecho (V)", value=10.0)
 top = st.sidebar.number_input("Voltaje borde superior (V)", value=5.0)
 bottom = st.sidebar.number_input("Voltaje borde inferior (V)", value=0.0)
 tol = st.sidebar.number_input("Tolerancia ε", min_value=1e-8, max_value=1.0, value=1e-5, format="%.1e")
-stride = st.sidebar.slider("Paso para vectores (quiver)", min_value=1, max_value=10, value=2)
+stride = st.sidebar.select_slider("Paso para vectores (quiver)", options=["auto", *range(1, 11)], value="auto")
+every = st.sidebar.number_input("Barridos por actualización", min_value=1, max_value=1000, value=50)
 
 # --- Inputs para tamaño de las figuras ---
 st.sidebar.header("Tamaño de las gráficas")
@@ -25,36 +44,76 @@ fig_width = st.sidebar.number_input("Ancho figura", min_value=4, max_value=20, v
 fig_height = st.sidebar.number_input("Alto figura", min_value=4, max_value=20, value=6)
 
 run_sim = st.sidebar.button("Ejecutar simulación")
+stop = st.sidebar.button("Detener")
 
 # --- Procesamiento ---
+# La simulación se envía al servicio y esta ejecución del script solo consulta
+# su estado; mientras no termina, el script se vuelve a ejecutar cada medio
+# segundo sin bloquear la sesión.
+service = get_service()
 if run_sim:
-    with st.spinner("Ejecutando el solver de Jacobi..."):
-        solver = LaplaceSolver2D(N=N, left=left, right=right, top=top, bottom=bottom)
-        info = solver.solve_jacobi(tol=tol, max_iter=10000)
+    st.session_state["job"] = service.submit({
+        "N": int(N), "left": left, "right": right, "top": top, "bottom": bottom,
+        "method": "jacobi", "tol": tol, "max_iter": 10000, "check_every": int(every),
+    })
+job = service.status(st.session_state["job"]) if "job" in st.session_state else None
+if stop and job is not None and job.state in ("queued", "running"):
+    # Solo se retira el envío de esta sesión: si otras sesiones esperan la
+    # misma solución, el servicio la mantiene en curso para ellas.
+    service.cancel(job.id)
+    del st.session_state["job"]
+    job = None
+    st.warning("Simulación detenida.")
+
+if job is not None and job.history:
+    iterations, diffs = zip(*job.history)
+    history = {"iteración": list(iterations),
+               "log10(max_diff)": np.log10(np.maximum(diffs, 1e-300)).tolist()}
+else:
+    history = None
+
+if job is not None and job.state in ("queued", "running"):
+    st.subheader("Convergencia")
+    if job.state == "queued":
+        st.info("Simulación en cola…")
+    elif history is not None:
+        st.write(
+            f"Iteración {history['iteración'][-1]} · max_diff = {job.history[-1][1]:.3e} · "
+            f"{time.perf_counter() - job.started:.2f} s"
+        )
+        st.line_chart(history, x="iteración")
+    time.sleep(0.5)
+    st.rerun()
+elif job is not None and job.state != "done":
+    st.warning(f"Simulación {'detenida' if job.state == 'cancelled' else 'fallida'}. {job.error or ''}")
+    if history is not None:
+        st.line_chart(history, x="iteración")
+
+if job is not None and job.state == "done":
+    solver = job.solver
+    info = solver.info
 
     # --- Sección principal dividida en 2 columnas ---
     col_graf, col_metrics = st.columns([3, 1])  # proporción 3:1
 
     with col_graf:
         st.subheader("Mapa de potencial eléctrico V(x, y)")
-        fig1 = plot_potential(solver.V, figsize=(fig_width, fig_height))
-        st.pyplot(fig1)
-
-        # Botón para descargar figura de potencial
-        buf1 = io.BytesIO()
-        fig1.savefig(buf1, format="png")
-        buf1.seek(0)
-        st.download_button("Descargar mapa de potencial", buf1, file_name="potencial.png", mime="image/png")
+        # Cada figura se dibuja una sola vez a PNG; la imagen mostrada y la
+        # descarga usan los mismos bytes.
+        dpi = 100
+        max_pixels = int(max(fig_width, fig_height) * dpi)
+        png1 = to_png(plot_potential(solver.V, figsize=(fig_width, fig_height), max_pixels=max_pixels), dpi)
+        st.image(png1)
+        st.download_button("Descargar mapa de potencial", png1, file_name="potencial.png", mime="image/png")
 
         st.subheader("Campo eléctrico E(x, y)")
-        fig2 = plot_field(solver.V, solver.h, stride=stride, figsize=(fig_width, fig_height))
-        st.pyplot(fig2)
-
-        # Botón para descargar figura del campo eléctrico
-        buf2 = io.BytesIO()
-        fig2.savefig(buf2, format="png")
-        buf2.seek(0)
-        st.download_button("Descargar campo eléctrico", buf2, file_name="campo.png", mime="image/png")
+        fig2 = plot_field(
+            solver.V, solver.h, stride=None if stride == "auto" else stride,
+            figsize=(fig_width, fig_height), field=solver.field, max_pixels=max_pixels,
+        )
+        png2 = to_png(fig2, dpi)
+        st.image(png2)
+        st.download_button("Descargar campo eléctrico", png2, file_name="campo.png", mime="image/png")
 
     with col_metrics:
         st.subheader("Métrica de convergencia")
@@ -0,0 +1,238 @@
+# benchmarks/bench.py
+"""
+Suite de benchmarks reproducible de ``campo_estatico_mdf``.
+
+Mide los métodos de solución, :func:`campo_estatico_mdf.field.electric_field`
+y las funciones de :mod:`campo_estatico_mdf.visual` para varios tamaños de
+malla, y escribe los resultados en JSON.
+
+Uso::
+
+    python benchmarks/bench.py run --sizes 32 64 128 --out base.json
+    python benchmarks/bench.py run --out nuevo.json            # 32 … 4096
+    python benchmarks/bench.py compare base.json nuevo.json --threshold 1.15
+
+Cada tamaño ``n`` corresponde a una malla de ``n + 1`` nodos por lado
+(``n`` intervalos), de modo que multigrid puede engrosar hasta el final.
+Jacobi y SOR se miden con un número fijo de barridos (``--sweeps``) para que
+el costo sea comparable entre tamaños; los demás métodos se resuelven hasta su
+tolerancia. ``compare`` termina con código 1 si algún caso es más lento que la
+referencia en un factor mayor que ``--threshold``.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+if __name__ == "__main__":  # ejecución directa sin instalar el paquete
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import matplotlib  # noqa: E402
+import numpy as np  # noqa: E402
+from campo_estatico_mdf import LaplaceSolver2D  # noqa: E402
+from campo_estatico_mdf.field import electric_field  # noqa: E402
+from campo_estatico_mdf.visual import plot_field, plot_potential  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+#: Tamaños por defecto (intervalos por lado).
+SIZES = (32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+# Argumentos de cada método y tamaño máximo razonable (la LU dispersa crece
+# más rápido que N^2 en memoria).
+SOLVER_CASES = {
+    "jacobi": ({"tol": 0.0}, None),
+    "sor": ({"tol": 0.0}, None),
+    "multigrid": ({"tol": 1e-6}, None),
+    "cg": ({"tol": 1e-8}, None),
+    "dst": ({}, None),
+    "direct": ({}, 1024),
+}
+
+
+def peak_rss() -> int | None:
+    """Pico de memoria residente del proceso en bytes (``None`` si no se conoce)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(rss if sys.platform == "darwin" else rss * 1024)
+
+
+def _best_of(fn, repeat: int):
+    """Ejecuta ``fn`` ``repeat`` veces y devuelve el menor tiempo y el último resultado."""
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def _record(name: str, n: int, seconds: float, iterations=None, mlups=None) -> dict:
+    return {
+        "name": name,
+        "N": n + 1,
+        "time": seconds,
+        "mlups": mlups,
+        "iterations": iterations,
+        "peak_rss": peak_rss(),
+    }
+
+
+def _problem(n: int) -> LaplaceSolver2D:
+    N = n + 1
+    return LaplaceSolver2D(N, left=0.0, right=10.0, top=np.linspace(0, 5, N), bottom=0.0, h=1.0 / n)
+
+
+def bench_solvers(n: int, repeat: int, sweeps: int, methods=None) -> list[dict]:
+    """Mide cada método de :data:`SOLVER_CASES` sobre la malla de ``n`` intervalos."""
+    out = []
+    for method, (kwargs, limit) in SOLVER_CASES.items():
+        if methods and method not in methods:
+            continue
+        if limit is not None and n > limit:
+            continue
+        if method == "direct":
+            try:
+                import scipy  # noqa: F401
+            except ImportError:
+                continue
+        kwargs = dict(kwargs)
+        if method in ("jacobi", "sor"):
+            kwargs["max_iter"] = sweeps
+
+        def run():
+            s = _problem(n)
+            return s.solve(method, **kwargs)
+
+        seconds, info = _best_of(run, repeat)
+        mlups = None
+        if method in ("jacobi", "sor"):
+            mlups = info.iterations * (n - 1) ** 2 / seconds / 1e6
+        out.append(_record(f"solve.{method}", n, seconds, info.iterations, mlups))
+    return out
+
+
+def bench_field(n: int, repeat: int) -> list[dict]:
+    """Mide :func:`electric_field` sobre un potencial aleatorio."""
+    V = np.random.default_rng(0).random((n + 1, n + 1))
+    seconds, _ = _best_of(lambda: electric_field(V, 1.0 / n), repeat)
+    return [_record("field.electric_field", n, seconds, mlups=V.size / seconds / 1e6)]
+
+
+def bench_visual(n: int, repeat: int) -> list[dict]:
+    """Mide la construcción y el dibujado completo de las figuras."""
+    V = np.random.default_rng(0).random((n + 1, n + 1))
+    stride = max(1, (n + 1) // 64)
+
+    import matplotlib.pyplot as plt
+
+    def draw(make):
+        fig = make()
+        fig.canvas.draw()
+        plt.close(fig)
+
+    out = []
+    seconds, _ = _best_of(lambda: draw(lambda: plot_potential(V)), repeat)
+    out.append(_record("visual.plot_potential", n, seconds))
+    seconds, _ = _best_of(lambda: draw(lambda: plot_field(V, 1.0 / n, stride=stride)), repeat)
+    out.append(_record("visual.plot_field", n, seconds))
+    return out
+
+
+def run(sizes=SIZES, repeat: int = 3, sweeps: int = 100, groups=("solve", "field", "visual"),
+        methods=None) -> dict:
+    """
+    Ejecuta la suite y devuelve un diccionario serializable en JSON con
+    ``{"meta": {...}, "results": [...]}``.
+    """
+    results = []
+    for n in sizes:
+        if "solve" in groups:
+            results += bench_solvers(n, repeat, sweeps, methods)
+        if "field" in groups:
+            results += bench_field(n, repeat)
+        if "visual" in groups:
+            results += bench_visual(n, repeat)
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "sweeps": sweeps,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(base: dict, new: dict, threshold: float = 1.10) -> list[dict]:
+    """
+    Compara dos ejecuciones caso a caso (por ``name`` y ``N``).
+
+    Returns
+    -------
+    list of dict
+        Una fila por caso común con ``ratio = time_new / time_base`` y
+        ``slower = ratio > threshold``.
+    """
+    ref = {(r["name"], r["N"]): r for r in base["results"]}
+    rows = []
+    for r in new["results"]:
+        b = ref.get((r["name"], r["N"]))
+        if b is None:
+            continue
+        ratio = r["time"] / b["time"] if b["time"] > 0 else float("inf")
+        rows.append({"name": r["name"], "N": r["N"], "base": b["time"], "new": r["time"],
+                     "ratio": ratio, "slower": ratio > threshold})
+    return rows
+
+
+def main(argv=None) -> int:
+    matplotlib.use("Agg")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="ejecuta la suite y escribe JSON")
+    p_run.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--sweeps", type=int, default=100)
+    p_run.add_argument("--groups", nargs="+", default=["solve", "field", "visual"],
+                       choices=["solve", "field", "visual"])
+    p_run.add_argument("--methods", nargs="+", choices=list(SOLVER_CASES))
+    p_run.add_argument("--out", type=Path, help="archivo JSON (por defecto, salida estándar)")
+
+    p_cmp = sub.add_parser("compare", help="compara dos ejecuciones")
+    p_cmp.add_argument("base", type=Path)
+    p_cmp.add_argument("new", type=Path)
+    p_cmp.add_argument("--threshold", type=float, default=1.10)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        data = run(args.sizes, args.repeat, args.sweeps, args.groups, args.methods)
+        text = json.dumps(data, indent=2)
+        if args.out is None:
+            print(text)
+        else:
+            args.out.write_text(text)
+        return 0
+
+    rows = compare(json.loads(args.base.read_text()), json.loads(args.new.read_text()),
+                   args.threshold)
+    for row in rows:
+        flag = "  MÁS LENTO" if row["slower"] else ""
+        print(f"{row['name']:<24} N={row['N']:<5} {row['base']:.4g} s -> {row['new']:.4g} s "
+              f"(x{row['ratio']:.2f}){flag}")
+    return int(any(row["slower"] for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# benchmarks/conftest.py
+import sys
+from pathlib import Path
+import matplotlib
+
+# Solo al ejecutar ``pytest benchmarks``: dibujo sin pantalla y el paquete
+# tomado de ``src`` aunque no esté instalado.
+matplotlib.use("Agg")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
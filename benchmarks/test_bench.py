@@ -0,0 +1,64 @@
+# benchmarks/test_bench.py
+"""
+Ejecución de la suite de benchmarks con pytest::
+
+    pytest benchmarks                                   # tamaño 32, rápido
+    BENCH_SIZES=32,256,1024 BENCH_OUT=run.json pytest benchmarks
+"""
+import json
+import os
+import pytest
+import bench
+
+SIZES = [int(n) for n in os.environ.get("BENCH_SIZES", "32").split(",")]
+_RESULTS = []
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _write_results():
+    yield
+    out = os.environ.get("BENCH_OUT")
+    if out:
+        data = bench.run(sizes=[], repeat=1)
+        data["results"] = _RESULTS
+        with open(out, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_bench_solvers(n):
+    rows = bench.bench_solvers(n, repeat=1, sweeps=20)
+    assert {"solve.jacobi", "solve.sor", "solve.dst"} <= {r["name"] for r in rows}
+    for r in rows:
+        assert r["time"] > 0 and r["N"] == n + 1
+    assert all(r["mlups"] > 0 for r in rows if r["name"] in ("solve.jacobi", "solve.sor"))
+    _RESULTS.extend(rows)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_bench_field_and_visual(n):
+    rows = bench.bench_field(n, repeat=1) + bench.bench_visual(n, repeat=1)
+    assert [r["name"] for r in rows] == [
+        "field.electric_field", "visual.plot_potential", "visual.plot_field"
+    ]
+    _RESULTS.extend(rows)
+
+
+def test_compare_flags_slowdowns(tmp_path, capsys):
+    base = {"meta": {}, "results": [
+        {"name": "solve.jacobi", "N": 33, "time": 1.0},
+        {"name": "solve.sor", "N": 33, "time": 1.0},
+    ]}
+    new = {"meta": {}, "results": [
+        {"name": "solve.jacobi", "N": 33, "time": 1.05},
+        {"name": "solve.sor", "N": 33, "time": 1.5},
+    ]}
+    rows = bench.compare(base, new, threshold=1.1)
+    assert [r["slower"] for r in rows] == [False, True]
+
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text(json.dumps(base))
+    b.write_text(json.dumps(new))
+    assert bench.main(["compare", str(a), str(b)]) == 1
+    assert bench.main(["compare", str(a), str(a)]) == 0
+    assert "MÁS LENTO" in capsys.readouterr().out
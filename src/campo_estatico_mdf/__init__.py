@@ -2,4 +2,22 @@
 from .solver import LaplaceSolver2D
 from .jacobi import ConvergenceInfo
 
-__all__ = ["LaplaceSolver2D", "ConvergenceInfo"]
+__all__ = ["LaplaceSolver2D", "LaplaceSolver3D", "ConvergenceInfo", "solve_batch"]
+
+# Exportaciones que se cargan al primer acceso, para que importar el paquete
+# (por ejemplo, desde la CLI) no arrastre el solver 3D ni los lotes.
+_LAZY = {"LaplaceSolver3D": ".solver3d", "solve_batch": ".batch"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,433 @@
+# src/campo_estatico_mdf/amr.py
+from __future__ import annotations
+import numpy as np
+from .field import electric_field
+from .jacobi import ConvergenceInfo
+
+# Direcciones (di, dj) del esquema de cinco puntos: este, oeste, sur (fila
+# creciente) y norte, con el convenio V[y, x] de la fila 0 arriba.
+_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def edge_function(val, length: float):
+    """
+    Convierte la especificación de un borde en una función de la coordenada
+    física a lo largo del borde.
+
+    Parameters
+    ----------
+    val : float, array_like or callable
+        Escalar (borde uniforme), muestras equiespaciadas sobre ``[0, length]``
+        (se interpolan linealmente, como las fronteras de longitud ``N`` de
+        :class:`LaplaceSolver2D`) o función vectorizada ``f(t)``.
+    length : float
+        Longitud del borde.
+
+    Raises
+    ------
+    ValueError
+        Si ``val`` es un arreglo con menos de dos muestras o de más de una dimensión.
+    """
+    if callable(val):
+        return lambda t: np.broadcast_to(np.asarray(val(t), dtype=np.float64), np.shape(t))
+    arr = np.asarray(val, dtype=np.float64)
+    if arr.ndim == 0:
+        return lambda t: np.full(np.shape(t), float(arr))
+    if arr.ndim != 1 or arr.size < 2:
+        raise ValueError("Cada frontera debe ser un escalar, un vector o una función.")
+    samples = np.linspace(0.0, length, arr.size)
+    return lambda t: np.interp(t, samples, arr)
+
+
+class Quadtree:
+    """
+    Árbol cuaternario de celdas sobre el cuadrado ``[0, length]²``.
+
+    El nivel 0 tiene ``base × base`` celdas y cada refinamiento divide una celda
+    en cuatro. Las posiciones se expresan en la red fina del nivel
+    ``max_level``, de ``M = base · 2**max_level`` celdas por lado: una celda de
+    nivel ``l`` mide ``2**(max_level - l)`` unidades. Solo se guardan las hojas,
+    como conjuntos de códigos enteros por nivel.
+
+    Parameters
+    ----------
+    base : int
+        Celdas por lado en el nivel 0.
+    max_level : int
+        Nivel máximo de refinamiento.
+    length : float, default=1.0
+        Lado del dominio.
+
+    Raises
+    ------
+    ValueError
+        Si ``base < 1`` o ``max_level < 0``.
+    """
+
+    def __init__(self, base: int, max_level: int, length: float = 1.0):
+        if base < 1 or max_level < 0:
+            raise ValueError("base debe ser >= 1 y max_level >= 0.")
+        self.base, self.max_level, self.length = int(base), int(max_level), float(length)
+        self.M = self.base << self.max_level
+        self.hf = self.length / self.M
+        self._leaves: list[set[int]] = [set() for _ in range(self.max_level + 1)]
+        self._leaves[0].update(range(self.base * self.base))
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._leaves)
+
+    def cells(self, level: int) -> int:
+        """Celdas por lado en ``level``."""
+        return self.base << level
+
+    def size(self, level):
+        """Lado de una celda de ``level`` en unidades de la red fina."""
+        return np.left_shift(1, self.max_level - np.asarray(level))
+
+    @property
+    def depth(self) -> int:
+        """Nivel más fino con hojas."""
+        return max(l for l, s in enumerate(self._leaves) if s)
+
+    def leaves(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hojas como arreglos ``(level, ci, cj)``; ``ci`` recorre ``x`` y ``cj`` las filas."""
+        level, ci, cj = [], [], []
+        for l, codes in enumerate(self._leaves):
+            c = np.fromiter(codes, dtype=np.int64, count=len(codes))
+            level.append(np.full(c.size, l, dtype=np.int64))
+            ci.append(c // self.cells(l))
+            cj.append(c % self.cells(l))
+        return np.concatenate(level), np.concatenate(ci), np.concatenate(cj)
+
+    def leaf_level(self, a, b) -> np.ndarray:
+        """
+        Nivel de la hoja que contiene la celda fina ``(a, b)`` (vectorizado).
+        """
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        level = np.full(a.shape, -1, dtype=np.int64)
+        for l, codes in enumerate(self._leaves):
+            if not codes:
+                continue
+            s = 1 << (self.max_level - l)
+            table = np.fromiter(codes, dtype=np.int64, count=len(codes))
+            level[np.isin((a // s) * self.cells(l) + b // s, table)] = l
+        return level
+
+    def refine(self, level, ci, cj) -> int:
+        """
+        Divide las hojas indicadas que aún no están en ``max_level``.
+
+        Returns
+        -------
+        int
+            Número de hojas divididas.
+        """
+        count = 0
+        for l, i, j in zip(np.atleast_1d(level), np.atleast_1d(ci), np.atleast_1d(cj)):
+            l, i, j = int(l), int(i), int(j)
+            code = i * self.cells(l) + j
+            if l >= self.max_level or code not in self._leaves[l]:
+                continue
+            self._leaves[l].remove(code)
+            n = self.cells(l + 1)
+            for di in (0, 1):
+                for dj in (0, 1):
+                    self._leaves[l + 1].add((2 * i + di) * n + 2 * j + dj)
+            count += 1
+        return count
+
+    def balance(self) -> None:
+        """
+        Impone la condición 2:1: dos hojas que comparten un lado difieren a lo
+        sumo en un nivel. Se refinan las hojas gruesas hasta que se cumple.
+        """
+        changed = True
+        while changed:
+            changed = False
+            level, ci, cj = self.leaves()
+            deep = level >= 2
+            level, ci, cj = level[deep], ci[deep], cj[deep]
+            parent = level - 1
+            s = self.size(parent)
+            for di, dj in _DIRECTIONS:
+                pi, pj = (ci >> 1) + di, (cj >> 1) + dj
+                n = self.base << parent
+                inside = (pi >= 0) & (pi < n) & (pj >= 0) & (pj < n)
+                a, b = (pi * s)[inside], (pj * s)[inside]
+                cover = self.leaf_level(a, b)
+                coarse = cover < parent[inside]
+                if coarse.any():
+                    cl = cover[coarse]
+                    cs = self.size(cl)
+                    if self.refine(cl, a[coarse] // cs, b[coarse] // cs):
+                        changed = True
+
+
+class AdaptiveSolution:
+    """
+    Solución de la ecuación de Laplace sobre un :class:`Quadtree`.
+
+    Los nodos son las esquinas de las hojas. Un nodo en el punto medio del
+    lado de una hoja más gruesa es *colgante*: no es incógnita y su valor es la
+    interpolación lineal de los extremos de ese lado, lo que mantiene la
+    solución continua en las interfaces entre niveles. En los demás nodos
+    interiores se usa el esquema de cinco puntos no uniforme
+
+    .. math::
+
+        \\frac{2}{h_E (h_E + h_W)} (V_E - V) + \\frac{2}{h_W (h_E + h_W)} (V_W - V)
+        + (\\text{ídem en } y) = 0,
+
+    donde :math:`h_E, \\dots` son las distancias al nodo vecino más cercano en
+    cada dirección (un vecino colgante alineado con la dirección se sustituye
+    por el extremo lejano de su lado). El sistema disperso se resuelve con
+    :func:`scipy.sparse.linalg.spsolve`.
+
+    Attributes
+    ----------
+    tree : Quadtree
+        Malla de la solución.
+    nodes : numpy.ndarray of int
+        Códigos ordenados ``i * (M + 1) + j`` de los nodos en la red fina.
+    values : numpy.ndarray
+        Potencial en cada nodo.
+    n_unknowns : int
+        Incógnitas del sistema (nodos interiores no colgantes).
+    """
+
+    def __init__(self, tree: Quadtree, left, right, top, bottom):
+        try:
+            from scipy.sparse import coo_matrix
+            from scipy.sparse.linalg import spsolve
+        except ImportError as exc:  # pragma: no cover - depende del entorno
+            raise ImportError(
+                "El refinamiento adaptativo requiere SciPy: "
+                "pip install 'campo-estatico-mdf-Cogua-Neira[direct]'."
+            ) from exc
+
+        self.tree = tree
+        M = tree.M
+        level, ci, cj = tree.leaves()
+        s = tree.size(level)
+        x0, y0 = ci * s, cj * s
+        corners = np.concatenate([
+            self._code(x0, y0), self._code(x0 + s, y0), self._code(x0, y0 + s), self._code(x0 + s, y0 + s)
+        ])
+        self.nodes = np.unique(corners)
+
+        # Nodos colgantes: puntos medios de lados que son esquina de otra hoja.
+        big = s >= 2
+        x0, y0, s = x0[big], y0[big], s[big]
+        half = s // 2
+        mid = np.concatenate([
+            self._code(x0 + half, y0), self._code(x0 + half, y0 + s),
+            self._code(x0, y0 + half), self._code(x0 + s, y0 + half),
+        ])
+        p1 = np.concatenate([self._code(x0, y0), self._code(x0, y0 + s),
+                             self._code(x0, y0), self._code(x0 + s, y0)])
+        p2 = np.concatenate([self._code(x0 + s, y0), self._code(x0 + s, y0 + s),
+                             self._code(x0, y0 + s), self._code(x0 + s, y0 + s)])
+        horizontal = np.repeat([True, True, False, False], x0.size)
+        hanging = np.isin(mid, self.nodes)
+        mid, first = np.unique(mid[hanging], return_index=True)
+        self._hang = (mid, p1[hanging][first], p2[hanging][first], horizontal[hanging][first])
+
+        i, j = np.divmod(self.nodes, M + 1)
+        boundary = (i == 0) | (i == M) | (j == 0) | (j == M)
+        is_hanging = np.isin(self.nodes, mid)
+        free = ~boundary & ~is_hanging
+        unknowns = self.nodes[free]
+        self.n_unknowns = int(unknowns.size)
+
+        # Valores de Dirichlet; arriba y abajo prevalecen en las esquinas, como
+        # en campo_estatico_mdf.bc.impose_dirichlet.
+        self.values = np.zeros(self.nodes.size)
+        edges = [edge_function(e, tree.length) for e in (left, right, top, bottom)]
+        x, y = i * tree.hf, j * tree.hf
+        for fn, on, t in ((edges[0], i == 0, y), (edges[1], i == M, y),
+                          (edges[2], j == 0, x), (edges[3], j == M, x)):
+            self.values[on] = fn(t[on])
+
+        # Distancias a los vecinos de cada incógnita.
+        ui, uj = i[free], j[free]
+        size = lambda a, b: tree.size(tree.leaf_level(a, b))  # noqa: E731
+        dist = [
+            np.minimum(size(ui, uj), size(ui, uj - 1)),
+            np.minimum(size(ui - 1, uj), size(ui - 1, uj - 1)),
+            np.minimum(size(ui, uj), size(ui - 1, uj)),
+            np.minimum(size(ui, uj - 1), size(ui - 1, uj - 1)),
+        ]
+        for d, (di, dj) in enumerate(_DIRECTIONS):
+            for _ in range(tree.max_level + 1):
+                nb = self._code(ui + di * dist[d], uj + dj * dist[d])
+                pos, hit = self._hanging_index(nb)
+                aligned = np.zeros_like(hit)
+                aligned[hit] = self._hang[3][pos[hit]] == (di != 0)
+                if not aligned.any():
+                    break
+                dist[d] = np.where(aligned, 2 * dist[d], dist[d])
+
+        hE, hW, hS, hN = (dd.astype(np.float64) for dd in dist)
+        coef = [2.0 / (hE * (hE + hW)), 2.0 / (hW * (hE + hW)),
+                2.0 / (hS * (hS + hN)), 2.0 / (hN * (hS + hN))]
+
+        rows, nbrs, weights = [], [], []
+        index = np.arange(self.n_unknowns)
+        for d, (di, dj) in enumerate(_DIRECTIONS):
+            rows.append(index)
+            nbrs.append(self._code(ui + di * dist[d], uj + dj * dist[d]))
+            weights.append(coef[d])
+        rows, nbrs, weights = np.concatenate(rows), np.concatenate(nbrs), np.concatenate(weights)
+        rows, nbrs, weights = self._expand_hanging(rows, nbrs, weights)
+
+        is_unknown = np.isin(nbrs, unknowns)
+        rhs = np.zeros(self.n_unknowns)
+        known = ~is_unknown
+        np.add.at(rhs, rows[known], weights[known] * self.values[np.searchsorted(self.nodes, nbrs[known])])
+        cols = np.searchsorted(unknowns, nbrs[is_unknown])
+        diag = sum(coef)
+        A = coo_matrix(
+            (np.concatenate([diag, -weights[is_unknown]]),
+             (np.concatenate([index, rows[is_unknown]]), np.concatenate([index, cols]))),
+            shape=(self.n_unknowns, self.n_unknowns),
+        ).tocsc()
+        if self.n_unknowns:
+            self.values[free] = spsolve(A, rhs)
+        self._fill_hanging()
+
+    def _code(self, i, j) -> np.ndarray:
+        return np.asarray(i, dtype=np.int64) * (self.tree.M + 1) + np.asarray(j, dtype=np.int64)
+
+    def _hanging_index(self, codes):
+        """Posición de ``codes`` entre los nodos colgantes y si lo son."""
+        mid = self._hang[0]
+        pos = np.minimum(np.searchsorted(mid, codes), max(mid.size - 1, 0))
+        hit = mid[pos] == codes if mid.size else np.zeros(np.shape(codes), dtype=bool)
+        return pos, hit
+
+    def _expand_hanging(self, rows, nbrs, weights):
+        """Sustituye cada vecino colgante por la media de los extremos de su lado."""
+        for _ in range(self.tree.max_level + 1):
+            pos, hit = self._hanging_index(nbrs)
+            if not hit.any():
+                break
+            p = pos[hit]
+            rows = np.concatenate([rows[~hit], rows[hit], rows[hit]])
+            new = np.concatenate([self._hang[1][p], self._hang[2][p]])
+            nbrs = np.concatenate([nbrs[~hit], new])
+            w = 0.5 * weights[hit]
+            weights = np.concatenate([weights[~hit], w, w])
+        return rows, nbrs, weights
+
+    def _fill_hanging(self) -> None:
+        """Interpola los nodos colgantes, de los niveles gruesos a los finos."""
+        mid, p1, p2, _ = self._hang
+        if not mid.size:
+            return
+        at = np.searchsorted(self.nodes, mid)
+        a, b = np.searchsorted(self.nodes, p1), np.searchsorted(self.nodes, p2)
+        for _ in range(self.tree.max_level + 1):
+            self.values[at] = 0.5 * (self.values[a] + self.values[b])
+
+    def sample(self, x, y) -> np.ndarray:
+        """
+        Evalúa la solución en coordenadas físicas ``(x, y)`` (``y`` crece con
+        las filas) por interpolación bilineal dentro de cada hoja.
+        """
+        tree = self.tree
+        u = np.clip(np.asarray(x, dtype=np.float64) / tree.hf, 0, tree.M)
+        v = np.clip(np.asarray(y, dtype=np.float64) / tree.hf, 0, tree.M)
+        a = np.minimum(u.astype(np.int64), tree.M - 1)
+        b = np.minimum(v.astype(np.int64), tree.M - 1)
+        s = tree.size(tree.leaf_level(a, b))
+        x0, y0 = a // s * s, b // s * s
+        tx, ty = (u - x0) / s, (v - y0) / s
+        value = lambda i, j: self.values[np.searchsorted(self.nodes, self._code(i, j))]  # noqa: E731
+        return ((1 - tx) * (1 - ty) * value(x0, y0) + tx * (1 - ty) * value(x0 + s, y0)
+                + (1 - tx) * ty * value(x0, y0 + s) + tx * ty * value(x0 + s, y0 + s))
+
+    def to_uniform(self, N: int) -> np.ndarray:
+        """
+        Remuestrea la solución en una malla uniforme ``N × N`` (convenio
+        ``V[y, x]``), por ejemplo para :mod:`campo_estatico_mdf.visual`.
+        """
+        t = np.linspace(0.0, self.tree.length, N)
+        y, x = np.meshgrid(t, t, indexing="ij")
+        return self.sample(x, y)
+
+    def indicator(self) -> np.ndarray:
+        """
+        Indicador de gradiente por hoja, en el orden de :meth:`Quadtree.leaves`:
+        :math:`\\eta = h_{hoja} \\max |\\mathbf{E}|` sobre sus esquinas, es decir,
+        una estimación de la variación del potencial dentro de la hoja.
+
+        El campo se obtiene con :func:`campo_estatico_mdf.field.electric_field`
+        sobre el remuestreo uniforme al nivel más fino presente, donde todas las
+        esquinas son nodos.
+        """
+        tree = self.tree
+        n = tree.cells(tree.depth)
+        h = tree.length / n
+        Ex, Ey = electric_field(self.to_uniform(n + 1), h)
+        magnitude = np.hypot(Ex, Ey)
+        level, ci, cj = tree.leaves()
+        s = np.left_shift(1, tree.depth - level)  # lado en celdas del nivel más fino
+        x0, y0 = ci * s, cj * s
+        peak = np.maximum.reduce([magnitude[y0, x0], magnitude[y0, x0 + s],
+                                  magnitude[y0 + s, x0], magnitude[y0 + s, x0 + s]])
+        return s * h * peak
+
+
+def adaptive_solve(
+    left=0.0, right=0.0, top=0.0, bottom=0.0,
+    length: float = 1.0,
+    base: int = 4,
+    max_level: int = 6,
+    tol: float = 1e-2,
+    max_cycles: int | None = None,
+) -> tuple[AdaptiveSolution, ConvergenceInfo]:
+    """
+    Resuelve la ecuación de Laplace en ``[0, length]²`` refinando la malla
+    cerca de los gradientes fuertes.
+
+    En cada ciclo se resuelve sobre el árbol actual, se calcula
+    :meth:`AdaptiveSolution.indicator` y se dividen las hojas con
+    :math:`\\eta > tol`, manteniendo el balance 2:1. Termina cuando ninguna
+    hoja supera ``tol``, todas las que la superan están en ``max_level`` o se
+    alcanza ``max_cycles``.
+
+    Parameters
+    ----------
+    left, right, top, bottom : float, array_like or callable
+        Fronteras de Dirichlet (ver :func:`edge_function`).
+    length : float, default=1.0
+        Lado del dominio.
+    base : int, default=4
+        Celdas por lado del nivel 0.
+    max_level : int, default=6
+        Nivel máximo; la resolución más fina es ``length / (base * 2**max_level)``.
+    tol : float, default=1e-2
+        Variación máxima admitida del potencial dentro de una hoja.
+    max_cycles : int or None, default=None
+        Ciclos de solución y refinamiento; por defecto ``max_level + 1``.
+
+    Returns
+    -------
+    solution : AdaptiveSolution
+        Solución sobre la malla final.
+    info : ConvergenceInfo
+        ``iterations`` es el número de ciclos y ``max_diff`` el mayor
+        indicador de las hojas finales.
+    """
+    tree = Quadtree(base, max_level, length)
+    cycles = max_level + 1 if max_cycles is None else int(max_cycles)
+    solution, eta, k = None, np.array([np.inf]), 0
+    for k in range(1, cycles + 1):
+        solution = AdaptiveSolution(tree, left, right, top, bottom)
+        eta = solution.indicator()
+        level, ci, cj = tree.leaves()
+        mark = eta > tol
+        if k == cycles or not tree.refine(level[mark], ci[mark], cj[mark]):
+            break
+        tree.balance()
+    return solution, ConvergenceInfo(k, float(eta.max()), float(tol))
@@ -0,0 +1,191 @@
+# src/campo_estatico_mdf/batch.py
+from __future__ import annotations
+import numpy as np
+from .grid import allocate_potential
+from .jacobi import ConvergenceInfo, _jacobi_sweep
+from .sor import _red_black_sweep, optimal_omega
+from .solver import BoundarySpec
+
+
+def _square_size(N) -> int:
+    """Valida que ``N`` describa una malla cuadrada y devuelve su tamaño."""
+    if not np.isscalar(N):
+        raise ValueError(
+            "Los lotes requieren una malla cuadrada N × N; use LaplaceSolver2D "
+            "o run_sweep para mallas (Ny, Nx)."
+        )
+    return int(N)
+
+
+def stack_boundaries(N: int, boundaries) -> np.ndarray:
+    """
+    Normaliza una colección de fronteras a un arreglo de forma ``(B, 4, N)``.
+
+    El segundo eje sigue el orden ``(left, right, top, bottom)``.
+
+    Parameters
+    ----------
+    N : int
+        Número de nodos por borde.
+    boundaries : array_like or sequence of BoundarySpec
+        Puede ser un arreglo ``(B, 4, N)``, un arreglo ``(B, 4)`` de valores
+        escalares por borde, o una secuencia de :class:`BoundarySpec` (o de
+        tuplas ``(left, right, top, bottom)`` con escalares o vectores).
+
+    Returns
+    -------
+    numpy.ndarray of shape (B, 4, N)
+        Fronteras como arreglo flotante.
+
+    Raises
+    ------
+    ValueError
+        Si la forma no es compatible con ``N`` o ``N`` no es un entero.
+    """
+    N = _square_size(N)
+    if isinstance(boundaries, np.ndarray):
+        edges = boundaries.astype(float)
+    else:
+        rows = []
+        for b in boundaries:
+            if isinstance(b, BoundarySpec):
+                b = (b.left, b.right, b.top, b.bottom)
+            rows.append([np.broadcast_to(np.asarray(e, dtype=float), (N,)) for e in b])
+        edges = np.asarray(rows, dtype=float)
+
+    if edges.ndim == 2 and edges.shape[1] == 4:
+        edges = np.repeat(edges[:, :, None], N, axis=2)
+    if edges.ndim != 3 or edges.shape[1:] != (4, N):
+        raise ValueError("Las fronteras deben tener forma (B, 4, N) o (B, 4).")
+    return edges
+
+
+def impose_dirichlet_batch(V: np.ndarray, edges: np.ndarray) -> None:
+    """
+    Aplica in-place las fronteras ``edges`` de forma ``(B, 4, N)`` sobre la pila
+    de mallas ``V`` de forma ``(B, N, N)``, con el mismo convenio que
+    :func:`campo_estatico_mdf.bc.impose_dirichlet`.
+    """
+    V[:, :, 0] = edges[:, 0]
+    V[:, :, -1] = edges[:, 1]
+    V[:, 0, :] = edges[:, 2]
+    V[:, -1, :] = edges[:, 3]
+
+
+def solve_batch(
+    N: int,
+    boundaries,
+    method: str = "jacobi",
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    check_every: int = 1,
+    omega: float | None = None,
+    dtype=np.float64,
+) -> tuple[np.ndarray, list[ConvergenceInfo]]:
+    """
+    Resuelve ``B`` problemas de Laplace que comparten la malla ``N × N`` en una
+    sola llamada vectorizada.
+
+    Todas las mallas se apilan en un arreglo ``(B, N, N)`` y cada barrido se
+    aplica a la pila completa. Cada miembro se detiene en su propio punto de
+    convergencia: en cuanto alcanza ``tol`` se guarda su resultado y se retira de
+    la pila activa.
+
+    Parameters
+    ----------
+    N : int
+        Tamaño de la malla.
+    boundaries : array_like or sequence of BoundarySpec
+        Fronteras de cada miembro (ver :func:`stack_boundaries`).
+    method : {"jacobi", "sor"}, default="jacobi"
+        Método iterativo aplicado a todos los miembros.
+    tol : float, default=1e-5
+        Tolerancia sobre la máxima diferencia entre iteraciones, por miembro.
+    max_iter : int, default=10000
+        Número máximo de iteraciones.
+    check_every : int, default=1
+        Frecuencia con la que se evalúa la convergencia.
+    omega : float or None, default=None
+        Factor de relajación para ``method="sor"`` (óptimo si es ``None``).
+    dtype : data-type, default=numpy.float64
+        Precisión de la pila de mallas.
+
+    Returns
+    -------
+    V : numpy.ndarray of shape (B, N, N)
+        Potenciales resultantes, en el orden de entrada.
+    infos : list of ConvergenceInfo
+        Información de convergencia de cada miembro.
+
+    Raises
+    ------
+    ValueError
+        Si ``method`` no es reconocido, ``check_every < 1`` o ``N`` no es un
+        entero.
+
+    Notes
+    -----
+    Los lotes solo admiten mallas cuadradas con paso común: las fronteras se
+    apilan en un único arreglo ``(B, 4, N)``. Las mallas rectangulares o
+    anisótropas se resuelven con :class:`LaplaceSolver2D` o
+    :func:`campo_estatico_mdf.sweep.run_sweep`.
+
+    Con ``method="jacobi"`` cada miembro produce exactamente el mismo resultado
+    que :func:`campo_estatico_mdf.jacobi.jacobi_solve` por separado.
+    """
+    if method not in ("jacobi", "sor"):
+        raise ValueError(f"Método por lotes desconocido: {method!r}.")
+    if check_every < 1:
+        raise ValueError("check_every debe ser >= 1.")
+
+    N = _square_size(N)
+    edges = stack_boundaries(N, boundaries)
+    V0, _ = allocate_potential(N, dtype=dtype)
+    out = np.repeat(V0[None], edges.shape[0], axis=0)
+    impose_dirichlet_batch(out, edges)
+    infos: list[ConvergenceInfo | None] = [None] * edges.shape[0]
+    if not infos:
+        return out, []
+
+    if method == "sor":
+        omega = optimal_omega(N) if omega is None else omega
+        if not 0.0 < omega < 2.0:
+            raise ValueError("omega debe estar en el intervalo (0, 2).")
+
+    active = np.arange(edges.shape[0])
+    A = out.copy()
+    B = A.copy() if method == "jacobi" else None
+    scratch = np.empty_like(A[:, 1:-1, 1:-1])
+
+    for k in range(1, max_iter + 1):
+        if method == "jacobi":
+            _jacobi_sweep(A, B)
+            A, B = B, A
+            check = k % check_every == 0 or k == max_iter
+            if check:
+                np.subtract(A[:, 1:-1, 1:-1], B[:, 1:-1, 1:-1], out=scratch)
+                np.abs(scratch, out=scratch)
+                diff = scratch.max(axis=(-2, -1))
+        else:
+            diff = _red_black_sweep(A, omega)
+            check = k % check_every == 0 or k == max_iter
+
+        if not check:
+            continue
+        done = (diff < tol) | (k == max_iter)
+        if not done.any():
+            continue
+
+        for i in np.flatnonzero(done):
+            out[active[i]] = A[i]
+            infos[active[i]] = ConvergenceInfo(k, float(diff[i]), float(tol))
+        keep = ~done
+        active = active[keep]
+        if active.size == 0:
+            break
+        A = A[keep]
+        if B is not None:
+            B = B[keep]
+            scratch = scratch[keep]
+
+    return out, infos
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import numpy as np
 
-def edge_to_array(N: int, val) -> np.ndarray:
+def edge_to_array(N: int, val, dtype=np.float64) -> np.ndarray:
     """
     Normaliza un valor escalar o un vector 1D para representar una condición
     de frontera en forma de un arreglo de longitud ``N``.
@@ -18,11 +18,13 @@ def edge_to_array(N: int, val) -> np.ndarray:
     val : float or array_like
         Puede ser un valor escalar (frontera uniforme) o un arreglo de longitud ``N``
         que especifique el potencial nodo por nodo.
+    dtype : data-type, default=numpy.float64
+        Tipo de punto flotante del resultado.
 
     Returns
     -------
     arr : numpy.ndarray of shape (N,)
-        Arreglo de valores de frontera convertido a tipo flotante.
+        Arreglo de valores de frontera convertido a ``dtype``.
 
     Raises
     ------
@@ -34,9 +36,9 @@ def edge_to_array(N: int, val) -> np.ndarray:
     Esta función facilita definir fronteras espacialmente uniformes o variables.
     """
     if np.isscalar(val):
-        return np.full(N, float(val))
+        return np.full(N, float(val), dtype=dtype)
 
-    arr = np.asarray(val, dtype=float)
+    arr = np.asarray(val, dtype=dtype)
     if arr.shape != (N,):
         raise ValueError("Cada frontera debe ser un escalar o un vector de longitud N.")
     return arr
@@ -55,22 +57,23 @@ def impose_dirichlet(V: np.ndarray, left, right, top, bottom) -> None:
 
     Parameters
     ----------
-    V : numpy.ndarray of shape (N, N)
+    V : numpy.ndarray of shape (Ny, Nx)
         Malla del potencial sobre la cual se aplican las condiciones de frontera.
     left, right, top, bottom : float or array_like
-        Valores o vectores que describen el potencial fijado en cada borde.
+        Valores o vectores que describen el potencial fijado en cada borde:
+        ``left`` y ``right`` de longitud ``Ny``, ``top`` y ``bottom`` de longitud ``Nx``.
 
     Notes
     -----
     Se usa :func:`edge_to_array` internamente para asegurar que cada condición
-    tenga longitud ``N``.  
+    tenga la longitud de su borde.  
     La modificación se realiza **en el mismo arreglo** para evitar copias innecesarias.
     """
-    N = V.shape[0]
+    Ny, Nx = V.shape
     from .bc import edge_to_array  # importación local para evitar dependencias circulares
 
-    V[:, 0]  = edge_to_array(N, left)
-    V[:, -1] = edge_to_array(N, right)
-    V[0, :]  = edge_to_array(N, top)
-    V[-1, :] = edge_to_array(N, bottom)
+    V[:, 0]  = edge_to_array(Ny, left, V.dtype)
+    V[:, -1] = edge_to_array(Ny, right, V.dtype)
+    V[0, :]  = edge_to_array(Nx, top, V.dtype)
+    V[-1, :] = edge_to_array(Nx, bottom, V.dtype)
 
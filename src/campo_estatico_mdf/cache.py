@@ -0,0 +1,191 @@
+# src/campo_estatico_mdf/cache.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import numpy as np
+from .grid import grid_shape, grid_spacing
+from .jacobi import ConvergenceInfo
+
+
+def solution_key(N: int, h: float, boundary, method: str, **params) -> str:
+    """
+    Calcula la clave de contenido de una solución.
+
+    La clave es el SHA-256 de ``N``, ``h``, el método, los parámetros del método
+    (por ejemplo ``tol``) y los bytes de los cuatro bordes normalizados. ``N`` y
+    ``h`` se normalizan a ``(Ny, Nx)`` y ``(hy, hx)``, de modo que ``N=21`` y
+    ``N=(21, 21)`` producen la misma clave.
+
+    Parameters
+    ----------
+    N : int or tuple of int
+        Tamaño de la malla (ver :func:`campo_estatico_mdf.grid.grid_shape`).
+    h : float or tuple of float
+        Paso espacial (ver :func:`campo_estatico_mdf.grid.grid_spacing`).
+    boundary : BoundarySpec
+        Fronteras normalizadas.
+    method : str
+        Nombre del método de solución.
+    **params
+        Parámetros adicionales que afectan al resultado.
+
+    Returns
+    -------
+    str
+        Resumen hexadecimal de 64 caracteres.
+    """
+    digest = hashlib.sha256()
+    header = {"N": list(grid_shape(N)), "h": list(grid_spacing(h)), "method": method,
+              "params": {k: params[k] for k in sorted(params)}}
+    digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+    for edge in (boundary.left, boundary.right, boundary.top, boundary.bottom):
+        digest.update(np.ascontiguousarray(edge, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedSolution:
+    """
+    Entrada de la caché de soluciones.
+
+    Attributes
+    ----------
+    V : numpy.ndarray
+        Potencial resuelto.
+    Ex, Ey : numpy.ndarray
+        Componentes del campo eléctrico.
+    info : ConvergenceInfo
+        Información de convergencia de la solución original.
+    """
+    V: np.ndarray
+    Ex: np.ndarray
+    Ey: np.ndarray
+    info: ConvergenceInfo
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arreglos de la entrada."""
+        return self.V.nbytes + self.Ex.nbytes + self.Ey.nbytes
+
+
+def _freeze(entry: CachedSolution) -> None:
+    """Marca los arreglos de ``entry`` como de solo lectura."""
+    for arr in (entry.V, entry.Ex, entry.Ey):
+        arr.flags.writeable = False
+
+
+class SolutionCache:
+    """
+    Caché de soluciones direccionada por contenido con desalojo LRU por bytes.
+
+    Las entradas se guardan en memoria hasta ``max_bytes``; al superarse se
+    desalojan las menos usadas recientemente. Si se indica ``directory``, cada
+    entrada también se persiste como ``<clave>.npz`` y los aciertos sobreviven
+    a reinicios del proceso.
+
+    Parameters
+    ----------
+    max_bytes : int, default=256 MiB
+        Presupuesto de memoria para las entradas en memoria.
+    directory : str or os.PathLike or None, default=None
+        Directorio de persistencia opcional (se crea si no existe).
+
+    Notes
+    -----
+    Los arreglos almacenados se marcan como de solo lectura; quien los use para
+    continuar cálculos debe copiarlos.
+
+    La caché puede compartirse entre hilos: un candado protege el índice LRU y
+    el contador de bytes, mientras que la lectura y escritura de archivos se
+    hace fuera de él.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20, directory=None):
+        self.max_bytes = int(max_bytes)
+        self.directory = None if directory is None else os.fspath(directory)
+        self._entries: OrderedDict[str, CachedSolution] = OrderedDict()
+        self.nbytes = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return (
+            self.directory is not None and os.path.exists(self._path(key))
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key: str) -> CachedSolution | None:
+        """
+        Busca una entrada en memoria y, si no está, en el directorio de
+        persistencia.
+
+        Returns
+        -------
+        CachedSolution or None
+            La entrada, o ``None`` si no existe.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+
+        with np.load(self._path(key)) as data:
+            info = ConvergenceInfo(**json.loads(str(data["info"])))
+            entry = CachedSolution(data["V"], data["Ex"], data["Ey"], info)
+        _freeze(entry)
+        with self._lock:
+            self._store(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedSolution) -> None:
+        """Guarda ``entry`` bajo ``key`` en memoria y, si aplica, en disco."""
+        _freeze(entry)
+        if self.directory is not None:
+            # Un temporal por hilo: escrituras concurrentes de la misma clave
+            # no se pisan y ``os.replace`` es atómico.
+            tmp = f"{self._path(key)}.{threading.get_ident()}.tmp.npz"
+            np.savez(tmp, V=entry.V, Ex=entry.Ex, Ey=entry.Ey,
+                     info=np.array(json.dumps(asdict(entry.info))))
+            os.replace(tmp, self._path(key))
+        with self._lock:
+            self._store(key, entry)
+
+    def _store(self, key: str, entry: CachedSolution) -> None:
+        """
+        Inserta en memoria y desaloja por LRU hasta cumplir el presupuesto.
+
+        Debe llamarse con el candado tomado.
+        """
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.nbytes += entry.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Vacía la caché en memoria (los archivos persistidos se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
@@ -0,0 +1,216 @@
+# src/campo_estatico_mdf/cli.py
+"""
+Ejecución por lotes sin interfaz gráfica.
+
+Lee un archivo de trabajos y resuelve cada uno, escribiendo el potencial y su
+:class:`ConvergenceInfo` a disco a medida que termina::
+
+    campo-mdf trabajos.jsonl --out resultados/
+    campo-mdf trabajos.csv --out resultados/ --format solver --field
+    cat trabajos.jsonl | campo-mdf - --out resultados/ --png
+
+Cada trabajo es una línea JSON o una fila CSV (con encabezado) con las claves
+``N`` (obligatoria), ``h``, ``left``, ``right``, ``top``, ``bottom``,
+``method``, ``tol`` y ``id``; el resto de claves se pasan al método. En JSON
+las fronteras pueden ser listas de longitud ``N``, y ``N`` y ``h`` pueden ser
+parejas ``[Ny, Nx]`` y ``[hy, hx]`` para mallas rectangulares. El ``id`` da
+nombre a los archivos de salida, por lo que no puede contener separadores de
+ruta ni ``..``.
+
+Por cada trabajo se añade una línea a ``results.jsonl`` (y a la salida
+estándar salvo con ``--quiet``) con el ``id``, el archivo escrito y la
+información de convergencia, o el mensaje de error. matplotlib solo se importa
+con ``--png``.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from itertools import chain
+from typing import Iterator
+import numpy as np
+from .solver import LaplaceSolver2D
+
+#: Claves de un trabajo que no son argumentos del método.
+JOB_KEYS = ("id", "N", "h", "left", "right", "top", "bottom", "method")
+
+
+def _number(text: str):
+    """Convierte un campo CSV en ``int`` o ``float`` si es posible."""
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def read_jobs(stream) -> Iterator[dict]:
+    """
+    Lee trabajos de ``stream`` de forma perezosa.
+
+    El formato se deduce de la primera línea no vacía: si empieza por ``{`` es
+    JSON por líneas; en caso contrario, CSV con encabezado. Las líneas vacías
+    y las que empiezan por ``#`` se ignoran.
+
+    Yields
+    ------
+    dict
+        Un trabajo por línea; ``id`` toma por defecto el número de trabajo.
+    """
+    lines = (line for line in stream if line.strip() and not line.lstrip().startswith("#"))
+    first = next(lines, None)
+    if first is None:
+        return
+    if first.lstrip().startswith("{"):
+        rows = map(json.loads, chain([first], lines))
+    else:
+        reader = csv.DictReader(chain([first], lines))
+        rows = ({k.strip(): _number(v.strip()) for k, v in row.items() if v not in (None, "")}
+                for row in reader)
+    for i, job in enumerate(rows):
+        job.setdefault("id", i)
+        yield job
+
+
+def job_solver(job: dict) -> tuple[LaplaceSolver2D, str, dict]:
+    """
+    Construye el solver de un trabajo.
+
+    Returns
+    -------
+    solver : LaplaceSolver2D
+        Solver con la malla, el paso y las fronteras del trabajo.
+    method : str
+        Método pedido (``"jacobi"`` por defecto).
+    params : dict
+        Argumentos restantes para :meth:`LaplaceSolver2D.solve`.
+
+    Raises
+    ------
+    KeyError
+        Si falta ``N``.
+    ValueError
+        Si las fronteras no son compatibles con ``N``.
+    """
+    solver = LaplaceSolver2D(
+        job["N"],
+        left=job.get("left", 0.0), right=job.get("right", 0.0),
+        top=job.get("top", 0.0), bottom=job.get("bottom", 0.0),
+        h=job.get("h", 1.0),
+    )
+    params = {k: v for k, v in job.items() if k not in JOB_KEYS}
+    return solver, job.get("method", "jacobi"), params
+
+
+def _output_name(job_id) -> str:
+    """
+    Valida que el ``id`` de un trabajo sea un nombre de archivo simple dentro
+    del directorio de salida.
+
+    Raises
+    ------
+    ValueError
+        Si el ``id`` está vacío, contiene separadores de ruta o ``..``.
+    """
+    name = str(job_id)
+    # "/" y "\\" cubren os.sep y os.altsep en POSIX y en Windows.
+    if not name.strip() or ".." in name or "/" in name or "\\" in name:
+        raise ValueError(f"id de trabajo no válido como nombre de archivo: {name!r}.")
+    return name
+
+
+def run_job(job: dict, out_dir: str, fmt: str = "npy", field: bool = False, png: bool = False) -> dict:
+    """
+    Resuelve un trabajo y escribe su resultado en ``out_dir``.
+
+    Parameters
+    ----------
+    job : dict
+        Trabajo leído por :func:`read_jobs`.
+    out_dir : str
+        Directorio de salida.
+    fmt : {"npy", "solver", "none"}, default="npy"
+        ``"npy"`` guarda ``V`` en ``<id>.npy``; ``"solver"`` guarda el
+        directorio completo de :meth:`LaplaceSolver2D.save` en ``<id>/``;
+        ``"none"`` solo registra la convergencia.
+    field : bool, default=False
+        Con ``fmt="solver"``, guarda también el campo eléctrico.
+    png : bool, default=False
+        Escribe ``<id>_V.png`` y ``<id>_E.png`` (importa matplotlib).
+
+    Returns
+    -------
+    dict
+        Registro del trabajo para ``results.jsonl``.
+
+    Raises
+    ------
+    ValueError
+        Si el ``id`` no es un nombre de archivo simple (por ejemplo ``"../x"``
+        o ``"/tmp/x"``), para no escribir fuera de ``out_dir``.
+    """
+    name = _output_name(job["id"])
+    t0 = time.perf_counter()
+    solver, method, params = job_solver(job)
+    info = solver.solve(method, **params)
+    record = {"id": job["id"], "N": solver.N, "method": method, "info": asdict(info),
+              "seconds": time.perf_counter() - t0}
+
+    if fmt == "npy":
+        record["output"] = f"{name}.npy"
+        np.save(os.path.join(out_dir, record["output"]), solver.V)
+    elif fmt == "solver":
+        record["output"] = name
+        solver.save(os.path.join(out_dir, name), field=field)
+    if png:
+        from .visual import plot_field, plot_potential, to_png  # importa matplotlib
+
+        for suffix, fig in (("V", plot_potential(solver.V, max_pixels=800, h=solver.h)),
+                            ("E", plot_field(solver.V, solver.h, stride=None, field=solver.field,
+                                             max_pixels=800))):
+            with open(os.path.join(out_dir, f"{name}_{suffix}.png"), "wb") as f:
+                f.write(to_png(fig))
+    return record
+
+
+def main(argv=None) -> int:
+    """Punto de entrada de ``campo-mdf``; devuelve 1 si algún trabajo falló."""
+    parser = argparse.ArgumentParser(prog="campo-mdf", description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("jobs", help="archivo de trabajos (JSON por líneas o CSV); '-' lee la entrada estándar")
+    parser.add_argument("--out", default=".", help="directorio de salida (por defecto, el actual)")
+    parser.add_argument("--format", dest="fmt", choices=["npy", "solver", "none"], default="npy",
+                        help="cómo guardar cada solución")
+    parser.add_argument("--field", action="store_true", help="con --format solver, guarda también E")
+    parser.add_argument("--png", action="store_true", help="escribe figuras PNG (importa matplotlib)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="no repite los resultados en la salida estándar")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    failed = False
+    source = sys.stdin if args.jobs == "-" else open(args.jobs, encoding="utf-8", newline="")
+    try:
+        with open(os.path.join(args.out, "results.jsonl"), "a", encoding="utf-8") as results:
+            for job in read_jobs(source):
+                try:
+                    record = run_job(job, args.out, args.fmt, args.field, args.png)
+                except Exception as exc:  # un trabajo inválido no detiene el lote
+                    failed = True
+                    record = {"id": job.get("id"), "error": f"{type(exc).__name__}: {exc}"}
+                line = json.dumps(record)
+                results.write(line + "\n")
+                results.flush()
+                if not args.quiet:
+                    print(line, flush=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
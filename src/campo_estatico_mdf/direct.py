@@ -0,0 +1,176 @@
+# src/campo_estatico_mdf/direct.py
+from __future__ import annotations
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from .bc import impose_dirichlet
+from .jacobi import ConvergenceInfo
+from .multigrid import residual
+
+# Factorizaciones LU por geometría: (forma, resumen de la máscara, aspect) → (libres, LU).
+_FACTORS: OrderedDict = OrderedDict()
+_MAX_FACTORS = 8
+
+_SHIFTS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def _neighbor(a: np.ndarray, di: int, dj: int) -> np.ndarray:
+    """Vista del vecino ``(i + di, j + dj)`` de cada nodo interior de ``a``."""
+    n_rows, n_cols = a.shape
+    return a[1 + di:n_rows - 1 + di, 1 + dj:n_cols - 1 + dj]
+
+
+def _free_nodes(shape, mask) -> np.ndarray:
+    """Nodos incógnita: interiores y sin potencial fijo."""
+    free = np.zeros(shape, dtype=bool)
+    free[1:-1, 1:-1] = True
+    if mask is not None:
+        free &= ~mask
+    return free
+
+
+def _geometry_key(shape, mask, aspect: float = 1.0) -> tuple:
+    digest = None if mask is None else hashlib.sha1(np.packbits(mask).tobytes()).hexdigest()
+    return tuple(shape), digest, float(aspect)
+
+
+def _weights(aspect: float) -> tuple[float, ...]:
+    """Pesos de los vecinos en el orden de ``_SHIFTS``: este, oeste, sur, norte."""
+    return aspect, aspect, 1.0, 1.0
+
+
+def _factorize(shape, mask, aspect: float = 1.0):
+    """Ensambla el operador de cinco puntos sobre los nodos libres y lo factoriza."""
+    try:
+        from scipy.sparse import csc_matrix
+        from scipy.sparse.linalg import splu
+    except ImportError as exc:  # pragma: no cover - depende del entorno
+        raise ImportError(
+            "El solver directo requiere SciPy: pip install 'campo-estatico-mdf-Cogua-Neira[direct]'."
+        ) from exc
+
+    free = _free_nodes(shape, mask)
+    n = int(free.sum())
+    idx = np.full(shape, -1, dtype=np.int64)
+    idx[free] = np.arange(n)
+
+    inner_idx = idx[1:-1, 1:-1]
+    inner_free = free[1:-1, 1:-1]
+    rows, cols = [np.arange(n)], [np.arange(n)]
+    vals = [np.full(n, 2.0 + 2.0 * aspect)]
+    for (di, dj), w in zip(_SHIFTS, _weights(aspect)):
+        nb = _neighbor(idx, di, dj)
+        link = inner_free & (nb >= 0)
+        rows.append(inner_idx[link])
+        cols.append(nb[link])
+        vals.append(np.full(int(link.sum()), -w))
+
+    A = csc_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+    )
+    return free, splu(A)
+
+
+def get_factorization(shape, mask=None, aspect: float = 1.0):
+    """
+    Devuelve la factorización LU del operador enmascarado para una geometría,
+    calculándola solo la primera vez.
+
+    Se guardan hasta 8 geometrías con desalojo LRU.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Forma de la malla.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo.
+    aspect : float, default=1.0
+        :math:`(h_y / h_x)^2` (ver :func:`campo_estatico_mdf.grid.aspect_ratio`).
+
+    Returns
+    -------
+    free : numpy.ndarray of bool
+        Nodos incógnita.
+    lu : scipy.sparse.linalg.SuperLU
+        Factorización del sistema sobre los nodos libres.
+    """
+    key = _geometry_key(shape, mask, aspect)
+    if key in _FACTORS:
+        _FACTORS.move_to_end(key)
+    else:
+        _FACTORS[key] = _factorize(shape, mask, aspect)
+        if len(_FACTORS) > _MAX_FACTORS:
+            _FACTORS.popitem(last=False)
+    return _FACTORS[key]
+
+
+def clear_factorizations() -> None:
+    """Vacía la caché de factorizaciones."""
+    _FACTORS.clear()
+
+
+def direct_solve(
+    V0: np.ndarray,
+    left, right, top, bottom,
+    rhs=None,
+    mask=None,
+    aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Resuelve la ecuación de Poisson con electrodos interiores mediante una
+    factorización LU dispersa reutilizable.
+
+    Los nodos libres (interiores sin ``mask``) forman el sistema :math:`A u = b`;
+    los bordes y los electrodos son valores conocidos que pasan a :math:`b`. La
+    factorización depende solo de la geometría (forma y ``mask``) y se guarda en
+    caché, de modo que nuevas tensiones de electrodos, fronteras o fuentes solo
+    requieren una sustitución hacia adelante y hacia atrás.
+
+    Parameters
+    ----------
+    V0 : numpy.ndarray of shape (Ny, Nx)
+        Potencial inicial; aporta el valor de los electrodos en ``mask``.
+    left, right, top, bottom : float or array_like
+        Valores de frontera de Dirichlet.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 \\rho / \\varepsilon`.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo.
+    aspect : float, default=1.0
+        :math:`(h_y / h_x)^2` para pasos distintos en ``x`` y ``y``.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Solución del sistema discreto.
+    info : ConvergenceInfo
+        ``iterations = 0``; ``max_diff`` y ``residuals[0]`` contienen el residuo
+        alcanzado en los nodos libres.
+
+    Raises
+    ------
+    ImportError
+        Si SciPy no está instalado.
+
+    Notes
+    -----
+    El operador enmascarado es simétrico definido positivo; se usa ``splu`` de
+    SciPy porque no incluye una factorización de Cholesky dispersa.
+    """
+    V = V0.copy()
+    impose_dirichlet(V, left, right, top, bottom)
+    free, lu = get_factorization(V.shape, mask, aspect)
+
+    b = np.zeros(V[1:-1, 1:-1].shape)
+    if rhs is not None:
+        b += rhs[1:-1, 1:-1]
+    for (di, dj), w in zip(_SHIFTS, _weights(aspect)):
+        known = ~_neighbor(free, di, dj)
+        b += np.where(known, w * _neighbor(V, di, dj), 0.0)
+    inner_free = free[1:-1, 1:-1]
+    if inner_free.any():
+        V[free] = lu.solve(b[inner_free])
+
+    r = residual(V, rhs, aspect)
+    res = float(np.abs(r[free]).max()) if inner_free.any() else 0.0
+    return V, ConvergenceInfo(0, res, 0.0, [res])
@@ -0,0 +1,145 @@
+# src/campo_estatico_mdf/dst.py
+from __future__ import annotations
+import numpy as np
+from .bc import impose_dirichlet
+from .jacobi import ConvergenceInfo
+from .multigrid import residual
+
+
+def dst1(x: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    Transformada seno discreta de tipo I a lo largo de ``axis``.
+
+    .. math::
+
+        X_k = \\sum_{j=1}^{n} x_j \\sin\\left(\\frac{\\pi j k}{n + 1}\\right),
+        \\qquad k = 1, \\dots, n.
+
+    Se calcula con una FFT real de la extensión impar de longitud ``2(n + 1)``,
+    por lo que su costo es :math:`O(n \\log n)`. La transformada es su propia
+    inversa salvo el factor :math:`2 / (n + 1)`.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Datos de entrada.
+    axis : int, default=-1
+        Eje sobre el que se aplica la transformada.
+
+    Returns
+    -------
+    numpy.ndarray
+        Arreglo transformado, misma forma que ``x``.
+    """
+    x = np.moveaxis(np.asarray(x), axis, -1)
+    n = x.shape[-1]
+    y = np.zeros(x.shape[:-1] + (2 * (n + 1),), dtype=np.result_type(x, np.float64))
+    y[..., 1:n + 1] = x
+    y[..., n + 2:] = -x[..., ::-1]
+    X = -0.5 * np.fft.rfft(y, axis=-1)[..., 1:n + 1].imag
+    return np.moveaxis(X, -1, axis)
+
+
+def lifted_rhs(V: np.ndarray, rhs=None, dtype=np.float64, aspect: float = 1.0) -> np.ndarray:
+    """
+    Lado derecho del sistema de nodos interiores :math:`A u = b`.
+
+    Los valores de Dirichlet de los bordes de ``V`` se trasladan a ``b`` en los
+    nodos adyacentes a cada borde, y se suma el término fuente escalado.
+
+    Parameters
+    ----------
+    V : numpy.ndarray of shape (..., Ny, Nx)
+        Malla con las fronteras impuestas.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f`, misma forma que ``V``.
+    dtype : data-type, default=numpy.float64
+        Tipo del resultado.
+    aspect : float, default=1.0
+        Peso :math:`(h_y / h_x)^2` de los bordes izquierdo y derecho (ver
+        :func:`campo_estatico_mdf.grid.aspect_ratio`).
+
+    Returns
+    -------
+    numpy.ndarray of shape (..., Ny - 2, Nx - 2)
+        Vector :math:`b` en forma de malla interior.
+    """
+    b = np.zeros(V[..., 1:-1, 1:-1].shape, dtype=dtype)
+    if rhs is not None:
+        b += rhs[..., 1:-1, 1:-1]
+    b[..., :, 0] += aspect * V[..., 1:-1, 0]
+    b[..., :, -1] += aspect * V[..., 1:-1, -1]
+    b[..., 0, :] += V[..., 0, 1:-1]
+    b[..., -1, :] += V[..., -1, 1:-1]
+    return b
+
+
+def _eigenvalues(n: int) -> np.ndarray:
+    """Autovalores de la matriz tridiagonal ``(-1, 2, -1)`` de orden ``n``."""
+    k = np.arange(1, n + 1)
+    return 2.0 - 2.0 * np.cos(np.pi * k / (n + 1))
+
+
+def dst_solve(
+    V0: np.ndarray,
+    left, right, top, bottom,
+    rhs=None,
+    aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Resuelve directamente la ecuación de Laplace (o Poisson) con transformadas
+    seno, sin iteraciones.
+
+    Las fronteras de Dirichlet se trasladan al lado derecho del sistema de los
+    nodos interiores, :math:`A u = b`, con :math:`A = T \\otimes I + I \\otimes T`
+    y :math:`T = \\mathrm{tridiag}(-1, 2, -1)`. La DST-I diagonaliza :math:`T`,
+    de modo que
+
+    .. math::
+
+        u = S \\left[ \\frac{(S\\, b\\, S)_{kl}}{\\lambda_k + \\lambda_l} \\right] S
+            \\cdot \\frac{4}{(n_y + 1)(n_x + 1)},
+        \\qquad \\lambda_k = 2 - 2\\cos\\frac{\\pi k}{n + 1}.
+
+    Con pasos distintos, :math:`A = T_y \\otimes I + a\\, I \\otimes T_x` y el
+    denominador es :math:`\\lambda_k + a \\lambda_l`, con :math:`a = (h_y/h_x)^2`.
+
+    Parameters
+    ----------
+    V0 : numpy.ndarray of shape (Ny, Nx)
+        Malla del potencial; solo se usa su forma y tipo.
+    left, right, top, bottom : float or array_like
+        Valores de frontera de Dirichlet.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f` para :math:`-\\nabla^2 V = f`.
+    aspect : float, default=1.0
+        :math:`(h_y / h_x)^2` (ver :func:`campo_estatico_mdf.grid.aspect_ratio`).
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Solución exacta del sistema discreto (salvo redondeo).
+    info : ConvergenceInfo
+        ``iterations = 0``; ``max_diff`` y ``residuals[0]`` contienen la norma
+        infinito del residuo alcanzado y ``tol = 0``.
+
+    Notes
+    -----
+    El costo es :math:`O(N^2 \\log N)` y el resultado no depende de ninguna
+    tolerancia, por lo que sirve como referencia para validar los métodos
+    iterativos.
+    """
+    V = V0.copy()
+    impose_dirichlet(V, left, right, top, bottom)
+
+    b = lifted_rhs(V, rhs, aspect=aspect)
+    ny, nx = b.shape[-2:]
+    if ny and nx:
+        bh = dst1(dst1(b, axis=-1), axis=-2)
+        bh /= _eigenvalues(ny)[:, None] + aspect * _eigenvalues(nx)[None, :]
+        u = dst1(dst1(bh, axis=-1), axis=-2)
+        u *= 4.0 / ((ny + 1) * (nx + 1))
+        V[..., 1:-1, 1:-1] = u
+
+    res = float(np.abs(residual(V, rhs, aspect)).max())
+    return V, ConvergenceInfo(0, res, 0.0, [res])
@@ -1,8 +1,9 @@
 # src/campo_estatico_mdf/field.py
 from __future__ import annotations
+from dataclasses import dataclass
 import numpy as np
 
-def electric_field(V, h: float = 1.0):
+def electric_field(V, h=1.0, dtype=None):
     """
     Calcula el campo eléctrico :math:`\\mathbf{E} = -\\nabla V` en una malla cartesiana uniforme.
 
@@ -16,15 +17,20 @@ def electric_field(V, h: float = 1.0):
         \\frac{\\partial V}{\\partial y} \\right),
 
     se devuelve la pareja de matrices ``(Ex, Ey)`` con las componentes en las
-    direcciones ``x`` y ``y``, respectivamente.
+    direcciones ``x`` y ``y``, respectivamente. Para un potencial 3D con el
+    convenio ``V[z, y, x]`` se devuelve ``(Ex, Ey, Ez)``.
 
     Parameters
     ----------
-    V : numpy.ndarray of shape (N, N)
+    V : numpy.ndarray of shape (Ny, Nx) or (N, N, N)
         Matriz del potencial eléctrico evaluado en los nodos de la malla.
-        Se asume el convenio de indexación ``V[y, x]``.
-    h : float, default=1.0
-        Separación uniforme entre puntos de la malla (``Δx = Δy = h``).
+        Se asume el convenio de indexación ``V[y, x]`` (``V[z, y, x]`` en 3D).
+    h : float or tuple of float, default=1.0
+        Separación uniforme entre puntos de la malla (``Δx = Δy = h``), o un
+        paso por eje en el orden de ``V``: ``(hy, hx)`` en 2D.
+    dtype : data-type or None, default=None
+        Tipo de punto flotante del resultado. Si es ``None`` se conserva el de
+        ``V`` (``float32`` produce un campo ``float32``).
 
     Returns
     -------
@@ -32,6 +38,8 @@ def electric_field(V, h: float = 1.0):
         Componente del campo eléctrico en la dirección ``x``, misma forma que ``V``.
     Ey : numpy.ndarray
         Componente del campo eléctrico en la dirección ``y``, misma forma que ``V``.
+    Ez : numpy.ndarray
+        Solo si ``V`` es 3D: componente en la dirección ``z``.
 
     Notes
     -----
@@ -39,5 +47,93 @@ def electric_field(V, h: float = 1.0):
     Se aplica el signo negativo al gradiente para obtener el campo eléctrico de acuerdo
     con la convención electrostática estándar.
     """
-    gy, gx = np.gradient(V, h, h, edge_order=2)  # dV/dy, dV/dx
-    return -gx, -gy
+    V = np.asarray(V, dtype=dtype)
+    spacing = (h,) if np.isscalar(h) else tuple(h)
+    grads = np.gradient(V, *spacing, edge_order=2)  # (dV/dz,) dV/dy, dV/dx
+    return tuple(np.negative(g, out=g) for g in reversed(grads))
+
+
+@dataclass
+class FieldQuantities:
+    """
+    Magnitudes derivadas del campo eléctrico.
+
+    Attributes
+    ----------
+    magnitude : numpy.ndarray
+        Módulo :math:`|\\mathbf{E}|` en cada nodo.
+    energy_density : numpy.ndarray
+        Densidad de energía :math:`u = \\tfrac{\\varepsilon}{2} |\\mathbf{E}|^2`.
+    energy : float
+        Energía total :math:`\\int u \\, dA` (regla del trapecio), por unidad de
+        longitud en :math:`z`.
+    edge_charge : dict of str to float
+        Carga en cada borde (``"left"``, ``"right"``, ``"top"``, ``"bottom"``)
+        según la ley de Gauss, :math:`Q = \\varepsilon \\int \\mathbf{E} \\cdot
+        \\hat{n} \\, dl` con :math:`\\hat{n}` apuntando hacia el interior.
+    """
+    magnitude: np.ndarray
+    energy_density: np.ndarray
+    energy: float
+    edge_charge: dict
+
+
+def _trapezoid_weights(n: int) -> np.ndarray:
+    w = np.ones(n)
+    w[0] = w[-1] = 0.5
+    return w
+
+
+def field_quantities(Ex, Ey, h=1.0, eps: float = 1.0, block_rows: int = 64) -> FieldQuantities:
+    """
+    Calcula :math:`|\\mathbf{E}|`, la densidad de energía, la energía total y la
+    carga de cada borde en una sola pasada.
+
+    La malla se recorre por bloques de ``block_rows`` filas: para cada bloque se
+    calculan :math:`E_x^2 + E_y^2`, su raíz, la densidad de energía y su
+    contribución a la integral mientras los datos siguen en caché, escribiendo
+    en dos búferes de salida sin otros temporales de tamaño completo.
+
+    Parameters
+    ----------
+    Ex, Ey : numpy.ndarray of shape (Ny, Nx)
+        Componentes del campo (ver :func:`electric_field`).
+    h : float or tuple of float, default=1.0
+        Paso de la malla, o ``(hy, hx)``.
+    eps : float, default=1.0
+        Permitividad del medio.
+    block_rows : int, default=64
+        Filas por bloque.
+
+    Returns
+    -------
+    FieldQuantities
+        Magnitudes derivadas.
+    """
+    Ex, Ey = np.asarray(Ex), np.asarray(Ey)
+    hy, hx = (h, h) if np.isscalar(h) else h
+    n_rows, n_cols = Ex.shape
+    magnitude = np.empty_like(Ex)
+    energy_density = np.empty_like(Ex)
+    wy, wx = _trapezoid_weights(n_rows), _trapezoid_weights(n_cols)
+    half_eps = 0.5 * eps
+
+    block = max(1, int(block_rows))
+    energy = 0.0
+    for r0 in range(0, n_rows, block):
+        rows = slice(r0, r0 + block)
+        m, u = magnitude[rows], energy_density[rows]
+        np.multiply(Ex[rows], Ex[rows], out=u)
+        np.multiply(Ey[rows], Ey[rows], out=m)
+        u += m
+        np.sqrt(u, out=m)
+        u *= half_eps
+        energy += float(wy[rows] @ (u @ wx))
+
+    edge_charge = {
+        "left": eps * hy * float(wy @ Ex[:, 0]),
+        "right": -eps * hy * float(wy @ Ex[:, -1]),
+        "top": eps * hx * float(wx @ Ey[0, :]),
+        "bottom": -eps * hx * float(wx @ Ey[-1, :]),
+    }
+    return FieldQuantities(magnitude, energy_density, energy * hx * hy, edge_charge)
@@ -1,14 +1,80 @@
 # src/campo_estatico_mdf/grid.py
 from __future__ import annotations
+import os
 import numpy as np
 
-def allocate_potential(N: int, h: float = 1.0) -> tuple[np.ndarray, float]:
+
+def grid_shape(N) -> tuple[int, int]:
+    """
+    Normaliza el tamaño de la malla a la forma ``(Ny, Nx)``.
+
+    Parameters
+    ----------
+    N : int or tuple of int
+        ``N`` para una malla cuadrada ``N × N`` o ``(Ny, Nx)`` (filas,
+        columnas) para una rectangular, con el convenio ``V[y, x]``.
+
+    Raises
+    ------
+    ValueError
+        Si alguna dimensión es menor que 3.
+    """
+    Ny, Nx = (N, N) if np.isscalar(N) else N
+    Ny, Nx = int(Ny), int(Nx)
+    if Ny < 3 or Nx < 3:
+        raise ValueError("N debe ser >= 3 para que exista un interior válido.")
+    return Ny, Nx
+
+
+def grid_spacing(h) -> tuple[float, float]:
+    """
+    Normaliza el paso espacial a la pareja ``(hy, hx)``.
+
+    Parameters
+    ----------
+    h : float or tuple of float
+        Paso común ``Δx = Δy = h`` o ``(hy, hx)``.
+
+    Raises
+    ------
+    ValueError
+        Si algún paso no es positivo.
+    """
+    hy, hx = (h, h) if np.isscalar(h) else h
+    hy, hx = float(hy), float(hx)
+    if hy <= 0 or hx <= 0:
+        raise ValueError("h debe ser positivo.")
+    return hy, hx
+
+
+def aspect_ratio(h) -> float:
+    """
+    Peso relativo :math:`(h_y / h_x)^2` de los vecinos en ``x`` del esquema de
+    cinco puntos anisótropo; vale 1 con paso común.
+
+    Multiplicando :math:`-\\nabla^2 V = f` por :math:`h_y^2`, cada nodo interior
+    cumple
+
+    .. math::
+
+        V_{i,j} = \\frac{a (V_{i,j+1} + V_{i,j-1}) + V_{i+1,j} + V_{i-1,j} + h_y^2 f_{i,j}}{2 (1 + a)},
+        \\qquad a = (h_y / h_x)^2,
+
+    que con :math:`a = 1` es el promedio de cuatro vecinos habitual.
     """
-    Crea y asigna una malla cuadrada para el potencial eléctrico.
+    hy, hx = grid_spacing(h)
+    return (hy / hx) ** 2
+
 
-    Esta función construye una matriz ``V`` de tamaño ``(N, N)`` que representa
-    la discretización uniforme de una región cuadrada en 2D, con un paso espacial
-    ``h`` en las direcciones ``x`` y ``y``.  
+def allocate_potential(
+    N, h=1.0, dtype=np.float64, path=None
+) -> tuple[np.ndarray, float | tuple[float, float]]:
+    """
+    Crea y asigna una malla rectangular para el potencial eléctrico.
+
+    Esta función construye una matriz ``V`` de tamaño ``(N, N)`` (o ``(Ny, Nx)``)
+    que representa la discretización uniforme de una región rectangular en 2D,
+    con un paso espacial ``h`` en las direcciones ``x`` y ``y`` (o ``hx`` y ``hy``).  
     La malla se usa típicamente con el esquema de diferencias finitas de cinco puntos
     para resolver la ecuación de Laplace:
 
@@ -20,26 +86,40 @@ def allocate_potential(N: int, h: float = 1.0) -> tuple[np.ndarray, float]:
 
     Parameters
     ----------
-    N : int
-        Número de puntos por dimensión en la malla.  
-        Debe ser ``>= 3`` para garantizar que exista al menos un nodo interior.
-    h : float, default=1.0
-        Paso espacial en ambas direcciones (``Δx = Δy = h``).
+    N : int or tuple of int
+        Número de puntos por dimensión en la malla, o ``(Ny, Nx)`` para una
+        malla rectangular (ver :func:`grid_shape`).  
+        Cada dimensión debe ser ``>= 3`` para garantizar que exista al menos un nodo interior.
+    h : float or tuple of float, default=1.0
+        Paso espacial en ambas direcciones (``Δx = Δy = h``), o ``(hy, hx)``.
+    dtype : data-type, default=numpy.float64
+        Tipo de punto flotante de la malla. ``numpy.float32`` reduce a la mitad
+        la memoria y el ancho de banda de cada barrido.
+    path : str or os.PathLike or None, default=None
+        Si se indica, ``V`` se crea como archivo ``.npy`` mapeado en memoria
+        (:func:`numpy.lib.format.open_memmap`) en lugar de en RAM, de modo que
+        la malla puede superar la memoria disponible y reabrirse sin copia.
 
     Returns
     -------
-    V : numpy.ndarray of shape (N, N)
+    V : numpy.ndarray or numpy.memmap of shape (N, N) or (Ny, Nx)
         Matriz del potencial inicializada en ceros.  
         Las condiciones de frontera deben aplicarse mediante
         :func:`campo_estatico_mdf.bc.impose_dirichlet`.
-    h : float
-        Valor del paso espacial, útil para gradientes y cálculo del campo eléctrico.
+    h : float or tuple of float
+        Valor del paso espacial, útil para gradientes y cálculo del campo eléctrico:
+        un ``float`` si ``hx == hy`` y ``(hy, hx)`` en caso contrario.
 
     See Also
     --------
     campo_estatico_mdf.bc.impose_dirichlet :
         Función para imponer condiciones de contorno de Dirichlet.
     """
-    if N < 3:
-        raise ValueError("N debe ser >= 3 para que exista un interior válido.")
-    return np.zeros((int(N), int(N)), dtype=float), float(h)
+    shape = grid_shape(N)
+    hy, hx = grid_spacing(h)
+    h = hy if hy == hx else (hy, hx)
+    if path is not None:
+        # El archivo nuevo se rellena con ceros de forma perezosa (disperso).
+        V = np.lib.format.open_memmap(os.fspath(path), mode="w+", dtype=dtype, shape=shape)
+        return V, h
+    return np.zeros(shape, dtype=dtype), h
@@ -0,0 +1,271 @@
+# src/campo_estatico_mdf/instrument.py
+from __future__ import annotations
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+
+# Funciones suscritas a todas las soluciones (ver :func:`subscribe`).
+_SUBSCRIBERS: list[Callable[["Event"], None]] = []
+
+
+@dataclass
+class Event:
+    """
+    Evento emitido durante una solución instrumentada.
+
+    Attributes
+    ----------
+    kind : {"start", "iteration", "end"}
+        Tipo de evento.
+    method : str
+        Método de solución.
+    iteration : int
+        Iteración actual (``0`` en ``"start"``).
+    max_diff : float
+        Última máxima actualización evaluada (``nan`` si aún no hay).
+    elapsed : float
+        Segundos desde el inicio de la solución.
+    V : numpy.ndarray or None
+        Potencial actual en los eventos ``"iteration"``; no debe modificarse.
+    info : ConvergenceInfo or None
+        Resultado final en el evento ``"end"``.
+    """
+    kind: str
+    method: str
+    iteration: int = 0
+    max_diff: float = float("nan")
+    elapsed: float = 0.0
+    V: np.ndarray | None = None
+    info: object = None
+
+
+def subscribe(callback: Callable[[Event], None]) -> Callable[[], None]:
+    """
+    Suscribe ``callback`` a los eventos de todas las soluciones.
+
+    Mientras haya suscriptores, :func:`campo_estatico_mdf.jacobi.jacobi_solve`,
+    :func:`campo_estatico_mdf.sor.sor_solve` y
+    :meth:`LaplaceSolver2D.solve` se instrumentan automáticamente, de modo que
+    un perfilador o exportador de métricas no necesita modificar los kernels.
+
+    Returns
+    -------
+    callable
+        Función sin argumentos que cancela la suscripción.
+    """
+    _SUBSCRIBERS.append(callback)
+    return lambda: unsubscribe(callback)
+
+
+def unsubscribe(callback: Callable[[Event], None]) -> None:
+    """Cancela la suscripción de ``callback`` (sin error si no estaba)."""
+    if callback in _SUBSCRIBERS:
+        _SUBSCRIBERS.remove(callback)
+
+
+def has_subscribers() -> bool:
+    """Indica si hay funciones suscritas con :func:`subscribe`."""
+    return bool(_SUBSCRIBERS)
+
+
+class Recorder:
+    """
+    Recolector de métricas de una solución.
+
+    Acumula el tiempo de reloj y de CPU de cada fase (``"stencil"``,
+    ``"boundary"``, ``"convergence"``, ``"residual"``), cuenta las
+    actualizaciones de nodos para el rendimiento en MLUPS, muestrea el residuo
+    cada ``residual_stride`` iteraciones y, opcionalmente, mide el pico de
+    memoria con :mod:`tracemalloc`. Al terminar vuelca todo en la
+    :class:`ConvergenceInfo` y notifica a los suscriptores.
+
+    Parameters
+    ----------
+    method : str, default=""
+        Nombre del método; si está vacío lo completa el primer kernel que lo use.
+    residual_stride : int, default=0
+        Cada cuántas iteraciones se registra la norma infinito del residuo en
+        ``info.residuals``; ``0`` desactiva el muestreo.
+    track_memory : bool, default=False
+        Mide el pico de memoria asignada durante la solución (añade un costo
+        apreciable a cada asignación).
+    callbacks : sequence of callable, default=()
+        Funciones que reciben los :class:`Event` de esta solución, además de
+        los suscriptores globales.
+
+    Attributes
+    ----------
+    phases : dict of str to dict
+        ``{"wall": s, "cpu": s, "calls": n}`` por fase.
+    residuals : list of float
+        Residuos muestreados.
+    updates : int
+        Actualizaciones de nodos realizadas.
+
+    Examples
+    --------
+    >>> rec = Recorder(residual_stride=10)
+    >>> info = solver.solve("jacobi", recorder=rec)  # doctest: +SKIP
+    >>> info.timings["stencil"]["wall"], info.mlups  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        method: str = "",
+        residual_stride: int = 0,
+        track_memory: bool = False,
+        callbacks=(),
+    ):
+        if residual_stride < 0:
+            raise ValueError("residual_stride debe ser >= 0.")
+        self.method = method
+        self.residual_stride = int(residual_stride)
+        self.track_memory = bool(track_memory)
+        self.callbacks = list(callbacks)
+        self.phases: dict[str, dict] = {}
+        self.residuals: list[float] = []
+        self.updates = 0
+        self._depth = 0
+        self._owns_tracing = False
+        self._t0 = self._c0 = 0.0
+
+    def emit(self, event: Event) -> None:
+        """Entrega ``event`` a los callbacks propios y a los suscriptores."""
+        for callback in (*self.callbacks, *_SUBSCRIBERS):
+            callback(event)
+
+    def elapsed(self) -> float:
+        """Segundos de reloj desde :meth:`begin`."""
+        return time.perf_counter() - self._t0
+
+    def begin(self, method: str = "") -> None:
+        """
+        Inicia la medición. Las llamadas anidadas (por ejemplo, los dos pasos
+        de precisión mixta) se agrupan en una sola solución.
+
+        La llamada más externa descarta las fases, residuos y actualizaciones
+        de una solución anterior, de modo que un recolector reutilizado solo
+        informa de la actual. Si un callback falla con el evento ``"start"``,
+        la medición se deshace (ver :meth:`abort`) antes de propagar el error.
+        """
+        self.method = self.method or method
+        self._depth += 1
+        if self._depth > 1:
+            return
+        self.phases = {}
+        self.residuals = []
+        self.updates = 0
+        if self.track_memory:
+            self._owns_tracing = not tracemalloc.is_tracing()
+            if self._owns_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._t0, self._c0 = time.perf_counter(), time.process_time()
+        try:
+            self.emit(Event("start", self.method))
+        except BaseException:
+            self.abort()
+            raise
+
+    @contextmanager
+    def phase(self, name: str):
+        """Acumula el tiempo del bloque ``with`` en la fase ``name``."""
+        t0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            p = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            p["wall"] += time.perf_counter() - t0
+            p["cpu"] += time.process_time() - c0
+            p["calls"] += 1
+
+    def iteration(self, k: int, diff, V: np.ndarray, rhs=None, mask=None, aspect: float = 1.0) -> None:
+        """
+        Registra el barrido ``k`` sobre ``V``.
+
+        ``diff`` es ``None`` en los barridos sin verificación de convergencia;
+        solo los demás emiten un evento ``"iteration"``. ``aspect`` es el de
+        :func:`campo_estatico_mdf.grid.aspect_ratio` para el residuo.
+        """
+        self.updates += V[..., 1:-1, 1:-1].size
+        if self.residual_stride and k % self.residual_stride == 0:
+            from .multigrid import residual  # importación local para evitar dependencias circulares
+
+            with self.phase("residual"):
+                r = residual(V, rhs, aspect)
+                if mask is not None:
+                    r[mask] = 0.0
+                self.residuals.append(float(np.abs(r).max()))
+        if diff is not None:
+            self.emit(Event("iteration", self.method, k, float(diff), self.elapsed(), V))
+
+    def finish(self, info):
+        """
+        Cierra la medición y completa ``info`` con ``timings``, ``mlups``,
+        ``peak_memory`` y, si hay muestreo, ``residuals``.
+
+        En llamadas anidadas solo actúa la más externa.
+
+        Returns
+        -------
+        ConvergenceInfo
+            El mismo ``info``.
+        """
+        self._depth = max(0, self._depth - 1)
+        if self._depth:
+            return info
+        wall = self.elapsed()
+        timings = {name: dict(p) for name, p in self.phases.items()}
+        timings["total"] = {"wall": wall, "cpu": time.process_time() - self._c0, "calls": 1}
+        info.timings = timings
+        if self.updates and wall > 0:
+            info.mlups = self.updates / wall / 1e6
+        if self.residual_stride:
+            info.residuals = list(self.residuals)
+        if self.track_memory:
+            info.peak_memory = int(tracemalloc.get_traced_memory()[1])
+            if self._owns_tracing:
+                tracemalloc.stop()
+        self.emit(Event("end", self.method, info.iterations, info.max_diff, wall, info=info))
+        return info
+
+    def abort(self) -> None:
+        """
+        Deshace :meth:`begin` cuando la solución termina con una excepción (por
+        ejemplo, lanzada desde un callback): detiene :mod:`tracemalloc` si este
+        recolector lo inició y no emite el evento ``"end"``.
+
+        En llamadas anidadas solo actúa la más externa.
+        """
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0 and self.track_memory and self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+
+class _NullRecorder:
+    """Recolector sin efecto para los kernels sin instrumentar."""
+
+    _context = nullcontext()
+
+    def phase(self, name: str):
+        return self._context
+
+    def iteration(self, k, diff, V, rhs=None, mask=None, aspect=1.0) -> None:
+        pass
+
+
+NULL_RECORDER = _NullRecorder()
+
+
+def resolve_recorder(recorder: Recorder | None, method: str) -> Recorder | None:
+    """
+    Devuelve ``recorder``, o uno nuevo para ``method`` si no se indicó pero
+    hay suscriptores globales; ``None`` si no hace falta instrumentar.
+    """
+    if recorder is None and _SUBSCRIBERS:
+        recorder = Recorder(method)
+    return recorder
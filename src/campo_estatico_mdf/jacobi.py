@@ -1,8 +1,10 @@
 # src/campo_estatico_mdf/jacobi.py
 from __future__ import annotations
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .bc import impose_dirichlet
+from .instrument import NULL_RECORDER, resolve_recorder
+from .parallel import StripPool, resolve_workers
 
 @dataclass
 class ConvergenceInfo:
@@ -17,10 +19,58 @@ class ConvergenceInfo:
         Máxima diferencia absoluta entre iteraciones consecutivas al finalizar.
     tol : float
         Tolerancia utilizada como criterio de parada.
+    residuals : list of float
+        Historial de la norma infinito del residuo, para los métodos que lo
+        registran (por ejemplo, un valor inicial y uno por ciclo de multigrid).
+        Con un :class:`~campo_estatico_mdf.instrument.Recorder` con
+        ``residual_stride = s``, un valor cada ``s`` iteraciones. Vacío en caso
+        contrario.
+    timings : dict of str to dict
+        Solo en soluciones instrumentadas: tiempo de reloj y de CPU por fase,
+        ``{"stencil": {"wall": s, "cpu": s, "calls": n}, ..., "total": {...}}``.
+    mlups : float or None
+        Rendimiento en millones de actualizaciones de nodo por segundo.
+    peak_memory : int or None
+        Pico de memoria asignada durante la solución, en bytes.
     """
     iterations: int
     max_diff: float
     tol: float
+    residuals: list[float] = field(default_factory=list)
+    timings: dict = field(default_factory=dict)
+    mlups: float | None = None
+    peak_memory: int | None = None
+
+
+def _jacobi_sweep(src: np.ndarray, dst: np.ndarray, rhs=None, mask=None, aspect: float = 1.0) -> None:
+    """
+    Aplica un barrido de Jacobi de ``src`` hacia ``dst`` sin crear temporales.
+
+    Solo se escriben los nodos interiores ``dst[..., 1:-1, 1:-1]``; los bordes de
+    ``dst`` no se tocan. El orden de las sumas coincide con el de la forma
+    vectorizada ``0.25 * (E + O + S + N + rhs)``, de modo que el resultado es
+    idéntico bit a bit. Los nodos con ``mask`` verdadero conservan el valor de
+    ``src``. Con ``aspect != 1`` se usan los pesos anisótropos de
+    :func:`campo_estatico_mdf.grid.aspect_ratio`.
+    """
+    inner = dst[..., 1:-1, 1:-1]
+    np.add(src[..., 1:-1, 2:], src[..., 1:-1, :-2], out=inner)
+    if aspect != 1.0:
+        np.multiply(inner, aspect, out=inner)
+    np.add(inner, src[..., 2:, 1:-1], out=inner)
+    np.add(inner, src[..., :-2, 1:-1], out=inner)
+    if rhs is not None:
+        np.add(inner, rhs[..., 1:-1, 1:-1], out=inner)
+    np.multiply(inner, 0.25 if aspect == 1.0 else 0.5 / (1.0 + aspect), out=inner)
+    if mask is not None:
+        np.copyto(inner, src[..., 1:-1, 1:-1], where=mask[..., 1:-1, 1:-1])
+
+
+def _max_abs_diff(a: np.ndarray, b: np.ndarray, scratch: np.ndarray) -> float:
+    """Calcula ``max|a - b|`` sobre el interior reutilizando ``scratch``."""
+    np.subtract(a[..., 1:-1, 1:-1], b[..., 1:-1, 1:-1], out=scratch)
+    np.abs(scratch, out=scratch)
+    return float(scratch.max())
 
 
 def jacobi_solve(
@@ -28,9 +78,16 @@ def jacobi_solve(
     left, right, top, bottom,
     tol: float = 1e-5,
     max_iter: int = 10000,
+    check_every: int = 1,
+    kernel: str = "buffered",
+    workers: int = 1,
+    rhs=None,
+    mask=None,
+    recorder=None,
+    aspect: float = 1.0,
 ) -> tuple[np.ndarray, ConvergenceInfo]:
     """
-    Resuelve la ecuación de Laplace :math:`\\nabla^2 V = 0` en una malla cuadrada
+    Resuelve la ecuación de Laplace :math:`\\nabla^2 V = 0` en una malla rectangular
     mediante el método iterativo de Jacobi con condiciones de frontera de Dirichlet.
 
     **Resumen del método**
@@ -53,10 +110,10 @@ def jacobi_solve(
 
     Parameters
     ----------
-    V0 : numpy.ndarray of shape (N, N)
+    V0 : numpy.ndarray of shape (Ny, Nx)
         Potencial inicial.  
         Solo se actualizan los nodos interiores; los valores en las fronteras se
-        reimponen en cada iteración.
+        imponen una única vez al inicio.
     left, right, top, bottom : float or array_like
         Valores de frontera sobre los bordes izquierdo, derecho, superior e inferior,
         respectivamente.  
@@ -66,6 +123,35 @@ def jacobi_solve(
         iteraciones.
     max_iter : int, default=10000
         Número máximo de iteraciones permitidas.
+    check_every : int, default=1
+        Frecuencia (en barridos) con la que se evalúa el criterio de convergencia.
+        Valores mayores que 1 evitan el cálculo de ``max_diff`` en la mayoría de
+        los barridos; la última iteración siempre se evalúa.
+    kernel : {"buffered", "simple"}, default="buffered"
+        ``"buffered"`` alterna dos búferes preasignados y calcula el esquema de
+        cinco puntos con ufuncs ``out=``, sin asignar memoria dentro del bucle.
+        ``"simple"`` es la implementación directa con copias, útil como referencia.
+    workers : int, default=1
+        Número de hilos para el kernel ``"buffered"`` (``0`` o ``None`` usa todos
+        los núcleos). El interior se divide en franjas horizontales con filas de
+        halo; cada barrido termina con una barrera y ``max_diff`` se reduce entre
+        franjas. El resultado es idéntico al de un solo hilo.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f` (:math:`h_y^2 f` con pasos
+        distintos; misma forma que ``V0``) para resolver la ecuación de Poisson
+        :math:`-\\nabla^2 V = f`.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo (electrodos); conservan el valor que
+        tienen en ``V0``.
+    recorder : Recorder or None, default=None
+        Recolector de :mod:`campo_estatico_mdf.instrument` que mide las fases
+        ``"boundary"``, ``"stencil"`` y ``"convergence"`` y completa
+        ``info.timings``, ``info.mlups`` y ``info.peak_memory``. Si es ``None``
+        se crea uno solo cuando hay suscriptores globales.
+    aspect : float, default=1.0
+        :math:`(h_y / h_x)^2` para pasos distintos en ``x`` y ``y`` (ver
+        :func:`campo_estatico_mdf.grid.aspect_ratio`); con 1 cada nodo es el
+        promedio de sus cuatro vecinos.
 
     Returns
     -------
@@ -76,34 +162,198 @@ def jacobi_solve(
         Información sobre la convergencia del algoritmo: número de iteraciones,
         último valor de ``max_diff`` y tolerancia aplicada.
 
+    Raises
+    ------
+    ValueError
+        Si ``check_every < 1`` o si ``kernel`` no es reconocido.
+
     Notes
     -----
     La convergencia del método de Jacobi está garantizada para operadores diagonales
     dominantes como el Laplaciano discreto en 2D con condiciones de Dirichlet.
 
+    Ambos kernels producen exactamente el mismo potencial en cada iteración. Con
+    ``check_every = k`` la parada solo puede ocurrir en múltiplos de ``k``, por lo
+    que el número de iteraciones puede exceder hasta en ``k - 1`` al de ``k = 1``.
+
     References
     ----------
     - Método de Jacobi para sistemas lineales.
     """
-    V = V0.copy()
-    impose_dirichlet(V, left, right, top, bottom)
-    N = V.shape[0]
+    if check_every < 1:
+        raise ValueError("check_every debe ser >= 1.")
+
+    if kernel not in ("buffered", "simple"):
+        raise ValueError(f"Kernel de Jacobi desconocido: {kernel!r}.")
+
+    recorder = resolve_recorder(recorder, "jacobi")
+    if recorder is not None:
+        recorder.begin("jacobi")
+    rec = NULL_RECORDER if recorder is None else recorder
+
+    try:
+        V = V0.copy()
+        with rec.phase("boundary"):
+            impose_dirichlet(V, left, right, top, bottom)
+
+        if kernel == "buffered":
+            workers = resolve_workers(workers)
+            if workers > 1:
+                V, info = _jacobi_threaded(V, tol, max_iter, check_every, workers, rhs, mask, rec, aspect)
+            elif recorder is not None:
+                V, info = _jacobi_profiled(V, tol, max_iter, check_every, rhs, mask, recorder, aspect)
+            else:
+                V, info = _jacobi_buffered(V, tol, max_iter, check_every, rhs, mask, aspect)
+        else:
+            V, info = _jacobi_simple(
+                V, left, right, top, bottom, tol, max_iter, check_every, rhs, mask, rec, aspect
+            )
+    except BaseException:
+        if recorder is not None:
+            recorder.abort()
+        raise
+    if recorder is not None:
+        recorder.finish(info)
+    return V, info
+
+
+def _jacobi_buffered(
+    V: np.ndarray, tol: float, max_iter: int, check_every: int, rhs=None, mask=None,
+    aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Kernel de Jacobi con doble búfer.
+
+    ``V`` ya contiene las fronteras impuestas; se copia una sola vez para crear el
+    segundo búfer, de modo que los bordes de ambos quedan fijos durante todo el
+    proceso y no es necesario reimponerlos.
+    """
+    A = V
+    B = V.copy()
+    scratch = np.empty_like(A[..., 1:-1, 1:-1])
+    diff = float("inf")
+
+    for k in range(1, max_iter + 1):
+        _jacobi_sweep(A, B, rhs, mask, aspect)
+        A, B = B, A
+
+        if k % check_every == 0 or k == max_iter:
+            diff = _max_abs_diff(A, B, scratch)
+            if diff < tol:
+                return A, ConvergenceInfo(k, diff, float(tol))
+
+    return A, ConvergenceInfo(max_iter, diff, float(tol))
+
+
+def _jacobi_profiled(
+    V: np.ndarray, tol: float, max_iter: int, check_every: int, rhs, mask, recorder,
+    aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    :func:`_jacobi_buffered` con cada fase medida por ``recorder``; se mantiene
+    aparte para que el kernel sin instrumentar no pague ningún costo.
+    """
+    A = V
+    B = V.copy()
+    scratch = np.empty_like(A[..., 1:-1, 1:-1])
+    diff = float("inf")
+
+    for k in range(1, max_iter + 1):
+        with recorder.phase("stencil"):
+            _jacobi_sweep(A, B, rhs, mask, aspect)
+        A, B = B, A
+
+        if k % check_every == 0 or k == max_iter:
+            with recorder.phase("convergence"):
+                diff = _max_abs_diff(A, B, scratch)
+            recorder.iteration(k, diff, A, rhs, mask, aspect)
+            if diff < tol:
+                return A, ConvergenceInfo(k, diff, float(tol))
+        else:
+            recorder.iteration(k, None, A, rhs, mask, aspect)
+
+    return A, ConvergenceInfo(max_iter, diff, float(tol))
+
+
+def _jacobi_threaded(
+    V: np.ndarray, tol: float, max_iter: int, check_every: int, workers: int,
+    rhs=None, mask=None, recorder=NULL_RECORDER, aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Variante multihilo de :func:`_jacobi_buffered` por franjas de filas.
+
+    Cada tarea actualiza su franja sobre la vista con halo y, en las iteraciones
+    de verificación, calcula su ``max_diff`` local sobre la misma franja; por eso
+    la fase ``"stencil"`` incluye aquí la verificación.
+    """
+    bufs = [V, V.copy()]
+    scratch = np.empty_like(V[..., 1:-1, 1:-1])
+    diff = float("inf")
+
+    with StripPool(V.shape[-2], workers) as pool:
+        for k in range(1, max_iter + 1):
+            src, dst = bufs[(k - 1) % 2], bufs[k % 2]
+            check = k % check_every == 0 or k == max_iter
+
+            def task(r0, r1):
+                rows = slice(r0 - 1, r1 + 1)
+                _jacobi_sweep(
+                    src[..., rows, :], dst[..., rows, :],
+                    None if rhs is None else rhs[..., rows, :],
+                    None if mask is None else mask[..., rows, :],
+                    aspect,
+                )
+                if check:
+                    return _max_abs_diff(dst[..., rows, :], src[..., rows, :],
+                                         scratch[..., r0 - 1:r1 - 1, :])
+                return 0.0
+
+            with recorder.phase("stencil"):
+                local = pool.map(task)
+            if check:
+                diff = max(local, default=0.0)
+                recorder.iteration(k, diff, dst, rhs, mask, aspect)
+                if diff < tol:
+                    return dst, ConvergenceInfo(k, diff, float(tol))
+            else:
+                recorder.iteration(k, None, dst, rhs, mask, aspect)
+
+    return bufs[max_iter % 2], ConvergenceInfo(max_iter, diff, float(tol))
+
+
+def _jacobi_simple(
+    V: np.ndarray, left, right, top, bottom,
+    tol: float, max_iter: int, check_every: int, rhs=None, mask=None,
+    recorder=NULL_RECORDER, aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """Implementación de referencia: copia completa y reimposición por iteración."""
+    source = 0.0 if rhs is None else rhs[1:-1, 1:-1]
+    weight = 0.5 / (1.0 + aspect)
+    diff = float("inf")
 
     for k in range(1, max_iter + 1):
-        Vn = V.copy()
+        with recorder.phase("stencil"):
+            Vn = V.copy()
 
-        # Actualización Jacobi (solo nodos interiores)
-        Vn[1:-1, 1:-1] = 0.25 * (
-            V[1:-1, 2:] + V[1:-1, :-2] +
-            V[2:, 1:-1] + V[:-2, 1:-1]
-        )
+            # Actualización Jacobi (solo nodos interiores)
+            Vn[1:-1, 1:-1] = weight * (
+                aspect * (V[1:-1, 2:] + V[1:-1, :-2]) +
+                V[2:, 1:-1] + V[:-2, 1:-1] + source
+            )
 
-        impose_dirichlet(Vn, left, right, top, bottom)
+        with recorder.phase("boundary"):
+            impose_dirichlet(Vn, left, right, top, bottom)
+            if mask is not None:
+                np.copyto(Vn, V, where=mask)
 
-        diff = float(np.max(np.abs(Vn - V)))
+        check = k % check_every == 0 or k == max_iter
+        if check:
+            with recorder.phase("convergence"):
+                diff = float(np.max(np.abs(Vn - V)))
         V = Vn
+        recorder.iteration(k, diff if check else None, V, rhs, mask, aspect)
 
-        if diff < tol:
+        if check and diff < tol:
             return V, ConvergenceInfo(k, diff, float(tol))
 
     return V, ConvergenceInfo(max_iter, diff, float(tol))
@@ -0,0 +1,405 @@
+# src/campo_estatico_mdf/multigrid.py
+from __future__ import annotations
+import numpy as np
+from .bc import impose_dirichlet
+from .jacobi import ConvergenceInfo
+from .sor import _RED, _BLACK, _red_black_sweep
+
+# Vistas de la malla fina alrededor de cada nodo interior de la malla gruesa.
+_C = slice(2, -2, 2)   # nodo coincidente
+_M = slice(1, -3, 2)   # vecino anterior (fila o columna)
+_P = slice(3, -1, 2)   # vecino posterior
+
+#: Pares de barridos Gauss–Seidel simétricos en el nivel más grueso, que tiene a
+#: lo sumo 2 × 2 nodos interiores.
+_COARSE_SWEEPS = 20
+
+
+def _coarse_shape(shape) -> tuple[int, int]:
+    """
+    Forma del nivel inmediatamente más grueso de una malla ``shape[-2:]``.
+
+    Cada dimensión de ``n >= 5`` nodos pasa a ``n // 2 + 1`` nodos: la mitad
+    exacta de intervalos si ``n - 1`` es par (mallas anidadas) y el redondeo hacia
+    arriba si no. Las dimensiones menores no se reducen.
+    """
+    return tuple(n // 2 + 1 if n >= 5 else n for n in shape[-2:])
+
+
+def _coarsenable(shape) -> bool:
+    """Indica si una malla de ``shape[-2:]`` admite un nivel más grueso."""
+    return _coarse_shape(shape) != tuple(shape[-2:])
+
+
+def hierarchy(shape) -> list[tuple[int, int]]:
+    """
+    Formas de los niveles que usa :func:`v_cycle` para una malla ``shape[-2:]``.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Forma de la malla fina.
+
+    Returns
+    -------
+    list of tuple of int
+        Formas desde la malla fina hasta la más gruesa, que tiene a lo sumo 4
+        nodos por dimensión.
+    """
+    levels = [tuple(shape[-2:])]
+    while _coarsenable(levels[-1]):
+        levels.append(_coarse_shape(levels[-1]))
+    return levels
+
+
+def _ratios(fine, coarse) -> tuple[float, float]:
+    """Cociente entre los pasos grueso y fino en ``y`` y en ``x``."""
+    return tuple((n - 1) / (m - 1) for n, m in zip(fine[-2:], coarse[-2:]))
+
+
+def _nested(fine, coarse) -> bool:
+    """Indica si la malla gruesa se obtiene tomando uno de cada dos nodos."""
+    return all(n == 2 * m - 1 for n, m in zip(fine[-2:], coarse[-2:]))
+
+
+def _linear_weights(n: int, m: int):
+    """
+    Celda gruesa ``j`` y peso ``w`` de cada uno de los ``n`` nodos finos.
+
+    El nodo fino ``i`` está en la posición :math:`t_i = i (m - 1) / (n - 1)` de la
+    malla gruesa y se interpola como :math:`(1 - w) e_j + w e_{j + 1}`.
+    """
+    t = np.arange(n) * ((m - 1) / (n - 1))
+    j = np.minimum(t.astype(np.intp), m - 2)
+    return j, t - j
+
+
+def _along(w: np.ndarray, axis: int) -> np.ndarray:
+    """Da a ``w`` la forma que se difunde sobre el eje ``axis`` (``-1`` o ``-2``)."""
+    return w if axis == -1 else w[:, None]
+
+
+def _prolong_axis(ec: np.ndarray, n: int, axis: int) -> np.ndarray:
+    """Interpolación lineal de ``ec`` a ``n`` nodos a lo largo de ``axis``."""
+    m = ec.shape[axis]
+    if m == n:
+        return ec
+    j, w = _linear_weights(n, m)
+    w = _along(w, axis)
+    return np.take(ec, j, axis) * (1.0 - w) + np.take(ec, j + 1, axis) * w
+
+
+def _restrict_axis(r: np.ndarray, m: int, axis: int) -> np.ndarray:
+    """Traspuesta escalada de :func:`_prolong_axis`: reduce ``r`` a ``m`` nodos."""
+    n = r.shape[axis]
+    if m == n:
+        return r
+    j, w = _linear_weights(n, m)
+    starts = np.flatnonzero(np.diff(j, prepend=-1))
+    w = _along(w, axis)
+    lo = np.add.reduceat(r * (1.0 - w), starts, axis)
+    hi = np.add.reduceat(r * w, starts, axis)
+    shape = list(r.shape)
+    shape[axis] = m
+    rc = np.zeros(shape, dtype=r.dtype)
+    if axis == -1:
+        rc[..., :-1] += lo
+        rc[..., 1:] += hi
+    else:
+        rc[..., :-1, :] += lo
+        rc[..., 1:, :] += hi
+    rc *= (m - 1) / (n - 1)
+    return rc
+
+
+def _sample(V: np.ndarray, shape) -> np.ndarray:
+    """Valores de ``V`` interpolados linealmente en los nodos de la malla ``shape``."""
+    if _nested(V.shape, shape):
+        return V[..., ::2, ::2].copy()
+    out = V
+    for axis, m in ((-2, shape[0]), (-1, shape[1])):
+        n = out.shape[axis]
+        if m == n:
+            continue
+        t = np.arange(m) * ((n - 1) / (m - 1))
+        i = np.minimum(t.astype(np.intp), n - 2)
+        w = _along(t - i, axis)
+        out = np.take(out, i, axis) * (1.0 - w) + np.take(out, i + 1, axis) * w
+    return np.array(out, copy=True)
+
+
+def residual(V: np.ndarray, rhs=None, aspect: float = 1.0) -> np.ndarray:
+    """
+    Residuo escalado del Laplaciano de cinco puntos.
+
+    Devuelve :math:`r = \\text{rhs} + V_E + V_O + V_S + V_N - 4V` en los nodos
+    interiores y cero en los bordes, es decir :math:`h^2 (f + \\nabla_h^2 V)`
+    para el problema :math:`-\\nabla^2 V = f` con ``rhs`` :math:`= h^2 f`.
+    Con pasos distintos, :math:`r = \\text{rhs} + a (V_E + V_O) + V_S + V_N -
+    2 (1 + a) V = h_y^2 (f + \\nabla_h^2 V)`.
+
+    Parameters
+    ----------
+    V : numpy.ndarray of shape (..., Ny, Nx)
+        Potencial con el convenio ``V[y, x]``.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado, misma forma que ``V``.
+    aspect : float, default=1.0
+        :math:`a = (h_y / h_x)^2` (ver :func:`campo_estatico_mdf.grid.aspect_ratio`).
+
+    Returns
+    -------
+    numpy.ndarray
+        Arreglo con la misma forma que ``V``.
+    """
+    r = np.zeros_like(V)
+    inner = r[..., 1:-1, 1:-1]
+    np.add(V[..., 1:-1, 2:], V[..., 1:-1, :-2], out=inner)
+    if aspect != 1.0:
+        inner *= aspect
+    inner += V[..., 2:, 1:-1]
+    inner += V[..., :-2, 1:-1]
+    inner -= (2.0 + 2.0 * aspect) * V[..., 1:-1, 1:-1]
+    if rhs is not None:
+        inner += rhs[..., 1:-1, 1:-1]
+    return r
+
+
+def restrict(r: np.ndarray, shape=None) -> np.ndarray:
+    """
+    Restricción por ponderación completa (*full weighting*) a la malla gruesa.
+
+    Una malla fina de ``n`` nodos por dimensión (``n - 1`` par) se reduce a
+    ``(n - 1) // 2 + 1`` nodos con el operador
+
+    .. math::
+
+        \\frac{1}{16}
+        \\begin{bmatrix} 1 & 2 & 1 \\\\ 2 & 4 & 2 \\\\ 1 & 2 & 1 \\end{bmatrix}.
+
+    Si la malla gruesa no está anidada (``n - 1`` impar) se usa, dimensión a
+    dimensión, la traspuesta de la interpolación lineal de :func:`prolong`
+    escalada por :math:`(m - 1) / (n - 1)`: conserva la simetría del ciclo V y
+    preserva las constantes salvo un error :math:`O(1 / n)`. En el caso anidado
+    ambas definiciones coinciden.
+    Los bordes del resultado son cero.
+
+    Parameters
+    ----------
+    r : numpy.ndarray of shape (..., n, n)
+        Arreglo de la malla fina.
+    shape : tuple of int or None, default=None
+        Forma ``(m_y, m_x)`` de la malla gruesa; por omisión ``n // 2 + 1`` nodos
+        por dimensión.
+
+    Returns
+    -------
+    numpy.ndarray
+        Arreglo de la malla gruesa.
+    """
+    if shape is None:
+        shape = tuple(n // 2 + 1 for n in r.shape[-2:])
+    if not _nested(r.shape, shape):
+        rc = _restrict_axis(_restrict_axis(r, shape[1], -1), shape[0], -2)
+        rc[..., 0, :] = 0.0
+        rc[..., -1, :] = 0.0
+        rc[..., :, 0] = 0.0
+        rc[..., :, -1] = 0.0
+        return rc
+
+    rc = np.zeros(r.shape[:-2] + tuple(shape), dtype=r.dtype)
+    inner = rc[..., 1:-1, 1:-1]
+    inner += 4.0 * r[..., _C, _C]
+    inner += 2.0 * (r[..., _M, _C] + r[..., _P, _C] + r[..., _C, _M] + r[..., _C, _P])
+    inner += r[..., _M, _M] + r[..., _M, _P] + r[..., _P, _M] + r[..., _P, _P]
+    inner *= 1.0 / 16.0
+    return rc
+
+
+def prolong(ec: np.ndarray, shape=None) -> np.ndarray:
+    """
+    Prolongación por interpolación bilineal a la malla fina.
+
+    Parameters
+    ----------
+    ec : numpy.ndarray of shape (..., m, m)
+        Arreglo de la malla gruesa.
+    shape : tuple of int or None, default=None
+        Forma ``(n_y, n_x)`` de la malla fina; por omisión ``2m - 1`` nodos por
+        dimensión. Las mallas no anidadas interpolan linealmente en las
+        posiciones :math:`i (m - 1) / (n - 1)` de la malla gruesa.
+
+    Returns
+    -------
+    numpy.ndarray of shape (..., 2m - 1, 2m - 1)
+        Arreglo interpolado; coincide con ``ec`` en los nodos compartidos.
+    """
+    m_rows, m_cols = ec.shape[-2:]
+    if shape is not None and not _nested(shape, ec.shape):
+        return _prolong_axis(_prolong_axis(ec, shape[0], -2), shape[1], -1)
+
+    ef = np.empty(ec.shape[:-2] + (2 * m_rows - 1, 2 * m_cols - 1), dtype=ec.dtype)
+    ef[..., ::2, ::2] = ec
+    ef[..., 1::2, ::2] = 0.5 * (ec[..., :-1, :] + ec[..., 1:, :])
+    ef[..., ::2, 1::2] = 0.5 * (ec[..., :, :-1] + ec[..., :, 1:])
+    ef[..., 1::2, 1::2] = 0.25 * (
+        ec[..., :-1, :-1] + ec[..., 1:, :-1] + ec[..., :-1, 1:] + ec[..., 1:, 1:]
+    )
+    return ef
+
+
+def smooth(
+    V: np.ndarray, rhs=None, sweeps: int = 1, reverse: bool = False, aspect: float = 1.0
+) -> None:
+    """
+    Suavizador Gauss–Seidel rojo-negro in-place.
+
+    ``reverse=True`` recorre los colores en orden negro-rojo, de modo que un
+    pre-suavizado y un post-suavizado con órdenes opuestos forman un operador
+    simétrico.
+    """
+    order = _BLACK + _RED if reverse else _RED + _BLACK
+    for _ in range(sweeps):
+        _red_black_sweep(V, 1.0, rhs, order=order, aspect=aspect)
+
+
+def _coarse_solve(V: np.ndarray, rhs=None, aspect: float = 1.0) -> None:
+    """
+    Resuelve el nivel más grueso con un número fijo de barridos simétricos.
+
+    Con a lo sumo 2 × 2 nodos interiores el radio espectral de Gauss–Seidel es
+    :math:`\\le 1/4`, así que :data:`_COARSE_SWEEPS` pares de barridos reducen el
+    error por debajo del redondeo con un costo despreciable y un operador lineal
+    fijo (necesario cuando el ciclo V precondiciona el gradiente conjugado).
+    """
+    for _ in range(_COARSE_SWEEPS):
+        smooth(V, rhs, 1, aspect=aspect)
+        smooth(V, rhs, 1, reverse=True, aspect=aspect)
+
+
+def v_cycle(V: np.ndarray, rhs=None, nu1: int = 2, nu2: int = 2, aspect: float = 1.0) -> None:
+    """
+    Aplica in-place un ciclo V sobre ``V`` para :math:`-\\nabla_h^2 V = f`.
+
+    La jerarquía (ver :func:`hierarchy`) reduce cada dimensión hasta 4 nodos o
+    menos para cualquier ``N``; si ``N - 1`` no es par la malla gruesa no está
+    anidada y su paso difiere ligeramente en ``y`` y en ``x``, lo que se
+    compensa con ``aspect`` en ese nivel.
+
+    Parameters
+    ----------
+    V : numpy.ndarray of shape (..., N, N)
+        Aproximación actual; sus bordes actúan como condición de Dirichlet.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f` (``None`` para Laplace).
+    nu1, nu2 : int, default=2
+        Barridos de pre- y post-suavizado.
+    aspect : float, default=1.0
+        :math:`a = (h_y / h_x)^2` del nivel actual.
+    """
+    if not _coarsenable(V.shape):
+        _coarse_solve(V, rhs, aspect)
+        return
+
+    shape = _coarse_shape(V.shape)
+    ry, rx = _ratios(V.shape, shape)
+    smooth(V, rhs, nu1, aspect=aspect)
+    # El residuo está escalado por h_y^2; el nivel grueso usa H_y = ry h_y
+    # (el factor 4 de siempre en mallas anidadas).
+    rc = ry * ry * restrict(residual(V, rhs, aspect), shape)
+    ec = np.zeros_like(rc)
+    v_cycle(ec, rc, nu1, nu2, aspect * (ry / rx) ** 2)
+    V[..., 1:-1, 1:-1] += prolong(ec, V.shape[-2:])[..., 1:-1, 1:-1]
+    smooth(V, rhs, nu2, reverse=True, aspect=aspect)
+
+
+def _full_multigrid(
+    V: np.ndarray, rhs=None, nu1: int = 2, nu2: int = 2, aspect: float = 1.0
+) -> None:
+    """
+    Inicialización por multigrid completo (FMG).
+
+    Las fronteras se inyectan en cada nivel grueso, el problema se resuelve en el
+    nivel más grueso y la solución se interpola hacia arriba aplicando un ciclo V
+    en cada nivel.
+    """
+    if not _coarsenable(V.shape):
+        _coarse_solve(V, rhs, aspect)
+        return
+
+    shape = _coarse_shape(V.shape)
+    ry, rx = _ratios(V.shape, shape)
+    Vc = _sample(V, shape)
+    rhsc = None if rhs is None else ry * ry * restrict(rhs, shape)
+    _full_multigrid(Vc, rhsc, nu1, nu2, aspect * (ry / rx) ** 2)
+    V[..., 1:-1, 1:-1] = prolong(Vc, V.shape[-2:])[..., 1:-1, 1:-1]
+    v_cycle(V, rhs, nu1, nu2, aspect)
+
+
+def multigrid_solve(
+    V0: np.ndarray,
+    left, right, top, bottom,
+    tol: float = 1e-5,
+    max_cycles: int = 50,
+    nu1: int = 2,
+    nu2: int = 2,
+    fmg: bool = True,
+    rhs=None,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Resuelve la ecuación de Laplace (o Poisson) con multigrid geométrico.
+
+    Cada ciclo V suaviza con Gauss–Seidel rojo-negro, restringe el residuo por
+    ponderación completa, resuelve recursivamente la ecuación del error en la malla
+    de paso :math:`2h` y corrige mediante interpolación bilineal. El costo de un
+    ciclo es :math:`O(N^2)` y el número de ciclos es independiente de ``N``.
+
+    Parameters
+    ----------
+    V0 : numpy.ndarray of shape (N, N)
+        Potencial inicial (ver :func:`campo_estatico_mdf.grid.allocate_potential`).
+    left, right, top, bottom : float or array_like
+        Valores de frontera de Dirichlet.
+    tol : float, default=1e-5
+        Tolerancia sobre la máxima variación del potencial en un ciclo.
+    max_cycles : int, default=50
+        Número máximo de ciclos V.
+    nu1, nu2 : int, default=2
+        Barridos de pre- y post-suavizado.
+    fmg : bool, default=True
+        Si es ``True`` la aproximación inicial se obtiene con multigrid completo.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f` para :math:`-\\nabla^2 V = f`.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Potencial resultante.
+    info : ConvergenceInfo
+        ``iterations`` cuenta ciclos V; ``residuals`` contiene la norma infinito
+        del residuo escalado antes del primer ciclo y después de cada ciclo, de
+        modo que ``residuals[k] / residuals[k - 1]`` es la reducción por ciclo.
+
+    Notes
+    -----
+    La jerarquía llega hasta mallas de a lo sumo 4 nodos por dimensión para
+    cualquier ``N``. Con ``N = 2^k + 1`` todos los niveles están anidados y se
+    usa la ponderación completa clásica; para otros tamaños los niveles gruesos
+    redondean el número de intervalos y las transferencias son lineales.
+    """
+    V = V0.copy()
+    impose_dirichlet(V, left, right, top, bottom)
+    if fmg:
+        _full_multigrid(V, rhs, nu1, nu2)
+
+    residuals = [float(np.abs(residual(V, rhs)).max())]
+    diff = float("inf")
+    for k in range(1, max_cycles + 1):
+        previous = V[1:-1, 1:-1].copy()
+        v_cycle(V, rhs, nu1, nu2)
+        diff = float(np.abs(V[1:-1, 1:-1] - previous).max()) if previous.size else 0.0
+        residuals.append(float(np.abs(residual(V, rhs)).max()))
+        if diff < tol:
+            return V, ConvergenceInfo(k, diff, float(tol), residuals)
+
+    return V, ConvergenceInfo(max_cycles, diff, float(tol), residuals)
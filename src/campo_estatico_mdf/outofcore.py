@@ -0,0 +1,161 @@
+# src/campo_estatico_mdf/outofcore.py
+from __future__ import annotations
+import os
+import numpy as np
+from .bc import impose_dirichlet
+from .jacobi import ConvergenceInfo, _jacobi_sweep
+
+#: Memoria de trabajo por defecto de :func:`tiled_jacobi_solve` (bytes).
+WORKING_SET = 64 * 2**20
+
+
+def open_potential(path, mode: str = "r") -> np.memmap:
+    """
+    Reabre sin copiar un potencial guardado como ``.npy`` (por ejemplo, el
+    archivo de respaldo de ``LaplaceSolver2D(..., path=...)``).
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Archivo ``.npy``.
+    mode : {"r", "r+", "c"}, default="r"
+        Modo de :func:`numpy.load` con ``mmap_mode``: solo lectura, lectura y
+        escritura, o copia en escritura.
+
+    Returns
+    -------
+    numpy.memmap
+        Vista mapeada en memoria del archivo; solo se leen las páginas que se
+        acceden.
+    """
+    return np.load(os.fspath(path), mmap_mode=mode)
+
+
+def tile_rows_for(n_cols: int, itemsize: int, working_set: int = WORKING_SET) -> int:
+    """
+    Número de filas por franja para que los búferes de trabajo de
+    :func:`tiled_jacobi_solve` (entrada con halo, salida y diferencia) ocupen a lo
+    sumo ``working_set`` bytes.
+    """
+    return max(1, int(working_set) // (3 * n_cols * itemsize) - 2)
+
+
+def tiled_jacobi_solve(
+    V: np.ndarray,
+    left, right, top, bottom,
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    check_every: int = 1,
+    tile_rows: int | None = None,
+    working_set: int = WORKING_SET,
+    rhs=None,
+    mask=None,
+    aspect: float = 1.0,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Método de Jacobi fuera de núcleo: actualiza ``V`` in-place recorriendo la
+    malla por franjas de filas con un conjunto de trabajo acotado.
+
+    ``V`` puede ser un :class:`numpy.memmap` mayor que la memoria disponible.
+    Cada franja se lee junto con sus filas de halo a un búfer en memoria, se le
+    aplica el esquema de cinco puntos y se escribe de vuelta. Como la franja
+    siguiente necesita el valor *anterior* de la última fila escrita, esa fila
+    se conserva aparte; así basta un único arreglo en disco (en lugar de los dos
+    búferes de :func:`campo_estatico_mdf.jacobi.jacobi_solve`) y el resultado es
+    idéntico bit a bit al de ``jacobi_solve`` en cada iteración.
+
+    Parameters
+    ----------
+    V : numpy.ndarray or numpy.memmap of shape (N, M)
+        Potencial inicial; se modifica in-place.
+    left, right, top, bottom : float or array_like
+        Valores de frontera de Dirichlet.
+    tol : float, default=1e-5
+        Tolerancia sobre la máxima diferencia entre iteraciones.
+    max_iter : int, default=10000
+        Número máximo de barridos.
+    check_every : int, default=1
+        Frecuencia con la que se evalúa la convergencia.
+    tile_rows : int or None, default=None
+        Filas interiores por franja. Si es ``None`` se deduce de ``working_set``
+        (ver :func:`tile_rows_for`).
+    working_set : int, default=64 MiB
+        Memoria de trabajo aproximada en bytes cuando ``tile_rows`` es ``None``.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f`; puede ser también un memmap.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo.
+    aspect : float, default=1.0
+        :math:`(h_y / h_x)^2` (ver :func:`campo_estatico_mdf.grid.aspect_ratio`).
+
+    Returns
+    -------
+    V : numpy.ndarray
+        El mismo arreglo ``V`` con la solución (vaciado a disco si es memmap).
+    info : ConvergenceInfo
+        Iteraciones, última ``max_diff`` y tolerancia.
+
+    Raises
+    ------
+    ValueError
+        Si ``check_every < 1`` o ``tile_rows < 1``.
+
+    Notes
+    -----
+    Cada barrido lee y escribe la malla una vez, por lo que el costo queda
+    dominado por el ancho de banda del disco; conviene usar ``check_every > 1``
+    y combinarlo con un método de convergencia rápida cuando la malla cabe en
+    memoria.
+    """
+    if check_every < 1:
+        raise ValueError("check_every debe ser >= 1.")
+    n_rows, n_cols = V.shape
+    if tile_rows is None:
+        tile_rows = tile_rows_for(n_cols, V.dtype.itemsize, working_set)
+    if tile_rows < 1:
+        raise ValueError("tile_rows debe ser >= 1.")
+    tile_rows = min(int(tile_rows), n_rows - 2)
+
+    impose_dirichlet(V, left, right, top, bottom)
+    src = np.empty((tile_rows + 2, n_cols), dtype=V.dtype)
+    dst = np.empty_like(src)
+    scratch = np.empty((tile_rows, n_cols - 2), dtype=V.dtype)
+    prev = np.empty(n_cols, dtype=V.dtype)
+    diff = float("inf")
+    k = 0
+
+    for k in range(1, max_iter + 1):
+        check = k % check_every == 0 or k == max_iter
+        diff_k = 0.0
+        prev[:] = V[0]
+        for r0 in range(1, n_rows - 1, tile_rows):
+            r1 = min(r0 + tile_rows, n_rows - 1)
+            t = r1 - r0
+            s, d = src[:t + 2], dst[:t + 2]
+
+            # Halo superior con el valor anterior; el resto aún no se ha escrito.
+            s[0] = prev
+            s[1:] = V[r0:r1 + 1]
+            _jacobi_sweep(
+                s, d,
+                None if rhs is None else rhs[r0 - 1:r1 + 1],
+                None if mask is None else mask[r0 - 1:r1 + 1],
+                aspect,
+            )
+            if check:
+                sc = scratch[:t]
+                np.subtract(d[1:-1, 1:-1], s[1:-1, 1:-1], out=sc)
+                np.abs(sc, out=sc)
+                diff_k = max(diff_k, float(sc.max()))
+
+            prev[:] = s[t]
+            V[r0:r1, 1:-1] = d[1:-1, 1:-1]
+
+        if check:
+            diff = diff_k
+            if diff < tol:
+                break
+
+    if isinstance(V, np.memmap):
+        V.flush()
+    return V, ConvergenceInfo(k, diff, float(tol))
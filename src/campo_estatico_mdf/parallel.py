@@ -0,0 +1,89 @@
+# src/campo_estatico_mdf/parallel.py
+from __future__ import annotations
+import os
+
+
+def resolve_workers(workers: int | None) -> int:
+    """
+    Normaliza el número de hilos: ``None`` o ``0`` usan todos los núcleos.
+
+    Raises
+    ------
+    ValueError
+        Si ``workers`` es negativo.
+    """
+    if workers is None or workers == 0:
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("workers debe ser >= 0.")
+    return int(workers)
+
+
+def row_strips(n_rows: int, workers: int, align: int = 1) -> list[tuple[int, int]]:
+    """
+    Divide las filas interiores ``[1, n_rows - 1)`` en franjas horizontales.
+
+    Cada franja ``(r0, r1)`` se procesa sobre la vista con halo
+    ``V[..., r0 - 1:r1 + 1, :]``. Con ``align = 2`` el inicio de cada vista
+    (``r0 - 1``) es par, de modo que la paridad rojo-negro local coincide con la
+    global.
+
+    Parameters
+    ----------
+    n_rows : int
+        Número total de filas de la malla (incluyendo bordes).
+    workers : int
+        Número máximo de franjas.
+    align : int, default=1
+        Múltiplo al que se alinea ``r0 - 1``.
+
+    Returns
+    -------
+    list of tuple of int
+        Franjas no vacías que cubren todo el interior, en orden.
+    """
+    interior = n_rows - 2
+    if interior <= 0:
+        return []
+    size = max(align, -(-interior // max(workers, 1)))
+    size = -(-size // align) * align
+    return [(r0, min(r0 + size, n_rows - 1)) for r0 in range(1, n_rows - 1, size)]
+
+
+class StripPool:
+    """
+    Grupo de hilos que ejecuta una función sobre cada franja de filas.
+
+    Cada llamada a :meth:`map` actúa como barrera: retorna cuando todas las
+    franjas terminaron. Los kernels de NumPy sobre rebanadas liberan el GIL, por
+    lo que las franjas se procesan en paralelo en varios núcleos.
+
+    Parameters
+    ----------
+    n_rows : int
+        Número de filas de la malla.
+    workers : int
+        Número de hilos (y de franjas).
+    align : int, default=1
+        Alineación de las franjas (ver :func:`row_strips`).
+    """
+
+    def __init__(self, n_rows: int, workers: int, align: int = 1):
+        from concurrent.futures import ThreadPoolExecutor  # importación diferida: solo con workers > 1
+
+        self.strips = row_strips(n_rows, workers, align)
+        self._executor = ThreadPoolExecutor(max_workers=max(len(self.strips), 1))
+
+    def map(self, fn) -> list:
+        """Aplica ``fn(r0, r1)`` a cada franja y devuelve los resultados en orden."""
+        return list(self._executor.map(lambda s: fn(*s), self.strips))
+
+    def close(self) -> None:
+        """Libera los hilos del grupo."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "StripPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,197 @@
+# src/campo_estatico_mdf/persist.py
+from __future__ import annotations
+import json
+import os
+import shutil
+from dataclasses import asdict
+import numpy as np
+from .jacobi import ConvergenceInfo
+
+#: Versión del formato escrito por :func:`save_solver`.
+FORMAT_VERSION = 1
+
+#: Métodos que admiten checkpoints: su estado completo es el potencial ``V``.
+CHECKPOINT_METHODS = ("jacobi", "sor")
+
+
+def save_solver(solver, path, method: str | None = None, field: bool = False, complete: bool = True) -> None:
+    """
+    Guarda un :class:`LaplaceSolver2D` en el directorio ``path``.
+
+    El formato es un directorio con ``meta.json`` (``N``, ``h``, ``dtype``,
+    método, :class:`ConvergenceInfo` y resúmenes de electrodos y fuente) y un
+    ``.npy`` sin comprimir por arreglo: ``V``, ``boundary`` (``(4, N)`` en el
+    orden ``left, right, top, bottom``) y, si existen, ``mask``, ``rho``,
+    ``Ex`` y ``Ey``. Los ``.npy`` se pueden mapear en memoria al cargar.
+
+    La escritura es atómica: se escribe en un directorio temporal que después
+    sustituye al anterior, de modo que un proceso interrumpido nunca deja un
+    archivo a medias.
+
+    Parameters
+    ----------
+    solver : LaplaceSolver2D
+        Solver a guardar.
+    path : str or os.PathLike
+        Directorio de destino.
+    method : str or None, default=None
+        Método con el que se obtuvo ``V``; por defecto ``solver.method``.
+    field : bool, default=False
+        Guarda también el campo eléctrico :math:`(E_x, E_y)`.
+    complete : bool, default=True
+        ``False`` marca el contenido como checkpoint de una solución en curso.
+    """
+    path = os.fspath(path)
+    tmp, old = path + ".tmp", path + ".old"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    b = solver.boundary
+    meta = {
+        "format": FORMAT_VERSION,
+        "N": solver.N,
+        "h": solver.h,
+        "dtype": solver.dtype.str,
+        "mixed_precision": solver.mixed_precision,
+        "method": method if method is not None else solver.method,
+        "complete": bool(complete),
+        "eps": solver.eps,
+        "problem": solver._problem_params(),
+        "info": asdict(solver.info),
+    }
+    edges = (b.left, b.right, b.top, b.bottom)
+    # Malla rectangular: los bordes tienen longitudes Ny y Nx y se guardan concatenados.
+    boundary = np.stack(edges) if solver.shape[0] == solver.shape[1] else np.concatenate(edges)
+    arrays = {"V": solver.V, "boundary": boundary}
+    if solver.mask is not None:
+        arrays["mask"] = solver.mask
+    if solver.rho is not None:
+        arrays["rho"] = solver.rho
+    if field:
+        arrays["Ex"], arrays["Ey"] = solver.electric_field()
+    for name, arr in arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(arr))
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, old)
+    os.replace(tmp, path)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def read_meta(path) -> dict:
+    """Lee ``meta.json`` de un directorio escrito por :func:`save_solver`."""
+    with open(os.path.join(os.fspath(path), "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Formato de solución no soportado: {meta.get('format')!r}.")
+    return meta
+
+
+def load_solver(path, mmap: bool = True):
+    """
+    Carga un solver guardado con :func:`save_solver`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Directorio de origen.
+    mmap : bool, default=True
+        Mapea los ``.npy`` en memoria en modo copia-en-escritura: la carga es
+        inmediata, solo se leen las páginas que se usan y las modificaciones no
+        alteran los archivos.
+
+    Returns
+    -------
+    LaplaceSolver2D
+        Solver con ``V``, fronteras, ``h``, ``method``, ``info``, electrodos y
+        fuente restaurados; si se guardó el campo, ``field`` lo usa sin
+        recalcularlo.
+
+    Raises
+    ------
+    ValueError
+        Si el directorio no tiene un formato reconocido.
+    """
+    from .solver import LaplaceSolver2D  # importación local para evitar dependencias circulares
+
+    path = os.fspath(path)
+    meta = read_meta(path)
+    mode = "c" if mmap else None
+
+    def array(name):
+        file = os.path.join(path, f"{name}.npy")
+        return np.load(file, mmap_mode=mode) if os.path.exists(file) else None
+
+    edges = np.asarray(array("boundary"))
+    # Se construye sobre una malla mínima y después se sustituyen los arreglos
+    # por los mapeados, para no reservar la malla completa en memoria.
+    solver = LaplaceSolver2D(
+        3, h=meta["h"], dtype=np.dtype(meta["dtype"]), mixed_precision=meta["mixed_precision"]
+    )
+    solver.N = meta["N"] if np.isscalar(meta["N"]) else tuple(meta["N"])
+    if edges.ndim == 1:
+        Ny = solver.shape[0]
+        edges = np.split(edges, [Ny, 2 * Ny, (edges.size + 2 * Ny) // 2])
+    solver.boundary = solver._normalize_boundaries(*edges)
+    solver.V = array("V")
+    solver.mask = array("mask")
+    rho = array("rho")
+    solver.rho, solver.eps = rho, float(meta["eps"])
+    solver.method = meta["method"]
+    solver.info = ConvergenceInfo(**meta["info"])
+    Ex, Ey = array("Ex"), array("Ey")
+    if Ex is not None:
+        Ex.flags.writeable = Ey.flags.writeable = False
+        solver._field = (Ex, Ey)
+    return solver
+
+
+class Checkpointer:
+    """
+    Callback de :class:`campo_estatico_mdf.instrument.Recorder` que guarda el
+    estado de una solución cada ``every`` iteraciones.
+
+    Solo actúa en los eventos ``"iteration"``, es decir, en las iteraciones en
+    que se evalúa la convergencia; guarda en la primera de ellas que alcanza o
+    supera el siguiente múltiplo de ``every``.
+
+    Parameters
+    ----------
+    solver : LaplaceSolver2D
+        Solver cuyo problema (fronteras, electrodos, fuente) se guarda.
+    path : str or os.PathLike
+        Directorio del checkpoint.
+    method : str
+        Método en curso.
+    every : int
+        Iteraciones entre checkpoints.
+    offset : int, default=0
+        Iteraciones ya realizadas antes de reanudar.
+    tol : float, default=0.0
+        Tolerancia registrada en la :class:`ConvergenceInfo` guardada.
+    """
+
+    def __init__(self, solver, path, method: str, every: int, offset: int = 0, tol: float = 0.0):
+        if every < 1:
+            raise ValueError("checkpoint_every debe ser >= 1.")
+        self.solver, self.path, self.method = solver, os.fspath(path), method
+        self.every, self.offset, self.tol = int(every), int(offset), float(tol)
+        self._next = self.every
+        self.saved = 0
+
+    def __call__(self, event) -> None:
+        if event.kind != "iteration" or event.iteration < self._next:
+            return
+        s = self.solver
+        V, info = s.V, s.info
+        s._V = event.V  # sin copiar, también con archivo de respaldo
+        s.info = ConvergenceInfo(self.offset + event.iteration, event.max_diff, self.tol)
+        try:
+            save_solver(s, self.path, self.method, complete=False)
+        finally:
+            s._V, s.info = V, info
+        self.saved += 1
+        self._next = (event.iteration // self.every + 1) * self.every
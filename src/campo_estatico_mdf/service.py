@@ -0,0 +1,483 @@
+# src/campo_estatico_mdf/service.py
+"""
+Servicio local de soluciones con asyncio.
+
+:class:`SolveService` recibe trabajos con el formato de
+:mod:`campo_estatico_mdf.cli` (``N``, ``h``, fronteras, ``method``, ``tol`` y
+argumentos del método), los encola por prioridad y los resuelve en un grupo
+acotado de hilos. Los trabajos idénticos (misma clave que
+:mod:`campo_estatico_mdf.cache`) que están en cola o en curso se unen en uno
+solo, y la cola tiene capacidad limitada para aplicar contrapresión.
+
+Se puede usar dentro de un bucle de asyncio, desde código síncrono con
+:class:`ServiceThread` (por ejemplo, la app de Streamlit, que envía trabajos y
+consulta su estado) o a través de un socket local con :meth:`SolveService.serve`
+y :func:`request`.
+"""
+from __future__ import annotations
+import asyncio
+import itertools
+import json
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from .cli import job_solver
+from .instrument import Recorder
+from .parallel import resolve_workers
+from .solver import METHODS, LaplaceSolver2D
+
+#: Estados de un :class:`Job`.
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+
+
+class _Cancelled(Exception):
+    """Interrumpe una solución desde el callback de progreso."""
+
+
+@dataclass
+class Job:
+    """
+    Trabajo del servicio.
+
+    Attributes
+    ----------
+    id : str
+        Clave de contenido del problema; los trabajos idénticos comparten id.
+    priority : int
+        Prioridad efectiva (menor se atiende antes).
+    state : {"queued", "running", "done", "failed", "cancelled"}
+        Estado actual.
+    solver : LaplaceSolver2D
+        Solver del trabajo; con ``state == "done"`` contiene la solución.
+    method : str
+        Método de solución.
+    params : dict
+        Argumentos del método.
+    history : list of tuple (int, float)
+        ``(iteración, max_diff)`` de cada verificación de convergencia, para
+        los métodos iterativos instrumentados.
+    requests : int
+        Número de envíos unidos en este trabajo.
+    waiting : int
+        Envíos que siguen esperando el resultado; :meth:`SolveService.cancel`
+        lo reduce y la solución solo se aborta al llegar a cero.
+    error : str or None
+        Mensaje de error si ``state == "failed"``.
+    submitted, started, finished : float
+        Marcas de :func:`time.perf_counter` (``0.0`` si aún no ocurren).
+    cancel_requested : bool
+        Se pidió cancelar el trabajo (ver :meth:`SolveService.cancel`).
+    """
+    id: str
+    priority: int
+    state: str
+    solver: LaplaceSolver2D
+    method: str
+    params: dict
+    history: list = field(default_factory=list)
+    requests: int = 1
+    waiting: int = 1
+    error: str | None = None
+    submitted: float = 0.0
+    started: float = 0.0
+    finished: float = 0.0
+    cancel_requested: bool = False
+
+    def summary(self) -> dict:
+        """Estado serializable en JSON (sin arreglos)."""
+        return {
+            "id": self.id,
+            "state": self.state,
+            "priority": self.priority,
+            "requests": self.requests,
+            "waiting": self.waiting,
+            "history": self.history[-1:],
+            "error": self.error,
+            "info": asdict(self.solver.info) if self.state == "done" else None,
+        }
+
+
+class SolveService:
+    """
+    Servicio asíncrono de soluciones con grupo de trabajadores acotado.
+
+    Parameters
+    ----------
+    workers : int or None, default=2
+        Soluciones simultáneas; ``None`` o ``0`` usan todos los núcleos.
+    max_queue : int, default=64
+        Trabajos distintos que pueden esperar en cola. Con la cola llena
+        :meth:`submit` espera (o lanza :class:`asyncio.QueueFull` con
+        ``wait=False``); los envíos que se unen a un trabajo existente y las
+        promociones de prioridad no ocupan capacidad.
+    cache : SolutionCache or None, default=None
+        Caché de soluciones compartida; un trabajo ya resuelto se atiende sin
+        ocupar un trabajador.
+    keep : int, default=256
+        Trabajos terminados que se conservan para consulta (LRU).
+
+    Examples
+    --------
+    >>> async with SolveService(workers=2) as service:  # doctest: +SKIP
+    ...     job_id = await service.submit({"N": 101, "right": 10.0, "method": "sor"})
+    ...     job = await service.wait(job_id)
+    """
+
+    def __init__(self, workers: int | None = 2, max_queue: int = 64, cache=None, keep: int = 256):
+        if max_queue < 1:
+            raise ValueError("max_queue debe ser >= 1.")
+        self.workers = resolve_workers(workers)
+        self.max_queue = int(max_queue)
+        self.cache = cache
+        self.keep = int(keep)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._done_events: dict[str, asyncio.Event] = {}
+        self._counter = itertools.count()
+        self._queue: asyncio.PriorityQueue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._holding: set[int] = set()  # id() de los trabajos en cola con plaza
+        self._tasks: list[asyncio.Task] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def start(self) -> "SolveService":
+        """Crea la cola y los trabajadores en el bucle actual."""
+        if self._queue is None:
+            # La cola no tiene límite propio: puede contener entradas repetidas
+            # por promoción. La capacidad se cuenta por trabajo con ``_slots``.
+            self._queue = asyncio.PriorityQueue()
+            self._slots = asyncio.Semaphore(self.max_queue)
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="campo-mdf")
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+    async def stop(self) -> None:
+        """Detiene los trabajadores; las soluciones en curso terminan antes."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._queue, self._slots, self._tasks, self._executor = None, None, [], None
+        self._holding.clear()
+
+    async def __aenter__(self) -> "SolveService":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    @property
+    def pending(self) -> int:
+        """Trabajos en cola."""
+        return sum(job.state == "queued" for job in self._jobs.values())
+
+    async def submit(self, job: dict, priority: int = 0, wait: bool = True) -> str:
+        """
+        Envía un trabajo y devuelve su id.
+
+        Si ya hay un trabajo idéntico en cola, en curso o terminado con éxito,
+        se devuelve su id sin encolar otro; si estaba en cola con menor
+        prioridad, se promueve. Un trabajo en curso cuya cancelación ya se
+        pidió no se reutiliza: se encola uno nuevo con el mismo id.
+
+        Parameters
+        ----------
+        job : dict
+            Trabajo con el formato de :func:`campo_estatico_mdf.cli.job_solver`.
+        priority : int, default=0
+            Prioridad (menor se atiende antes; a igual prioridad, en orden de
+            llegada).
+        wait : bool, default=True
+            Con la cola llena, espera a que haya espacio; si es ``False`` lanza
+            :class:`asyncio.QueueFull`.
+
+        Raises
+        ------
+        ValueError
+            Si el método no existe o el trabajo no es válido.
+        asyncio.QueueFull
+            Si la cola está llena y ``wait=False``.
+        """
+        if self._queue is None:
+            await self.start()
+        solver, method, params = job_solver(job)
+        if method not in METHODS:
+            raise ValueError(f"Método desconocido: {method!r}. Opciones: {', '.join(METHODS)}.")
+        key = solver._cache_key(method, params)
+
+        current = self._jobs.get(key)
+        if (
+            current is not None
+            and current.state in ("queued", "running", "done")
+            and not current.cancel_requested
+        ):
+            current.requests += 1
+            if current.state != "done":
+                current.waiting += 1
+            self._jobs.move_to_end(key)
+            if current.state == "queued" and priority < current.priority:
+                current.priority = priority
+                self._push(current)
+            return key
+
+        entry = Job(key, int(priority), "queued", solver, method, params, submitted=time.perf_counter())
+        if self.cache is not None and solver._load_cached(self.cache, key):
+            solver.method = method
+            entry.state, entry.finished = "done", entry.submitted
+        elif not wait and self._slots.locked():
+            raise asyncio.QueueFull
+        # Se registra antes de esperar espacio para que los envíos idénticos
+        # que lleguen mientras tanto se unan a este trabajo.
+        self._jobs[key] = entry
+        self._jobs.move_to_end(key)
+        event = self._done_events.setdefault(key, asyncio.Event())
+        event.clear()
+        if entry.state == "done":
+            event.set()
+        else:
+            await self._admit(entry)
+        self._evict()
+        return key
+
+    async def _admit(self, job: Job) -> None:
+        """Espera capacidad para ``job`` y lo encola."""
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            job.requests -= 1
+            job.waiting -= 1
+            if job.waiting > 0 and job.state == "queued":
+                # Otros envíos se unieron mientras se esperaba: siguen esperando.
+                self._tasks.append(asyncio.ensure_future(self._admit(job)))
+            elif job.state == "queued":
+                self._finish(job, "cancelled")
+            raise
+        if job.state != "queued":  # cancelado mientras esperaba
+            self._slots.release()
+            return
+        self._holding.add(id(job))
+        self._push(job)
+
+    def _release(self, job: Job) -> None:
+        """Libera la plaza de ``job`` al salir de la cola."""
+        if id(job) in self._holding:
+            self._holding.discard(id(job))
+            self._slots.release()
+
+    def _push(self, job: Job) -> None:
+        self._queue.put_nowait((job.priority, next(self._counter), job))
+
+    def status(self, job_id: str) -> Job | None:
+        """Trabajo ``job_id``, o ``None`` si no existe o ya se descartó."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Retira un envío de un trabajo en cola o en curso.
+
+        Cada llamada desvincula a uno de los envíos unidos (ver
+        :attr:`Job.waiting`); el trabajo solo se cancela cuando se retira el
+        último, de modo que los demás solicitantes siguen recibiendo el
+        resultado. Una solución en curso se interrumpe en su siguiente
+        verificación de convergencia si el método está instrumentado
+        (``"jacobi"``, ``"sor"``); los demás métodos terminan normalmente.
+
+        Returns
+        -------
+        bool
+            ``True`` si el trabajo seguía pendiente.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.state not in ("queued", "running"):
+            return False
+        job.waiting -= 1
+        if job.waiting > 0:
+            return True
+        job.cancel_requested = True
+        if job.state == "queued":
+            self._release(job)
+            self._finish(job, "cancelled")
+        return True
+
+    async def wait(self, job_id: str) -> Job:
+        """Espera a que ``job_id`` termine y devuelve el trabajo."""
+        await self._done_events[job_id].wait()
+        return self._jobs.get(job_id)
+
+    def _finish(self, job: Job, state: str, error: str | None = None) -> None:
+        job.state, job.error, job.finished = state, error, time.perf_counter()
+        if self._jobs.get(job.id) is not job:
+            # Trabajo cancelado y reemplazado por un envío posterior.
+            return
+        event = self._done_events.get(job.id)
+        if event is not None:
+            event.set()
+
+    def _evict(self) -> None:
+        """Descarta los trabajos terminados más antiguos por encima de ``keep``."""
+        finished = [k for k, j in self._jobs.items() if j.state in ("done", "failed", "cancelled")]
+        for key in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[key]
+            self._done_events.pop(key, None)
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, job = await self._queue.get()
+            try:
+                # Las entradas repetidas por promoción de prioridad se omiten.
+                if job.state != "queued":
+                    continue
+                self._release(job)
+                job.state, job.started = "running", time.perf_counter()
+                try:
+                    await loop.run_in_executor(self._executor, self._solve, job)
+                except _Cancelled:
+                    self._finish(job, "cancelled")
+                except Exception as exc:  # el error queda en el trabajo
+                    self._finish(job, "failed", f"{type(exc).__name__}: {exc}")
+                else:
+                    if self.cache is not None:
+                        job.solver._store_cached(self.cache, job.id)
+                    self._finish(job, "done")
+                self._evict()
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _solve(job: Job) -> None:
+        """Resuelve ``job`` en un hilo del grupo registrando el progreso."""
+        def progress(event) -> None:
+            if job.cancel_requested:
+                raise _Cancelled
+            if event.kind == "iteration":
+                job.history.append((event.iteration, event.max_diff))
+
+        job.solver.solve(job.method, recorder=Recorder(job.method, callbacks=[progress]), **job.params)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """
+        Atiende el servicio en un socket TCP local con mensajes JSON por líneas.
+
+        Mensajes (ver :func:`request`):
+
+        - ``{"op": "submit", "job": {...}, "priority": 0}`` → ``{"id": ...}``
+        - ``{"op": "status", "id": ...}`` → :meth:`Job.summary`
+        - ``{"op": "result", "id": ...}`` espera el final y añade ``"V"``
+        - ``{"op": "cancel", "id": ...}`` retira un envío → ``{"cancelled": bool}``
+
+        Con la cola llena, ``submit`` responde ``{"error": "busy"}`` en lugar de
+        esperar. Los errores se devuelven como ``{"error": mensaje}``.
+
+        Returns
+        -------
+        asyncio.AbstractServer
+            Servidor iniciado; el puerto asignado está en
+            ``server.sockets[0].getsockname()[1]``.
+        """
+        await self.start()
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                writer.write(json.dumps(await self._dispatch(json.loads(line))).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, message: dict) -> dict:
+        op = message.get("op")
+        try:
+            if op == "submit":
+                job_id = await self.submit(message["job"], int(message.get("priority", 0)), wait=False)
+                return {"id": job_id}
+            if op == "cancel":
+                return {"cancelled": self.cancel(message["id"])}
+            job = self.status(message["id"])
+            if job is None:
+                return {"error": f"Trabajo desconocido: {message['id']!r}."}
+            if op == "status":
+                return job.summary()
+            if op == "result":
+                job = await self.wait(job.id)
+                reply = job.summary()
+                if job.state == "done":
+                    reply["V"] = job.solver.V.tolist()
+                return reply
+            return {"error": f"Operación desconocida: {op!r}."}
+        except asyncio.QueueFull:
+            return {"error": "busy"}
+        except (KeyError, TypeError, ValueError) as exc:
+            return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def request(message: dict, host: str = "127.0.0.1", port: int = 8765, timeout: float | None = None) -> dict:
+    """Envía un mensaje a :meth:`SolveService.serve` y devuelve la respuesta."""
+    with socket.create_connection((host, port), timeout=timeout) as conn:
+        conn.sendall(json.dumps(message).encode() + b"\n")
+        with conn.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+class ServiceThread:
+    """
+    :class:`SolveService` en un hilo propio con su bucle de asyncio, para
+    usarlo desde código síncrono.
+
+    Parameters
+    ----------
+    **kwargs
+        Argumentos de :class:`SolveService`.
+
+    Examples
+    --------
+    >>> service = ServiceThread(workers=2)  # doctest: +SKIP
+    >>> job_id = service.submit({"N": 50, "right": 10.0, "tol": 1e-5})  # doctest: +SKIP
+    >>> service.status(job_id).state  # doctest: +SKIP
+    'running'
+    """
+
+    def __init__(self, **kwargs):
+        self.service = SolveService(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="campo-mdf-service", daemon=True)
+        self._thread.start()
+        self._call(self.service.start())
+
+    def _call(self, coro, timeout: float | None = None):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def submit(self, job: dict, priority: int = 0, wait: bool = True, timeout: float | None = None) -> str:
+        """Versión síncrona de :meth:`SolveService.submit`."""
+        return self._call(self.service.submit(job, priority, wait), timeout)
+
+    def status(self, job_id: str) -> Job | None:
+        """Trabajo ``job_id`` para consultar su estado (ver :class:`Job`)."""
+        return self.service.status(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Versión síncrona de :meth:`SolveService.cancel`."""
+        async def cancel() -> bool:
+            return self.service.cancel(job_id)
+
+        return self._call(cancel())
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Job:
+        """Bloquea hasta que ``job_id`` termine."""
+        return self._call(self.service.wait(job_id), timeout)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Expone el servicio en un socket local y devuelve el puerto."""
+        server = self._call(self.service.serve(host, port))
+        return server.sockets[0].getsockname()[1]
+
+    def close(self) -> None:
+        """Detiene el servicio y el hilo."""
+        self._call(self.service.stop())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
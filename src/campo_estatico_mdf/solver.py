@@ -1,11 +1,25 @@
 # src/campo_estatico_mdf/solver.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+import os
 import numpy as np
-from .grid import allocate_potential
+from .grid import allocate_potential, aspect_ratio, grid_shape, grid_spacing
 from .bc import edge_to_array, impose_dirichlet
 from .jacobi import jacobi_solve, ConvergenceInfo
-from .field import electric_field
+from .sor import sor_solve
+from .outofcore import WORKING_SET, tiled_jacobi_solve
+from .field import FieldQuantities, electric_field, field_quantities
+from .instrument import Recorder, resolve_recorder
+
+# Los demás backends (multigrid, cg, dst, direct, probe, cache, streaming,
+# amr, persist, superposition) se importan dentro de los métodos que los usan,
+# de modo que un solve con Jacobi o SOR (por ejemplo, desde la CLI) no los carga.
+
+#: Métodos de solución disponibles en :meth:`LaplaceSolver2D.solve`.
+METHODS = ("jacobi", "sor", "multigrid", "cg", "dst", "direct", "tiled", "adaptive")
+
+# Tolerancia mínima alcanzable en float32, relativa a la escala del potencial.
+_F32_TOL = 8 * float(np.finfo(np.float32).eps)
 
 @dataclass
 class BoundarySpec:
@@ -15,13 +29,13 @@ class BoundarySpec:
     Attributes
     ----------
     left : numpy.ndarray
-        Valores del borde izquierdo (longitud N).
+        Valores del borde izquierdo (longitud Ny).
     right : numpy.ndarray
-        Valores del borde derecho (longitud N).
+        Valores del borde derecho (longitud Ny).
     top : numpy.ndarray
-        Valores del borde superior (longitud N).
+        Valores del borde superior (longitud Nx).
     bottom : numpy.ndarray
-        Valores del borde inferior (longitud N).
+        Valores del borde inferior (longitud Nx).
     """
     left: np.ndarray
     right: np.ndarray
@@ -32,61 +46,254 @@ class BoundarySpec:
 class LaplaceSolver2D:
     """
     Interfaz de alto nivel para resolver la ecuación de Laplace en 2D sobre una
-    malla cuadrada mediante el método de Jacobi.
+    malla rectangular mediante métodos iterativos (Jacobi, SOR/Gauss–Seidel, multigrid,
+    gradiente conjugado)
+    o directos (transformada seno, factorización LU dispersa).
+
+    Admite además electrodos interiores de potencial fijo
+    (:meth:`set_electrodes`) y una densidad de carga :math:`\\rho`
+    (:meth:`set_source`), con lo que se resuelve
+    :math:`-\\nabla^2 V = \\rho / \\varepsilon`.
 
     Esta clase integra los distintos módulos del paquete:
 
     - :mod:`grid` para la creación de la malla del potencial,
     - :mod:`bc` para la gestión de las condiciones de frontera,
     - :mod:`jacobi` para la resolución iterativa de :math:`\\nabla^2 V = 0`,
+    - :mod:`sor` para la sobre-relajación sucesiva rojo-negro,
+    - :mod:`multigrid` para el multigrid geométrico,
+    - :mod:`cg` para el gradiente conjugado precondicionado sin matriz,
+    - :mod:`dst` para la solución directa con transformadas seno,
+    - :mod:`direct` para la factorización dispersa reutilizable,
     - :mod:`field` para calcular el campo eléctrico :math:`\\mathbf{E} = -\\nabla V`.
 
     Parameters
     ----------
-    N : int
-        Tamaño de la malla en cada dimensión (la malla es de ``N × N``).
+    N : int or tuple of int
+        Tamaño de la malla en cada dimensión (la malla es de ``N × N``), o
+        ``(Ny, Nx)`` para una malla rectangular de ``Ny`` filas y ``Nx``
+        columnas, sin relleno hasta el cuadrado.
     left, right, top, bottom : float or array_like
         Valores de Dirichlet para cada borde de la región.
-        Pueden ser escalares (frontera uniforme) o arreglos de longitud ``N``.
-    h : float, default=1.0
-        Tamaño de paso espacial (``Δx = Δy = h``).
+        Pueden ser escalares (frontera uniforme) o arreglos de longitud ``Ny``
+        (izquierdo y derecho) o ``Nx`` (superior e inferior).
+    h : float or tuple of float, default=1.0
+        Tamaño de paso espacial (``Δx = Δy = h``), o ``(hy, hx)``. Con pasos
+        distintos los kernels usan los pesos anisótropos del esquema de cinco
+        puntos (ver :func:`campo_estatico_mdf.grid.aspect_ratio`).
+    dtype : data-type, default=numpy.float64
+        Precisión de la malla, de las fronteras y de los kernels.
+        ``numpy.float32`` reduce a la mitad la memoria y el tiempo por barrido.
+    mixed_precision : bool, default=False
+        Si es ``True`` el potencial se guarda en ``float64`` pero los métodos
+        iterativos barren primero en ``float32`` y luego refinan en ``float64``
+        hasta cumplir la tolerancia pedida, registrando el residuo final en
+        ``float64``. Ignora ``dtype``.
+    path : str or os.PathLike or None, default=None
+        Archivo ``.npy`` de respaldo. Si se indica, ``V`` es un
+        :class:`numpy.memmap` sobre ese archivo y :meth:`solve_tiled` resuelve
+        sin cargar la malla completa en memoria; los demás métodos trabajan en
+        RAM y escriben el resultado de vuelta en el archivo. El potencial se
+        puede reabrir sin copia con
+        :func:`campo_estatico_mdf.outofcore.open_potential`.
 
     Attributes
     ----------
     V : numpy.ndarray
         Matriz del potencial incluyendo las condiciones de frontera.
-    h : float
-        Paso espacial asociado a la malla.
+    path : str or None
+        Archivo de respaldo de ``V``, o ``None`` si está en memoria.
+    N : int or tuple of int
+        ``N`` para una malla cuadrada o ``(Ny, Nx)``.
+    shape : tuple of int
+        Forma ``(Ny, Nx)`` de ``V``.
+    h : float or tuple of float
+        Paso espacial asociado a la malla: un ``float`` si ``hx == hy`` y
+        ``(hy, hx)`` en caso contrario.
+    spacing : tuple of float
+        Siempre ``(hy, hx)``.
+    aspect : float
+        :math:`(h_y / h_x)^2`; 1 con paso común.
+    dtype : numpy.dtype
+        Precisión con la que se almacena ``V``.
     boundary : BoundarySpec
         Estructura que contiene las cuatro fronteras normalizadas.
+    mask : numpy.ndarray of bool or None
+        Nodos interiores con potencial fijo (electrodos), o ``None``.
+    rho : numpy.ndarray or None
+        Densidad de carga en cada nodo, o ``None`` (ecuación de Laplace).
+    eps : float
+        Permitividad asociada a ``rho``.
     info : ConvergenceInfo
         Información de convergencia del último llamado al método de solución.
+    method : str or None
+        Método usado en la última llamada a :meth:`solve` o :meth:`iter_solve`.
+    adaptive : AdaptiveSolution or None
+        Solución sobre la malla cuaternaria de la última llamada a
+        :meth:`solve_adaptive`, o ``None``.
+    field : tuple of numpy.ndarray
+        Campo :math:`(E_x, E_y)` del potencial actual, calculado la primera vez
+        que se pide y reutilizado hasta que cambian ``V`` o ``h``.
+    quantities : FieldQuantities
+        :math:`|\\mathbf{E}|`, densidad de energía, energía total y carga de
+        cada borde, calculadas juntas y en caché como ``field``.
 
     Notes
     -----
     Las actualizaciones del interior de la malla siguen el esquema clásico
-    de 5 puntos del Laplaciano discreto en 2D.
+    de 5 puntos del Laplaciano discreto en 2D. ``"multigrid"`` y ``"cg"``
+    requieren ``hx == hy``; ``"adaptive"`` y :meth:`solve_superposition`,
+    además, una malla cuadrada.
     """
 
-    def __init__(self, N: int, left=0.0, right=0.0, top=0.0, bottom=0.0, h: float = 1.0):
-        self.N = int(N)
-        self.V, self.h = allocate_potential(self.N, h)
+    def __init__(
+        self,
+        N,
+        left=0.0, right=0.0, top=0.0, bottom=0.0,
+        h=1.0,
+        dtype=np.float64,
+        mixed_precision: bool = False,
+        path=None,
+    ):
+        Ny, Nx = grid_shape(N)
+        self.N = Ny if Ny == Nx else (Ny, Nx)
+        self.mixed_precision = bool(mixed_precision)
+        self.dtype = np.dtype(np.float64 if self.mixed_precision else dtype)
+        self.path = None if path is None else os.fspath(path)
+        self._field = self._quantities = None
+        self._interpolants = {}
+        self._V, self.h = allocate_potential(self.shape, h, self.dtype, self.path)
         self.boundary = self._normalize_boundaries(left, right, top, bottom)
         impose_dirichlet(
             self.V,
             self.boundary.left, self.boundary.right,
             self.boundary.top, self.boundary.bottom
         )
+        self.mask = None
+        self.rho = None
+        self.eps = 1.0
+        self.method = None
+        self.adaptive = None
         self.info = ConvergenceInfo(0, float("inf"), 0.0)
 
+    @property
+    def V(self) -> np.ndarray:
+        """Potencial actual; con ``path`` es el memmap del archivo de respaldo."""
+        return self._V
+
+    @V.setter
+    def V(self, value: np.ndarray) -> None:
+        if self.path is None:
+            self._V = value
+        elif value is not self._V:
+            self._V[...] = value
+        self.invalidate()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Forma ``(Ny, Nx)`` de la malla."""
+        return grid_shape(self.N)
+
+    @property
+    def h(self) -> float | tuple[float, float]:
+        """Paso espacial de la malla: ``h`` o ``(hy, hx)``."""
+        return self._h
+
+    @h.setter
+    def h(self, value) -> None:
+        hy, hx = grid_spacing(value)
+        self._h = hy if hy == hx else (hy, hx)
+        self.invalidate()
+
+    @property
+    def spacing(self) -> tuple[float, float]:
+        """Pasos ``(hy, hx)``."""
+        return grid_spacing(self._h)
+
+    @property
+    def aspect(self) -> float:
+        """Peso :math:`(h_y / h_x)^2` del esquema anisótropo (ver :func:`campo_estatico_mdf.grid.aspect_ratio`)."""
+        return aspect_ratio(self._h)
+
+    def invalidate(self) -> None:
+        """
+        Descarta el campo y las magnitudes derivadas en caché.
+
+        Se llama automáticamente al asignar ``V`` o ``h`` y en los métodos que
+        modifican ``V``; solo hace falta llamarlo tras editar ``V`` in-place
+        desde fuera de la clase.
+        """
+        self._field = self._quantities = None
+        self._interpolants = {}
+
+    @property
+    def field(self) -> tuple[np.ndarray, np.ndarray]:
+        """Campo :math:`(E_x, E_y)` en caché; los arreglos son de solo lectura."""
+        if self._field is None:
+            Ex, Ey = electric_field(self.V, self.h)
+            Ex.flags.writeable = Ey.flags.writeable = False
+            self._field = (Ex, Ey)
+        return self._field
+
+    @property
+    def quantities(self) -> FieldQuantities:
+        """
+        Magnitudes derivadas del campo en caché (ver
+        :func:`campo_estatico_mdf.field.field_quantities`), con la
+        permitividad ``eps``.
+        """
+        if self._quantities is None:
+            q = field_quantities(*self.field, self.h, self.eps)
+            q.magnitude.flags.writeable = q.energy_density.flags.writeable = False
+            self._quantities = q
+        return self._quantities
+
+    def interpolant(self, method: str = "bilinear") -> Interpolant:
+        """
+        Interpolador de la solución actual (ver
+        :class:`campo_estatico_mdf.probe.Interpolant`).
+
+        Sus coeficientes se calculan la primera vez y se reutilizan, como
+        :attr:`field`, hasta que cambian ``V`` o ``h``.
+        """
+        if method not in self._interpolants:
+            from .probe import Interpolant  # importación diferida: solo se carga al consultar
+
+            self._interpolants[method] = Interpolant(self.V, self.h, method, self.field)
+        return self._interpolants[method]
+
+    def probe(self, points, method: str = "bilinear") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evalúa el potencial y el campo en un lote de puntos arbitrarios.
+
+        Parameters
+        ----------
+        points : array_like of shape (M, 2)
+            Coordenadas físicas ``(x, y)``, con :math:`x = j h_x` y
+            :math:`y = i h_y` para el nodo ``V[i, j]``.
+        method : {"bilinear", "bicubic"}, default="bilinear"
+            Método de interpolación.
+
+        Returns
+        -------
+        V, Ex, Ey : numpy.ndarray of shape (M,)
+            Valores interpolados; ``nan`` fuera del dominio.
+
+        Examples
+        --------
+        >>> pts = np.random.rand(10**6, 2) * (solver.N - 1) * solver.h  # doctest: +SKIP
+        >>> V, Ex, Ey = solver.probe(pts, "bicubic")  # doctest: +SKIP
+        """
+        return self.interpolant(method)(points)
+
     def _normalize_boundaries(self, left, right, top, bottom) -> BoundarySpec:
-        """Convierte los valores de frontera en arreglos apropiados de longitud N."""
-        N = self.N
+        """Convierte los valores de frontera en arreglos de longitud ``Ny`` o ``Nx``."""
+        (Ny, Nx), dtype = self.shape, self.dtype
         return BoundarySpec(
-            edge_to_array(N, left),
-            edge_to_array(N, right),
-            edge_to_array(N, top),
-            edge_to_array(N, bottom),
+            edge_to_array(Ny, left, dtype),
+            edge_to_array(Ny, right, dtype),
+            edge_to_array(Nx, top, dtype),
+            edge_to_array(Nx, bottom, dtype),
         )
 
     def set_boundaries(self, left=None, right=None, top=None, bottom=None):
@@ -101,11 +308,11 @@ class LaplaceSolver2D:
             Si un parámetro es ``None``, se conserva el valor anterior.
         """
         b = self.boundary
-        self.boundary = BoundarySpec(
-            edge_to_array(self.N, b.left if left is None else left),
-            edge_to_array(self.N, b.right if right is None else right),
-            edge_to_array(self.N, b.top if top is None else top),
-            edge_to_array(self.N, b.bottom if bottom is None else bottom),
+        self.boundary = self._normalize_boundaries(
+            b.left if left is None else left,
+            b.right if right is None else right,
+            b.top if top is None else top,
+            b.bottom if bottom is None else bottom,
         )
 
         impose_dirichlet(
@@ -113,8 +320,157 @@ class LaplaceSolver2D:
             self.boundary.left, self.boundary.right,
             self.boundary.top, self.boundary.bottom
         )
+        self.invalidate()
+
+    def set_electrodes(self, mask, values=0.0):
+        """
+        Fija el potencial de un conjunto de nodos interiores (electrodos).
+
+        Los nodos marcados conservan su valor durante la solución; los bordes
+        de la malla siguen gobernados por :meth:`set_boundaries`.
+
+        Parameters
+        ----------
+        mask : array_like of bool of shape (Ny, Nx) or None
+            Nodos con potencial fijo. ``None`` elimina los electrodos.
+        values : float or array_like, default=0.0
+            Potencial de los electrodos; escalar o arreglo ``(Ny, Nx)`` del que
+            solo se usan los nodos de ``mask``.
+
+        Raises
+        ------
+        ValueError
+            Si ``mask`` no tiene la forma de ``V``.
+        """
+        if mask is None:
+            self.mask = None
+            return
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != self.V.shape:
+            raise ValueError(f"La máscara debe tener forma {self.V.shape}.")
+        mask = mask.copy()
+        mask[0, :] = mask[-1, :] = mask[:, 0] = mask[:, -1] = False
+        np.copyto(self.V, np.asarray(values, dtype=self.dtype), where=mask)
+        self.mask = mask if mask.any() else None
+        self.invalidate()
+
+    def set_source(self, rho, eps: float = 1.0):
+        """
+        Define la densidad de carga para resolver :math:`-\\nabla^2 V = \\rho / \\varepsilon`.
+
+        Parameters
+        ----------
+        rho : float or array_like of shape (Ny, Nx) or None
+            Densidad de carga por nodo. ``None`` vuelve a la ecuación de Laplace.
+        eps : float, default=1.0
+            Permitividad del medio.
+
+        Raises
+        ------
+        ValueError
+            Si ``eps <= 0`` o ``rho`` no es compatible con la malla.
+        """
+        self._quantities = None
+        if rho is None:
+            self.rho, self.eps = None, 1.0
+            return
+        if eps <= 0:
+            raise ValueError("eps debe ser positivo.")
+        try:
+            rho = np.broadcast_to(np.asarray(rho, dtype=np.float64), self.V.shape).copy()
+        except ValueError as exc:
+            raise ValueError(f"rho debe ser escalar o de forma {self.V.shape}.") from exc
+        self.rho, self.eps = rho, float(eps)
+
+    def _rhs(self):
+        """Término fuente escalado :math:`h_y^2 \\rho / \\varepsilon` o ``None``."""
+        if self.rho is None:
+            return None
+        return (self.rho * (self.spacing[0] ** 2 / self.eps)).astype(self.dtype, copy=False)
+
+    def _require_unmasked(self, method: str) -> None:
+        if self.mask is not None:
+            raise ValueError(
+                f"El método {method!r} no admite electrodos interiores; "
+                "use 'jacobi', 'sor' o 'direct'."
+            )
+
+    def _require_isotropic(self, method: str, square: bool = False) -> None:
+        if square and self.shape[0] != self.shape[1]:
+            raise ValueError(f"El método {method!r} requiere una malla cuadrada.")
+        if self.aspect != 1.0:
+            raise ValueError(
+                f"El método {method!r} requiere hx == hy; "
+                "use 'jacobi', 'sor', 'dst', 'direct' o 'tiled'."
+            )
+
+    def _run(self, kernel, tol: float, **kwargs) -> ConvergenceInfo:
+        """
+        Ejecuta un kernel iterativo sobre el potencial actual y guarda el
+        resultado en :attr:`V` e :attr:`info`.
+
+        Con ``mixed_precision`` el kernel se ejecuta primero en ``float32`` con
+        una tolerancia no inferior a la resolución de ``float32`` y después en
+        ``float64`` partiendo de ese resultado; las iteraciones se suman y el
+        residuo final en ``float64`` se añade a ``info.residuals``.
+
+        El término fuente y la máscara de electrodos, si existen, se pasan al
+        kernel como ``rhs`` y ``mask``. Un ``recorder`` en ``kwargs`` agrupa
+        ambos pasos en una sola medición.
+        """
+        recorder = kwargs.get("recorder")
+        if recorder is not None:
+            recorder.begin()
+        try:
+            self._run_kernel(kernel, tol, **kwargs)
+        except BaseException:
+            if recorder is not None:
+                recorder.abort()
+            raise
+        if recorder is not None:
+            recorder.finish(self.info)
+        return self.info
+
+    def _run_kernel(self, kernel, tol: float, **kwargs) -> None:
+        """Cuerpo de :meth:`_run`, sin la medición del ``recorder``."""
+        b = self.boundary
+        edges = (b.left, b.right, b.top, b.bottom)
+        rhs = self._rhs()
+        if rhs is not None:
+            kwargs["rhs"] = rhs
+        if self.mask is not None:
+            kwargs["mask"] = self.mask
+        if self.aspect != 1.0:
+            kwargs["aspect"] = self.aspect
+        if not self.mixed_precision:
+            self.V, self.info = kernel(self.V, *edges, tol=tol, **kwargs)
+            return
+
+        scale = max(1.0, *(float(np.abs(e).max()) for e in edges))
+        V32, coarse = kernel(
+            self.V.astype(np.float32), *edges, tol=max(tol, _F32_TOL * scale), **kwargs
+        )
+        V64 = V32.astype(np.float64)
+        if self.mask is not None:
+            np.copyto(V64, self.V, where=self.mask)
+        self.V, self.info = kernel(V64, *edges, tol=tol, **kwargs)
+        self.info.iterations += coarse.iterations
+        self.info.residuals = coarse.residuals + self.info.residuals
+        from .multigrid import residual  # importación diferida: solo se carga al usar este método
+
+        r = residual(self.V, rhs, self.aspect)
+        if self.mask is not None:
+            r[self.mask] = 0.0
+        self.info.residuals.append(float(np.abs(r).max()))
 
-    def solve_jacobi(self, tol: float = 1e-5, max_iter: int = 10000) -> ConvergenceInfo:
+    def solve_jacobi(
+        self,
+        tol: float = 1e-5,
+        max_iter: int = 10000,
+        check_every: int = 1,
+        workers: int = 1,
+        recorder=None,
+    ) -> ConvergenceInfo:
         """
         Ejecuta el método de Jacobi hasta que la actualización máxima sea menor
         que ``tol`` o hasta cumplir ``max_iter``.
@@ -125,28 +481,677 @@ class LaplaceSolver2D:
             Tolerancia de convergencia basada en la norma infinito.
         max_iter : int, default=10000
             Número máximo de iteraciones permitidas.
+        check_every : int, default=1
+            Frecuencia (en barridos) con la que se evalúa la convergencia.
+        workers : int, default=1
+            Número de hilos para el barrido por franjas (``0`` usa todos los
+            núcleos). El resultado no depende de este valor.
+        recorder : Recorder or None, default=None
+            Recolector de métricas (:class:`campo_estatico_mdf.instrument.Recorder`).
 
         Returns
         -------
         ConvergenceInfo
             Información de la convergencia del proceso iterativo.
         """
-        self.V, self.info = jacobi_solve(
+        return self._run(
+            jacobi_solve,
+            tol=tol, max_iter=max_iter, check_every=check_every, workers=workers,
+            recorder=resolve_recorder(recorder, "jacobi"),
+        )
+
+    def solve_sor(
+        self,
+        omega: float | None = None,
+        tol: float = 1e-5,
+        max_iter: int = 10000,
+        workers: int = 1,
+        recorder=None,
+    ) -> ConvergenceInfo:
+        """
+        Ejecuta SOR rojo-negro (Gauss–Seidel si ``omega = 1``) hasta que la
+        actualización máxima de un barrido sea menor que ``tol``.
+
+        Parameters
+        ----------
+        omega : float or None, default=None
+            Factor de relajación. Si es ``None`` se usa el valor óptimo para la
+            malla cuadrada (:func:`campo_estatico_mdf.sor.optimal_omega`).
+        tol : float, default=1e-5
+            Tolerancia de convergencia basada en la norma infinito.
+        max_iter : int, default=10000
+            Número máximo de barridos permitidos.
+        workers : int, default=1
+            Número de hilos para el barrido por franjas (``0`` usa todos los
+            núcleos). El resultado no depende de este valor.
+        recorder : Recorder or None, default=None
+            Recolector de métricas (:class:`campo_estatico_mdf.instrument.Recorder`).
+
+        Returns
+        -------
+        ConvergenceInfo
+            Información de la convergencia del proceso iterativo.
+        """
+        return self._run(
+            sor_solve,
+            omega=omega, tol=tol, max_iter=max_iter, workers=workers,
+            recorder=resolve_recorder(recorder, "sor"),
+        )
+
+    def solve_multigrid(
+        self,
+        tol: float = 1e-5,
+        max_cycles: int = 50,
+        nu1: int = 2,
+        nu2: int = 2,
+        fmg: bool = True,
+    ) -> ConvergenceInfo:
+        """
+        Resuelve con multigrid geométrico (ciclos V, inicialización FMG opcional).
+
+        Parameters
+        ----------
+        tol : float, default=1e-5
+            Tolerancia sobre la máxima variación del potencial en un ciclo.
+        max_cycles : int, default=50
+            Número máximo de ciclos V.
+        nu1, nu2 : int, default=2
+            Barridos de pre- y post-suavizado.
+        fmg : bool, default=True
+            Usa multigrid completo para la aproximación inicial.
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``iterations`` cuenta ciclos; ``residuals`` guarda el residuo inicial
+            y el de cada ciclo.
+
+        Raises
+        ------
+        ValueError
+            Si hay electrodos interiores o ``hx != hy``.
+        """
+        from .multigrid import multigrid_solve  # importación diferida: solo se carga al usar este método
+
+        self._require_unmasked("multigrid")
+        self._require_isotropic("multigrid")
+        return self._run(
+            multigrid_solve,
+            tol=tol, max_cycles=max_cycles, nu1=nu1, nu2=nu2, fmg=fmg
+        )
+
+    def solve_cg(
+        self,
+        tol: float = 1e-8,
+        max_iter: int = 10000,
+        preconditioner: str = "multigrid",
+    ) -> ConvergenceInfo:
+        """
+        Resuelve con gradiente conjugado precondicionado sin matriz.
+
+        Parameters
+        ----------
+        tol : float, default=1e-8
+            Tolerancia sobre la norma relativa del residuo.
+        max_iter : int, default=10000
+            Número máximo de iteraciones.
+        preconditioner : {"none", "jacobi", "sgs", "multigrid"}, default="multigrid"
+            Precondicionador (ver :func:`campo_estatico_mdf.cg.cg_solve`).
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``residuals`` guarda la norma relativa del residuo por iteración.
+
+        Raises
+        ------
+        ValueError
+            Si hay electrodos interiores o ``hx != hy``.
+        """
+        from .cg import cg_solve  # importación diferida: solo se carga al usar este método
+
+        self._require_unmasked("cg")
+        self._require_isotropic("cg")
+        return self._run(cg_solve, tol=tol, max_iter=max_iter, preconditioner=preconditioner)
+
+    def solve_dst(self, tol: float | None = None) -> ConvergenceInfo:
+        """
+        Resuelve de forma directa con transformadas seno (DST-I), sin iteraciones
+        ni tolerancia.
+
+        Parameters
+        ----------
+        tol : float or None, default=None
+            Ignorado; se acepta para que :meth:`solve` reciba los mismos
+            argumentos con cualquier método.
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``iterations = 0`` y el residuo alcanzado en ``max_diff``.
+
+        Raises
+        ------
+        ValueError
+            Si hay electrodos interiores.
+        """
+        from .dst import dst_solve  # importación diferida: solo se carga al usar este método
+
+        self._require_unmasked("dst")
+        self.V, self.info = dst_solve(
             self.V,
             self.boundary.left, self.boundary.right,
             self.boundary.top, self.boundary.bottom,
-            tol=tol, max_iter=max_iter
+            rhs=self._rhs(), aspect=self.aspect,
+        )
+        return self.info
+
+    def solve_direct(self, tol: float | None = None) -> ConvergenceInfo:
+        """
+        Resuelve con una factorización LU dispersa del operador de cinco puntos.
+
+        Admite electrodos interiores y término fuente. La factorización depende
+        solo de ``N`` y de la máscara de electrodos y se reutiliza entre
+        llamadas (ver :func:`campo_estatico_mdf.direct.get_factorization`), de
+        modo que cambiar fronteras, tensiones de electrodos o ``rho`` solo
+        cuesta una sustitución.
+
+        Parameters
+        ----------
+        tol : float or None, default=None
+            Ignorado; se acepta para que :meth:`solve` reciba los mismos
+            argumentos con cualquier método.
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``iterations = 0`` y el residuo alcanzado en ``max_diff``.
+
+        Raises
+        ------
+        ImportError
+            Si SciPy no está instalado (extra ``direct``).
+        """
+        from .direct import direct_solve  # importación diferida: solo se carga al usar este método
+
+        b = self.boundary
+        self.V, self.info = direct_solve(
+            self.V, b.left, b.right, b.top, b.bottom, rhs=self._rhs(), mask=self.mask,
+            aspect=self.aspect,
         )
         return self.info
 
+    def solve_tiled(
+        self,
+        tol: float = 1e-5,
+        max_iter: int = 10000,
+        check_every: int = 1,
+        tile_rows: int | None = None,
+        working_set: int = WORKING_SET,
+    ) -> ConvergenceInfo:
+        """
+        Ejecuta Jacobi in-place por franjas con memoria de trabajo acotada
+        (ver :func:`campo_estatico_mdf.outofcore.tiled_jacobi_solve`).
+
+        Con ``path`` la malla se procesa directamente sobre el archivo, sin
+        copias completas en memoria (la máscara de electrodos y ``rho``, si
+        existen, sí se mantienen en RAM). El resultado coincide con
+        :meth:`solve_jacobi` con el mismo ``check_every``.
+
+        Parameters
+        ----------
+        tol : float, default=1e-5
+            Tolerancia de convergencia basada en la norma infinito.
+        max_iter : int, default=10000
+            Número máximo de barridos.
+        check_every : int, default=1
+            Frecuencia con la que se evalúa la convergencia.
+        tile_rows : int or None, default=None
+            Filas por franja; por defecto se deducen de ``working_set``.
+        working_set : int, default=64 MiB
+            Memoria de trabajo aproximada en bytes.
+
+        Returns
+        -------
+        ConvergenceInfo
+            Información de la convergencia del proceso iterativo.
+        """
+        b = self.boundary
+        self.V, self.info = tiled_jacobi_solve(
+            self.V, b.left, b.right, b.top, b.bottom,
+            tol=tol, max_iter=max_iter, check_every=check_every,
+            tile_rows=tile_rows, working_set=working_set,
+            rhs=self._rhs(), mask=self.mask, aspect=self.aspect,
+        )
+        return self.info
+
+    def solve_adaptive(
+        self,
+        tol: float = 1e-2,
+        base: int = 4,
+        max_level: int | None = None,
+        max_cycles: int | None = None,
+    ) -> ConvergenceInfo:
+        """
+        Resuelve sobre una malla cuaternaria adaptativa y remuestrea en ``V``.
+
+        La malla se refina solo donde el potencial varía rápido (por ejemplo, en
+        las esquinas donde saltan las fronteras), con la misma resolución más
+        fina que la malla uniforme pero muchas menos incógnitas (ver
+        :func:`campo_estatico_mdf.amr.adaptive_solve`). La solución compuesta
+        queda en :attr:`adaptive` y ``V`` recibe su remuestreo bilineal, de
+        modo que ``field``, :mod:`campo_estatico_mdf.visual` y el resto de la
+        interfaz funcionan igual.
+
+        Parameters
+        ----------
+        tol : float, default=1e-2
+            Variación máxima admitida del potencial dentro de una celda.
+        base : int, default=4
+            Celdas por lado del nivel 0.
+        max_level : int or None, default=None
+            Nivel máximo de refinamiento; por defecto, el menor cuya celda más
+            fina no supera ``h``.
+        max_cycles : int or None, default=None
+            Ciclos de solución y refinamiento.
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``iterations`` es el número de ciclos y ``max_diff`` el mayor
+            indicador de las celdas finales.
+
+        Raises
+        ------
+        ValueError
+            Si hay electrodos interiores o término fuente, o si la malla no
+            es cuadrada con ``hx == hy``.
+        ImportError
+            Si SciPy no está instalado (extra ``direct``).
+        """
+        from .amr import adaptive_solve  # importación local para evitar dependencias circulares
+
+        self._require_unmasked("adaptive")
+        self._require_isotropic("adaptive", square=True)
+        if self.rho is not None:
+            raise ValueError("El método 'adaptive' no admite término fuente.")
+        if max_level is None:
+            max_level = max(0, int(np.ceil(np.log2((self.N - 1) / base))))
+        b = self.boundary
+        self.adaptive, info = adaptive_solve(
+            b.left, b.right, b.top, b.bottom,
+            length=(self.N - 1) * self.h, base=base, max_level=max_level,
+            tol=tol, max_cycles=max_cycles,
+        )
+        V = self.adaptive.to_uniform(self.N).astype(self.dtype, copy=False)
+        impose_dirichlet(V, b.left, b.right, b.top, b.bottom)
+        self.V[...] = V
+        self.invalidate()
+        self.info = info
+        return self.info
+
+    def solve_superposition(self, method: str = "dst", tol: float = 1e-8) -> ConvergenceInfo:
+        """
+        Reconstruye el potencial como suma ponderada de soluciones base.
+
+        La base se obtiene de :func:`campo_estatico_mdf.superposition.get_basis`
+        y se reutiliza entre llamadas con los mismos ``(N, h, method, tol)``,
+        de modo que tras :meth:`set_boundaries` la nueva solución cuesta una suma
+        :math:`O(N^2)` por borde uniforme.
+
+        Parameters
+        ----------
+        method : str, default="dst"
+            Método con el que se calcula la base.
+        tol : float, default=1e-8
+            Tolerancia de la base para métodos iterativos.
+
+        Returns
+        -------
+        ConvergenceInfo
+            ``iterations = 0`` y el peor ``max_diff`` de la base.
+
+        Raises
+        ------
+        ValueError
+            Si hay electrodos interiores o término fuente, o si la malla no
+            es cuadrada con ``hx == hy``.
+        """
+        self._require_unmasked("superposition")
+        self._require_isotropic("superposition", square=True)
+        if self.rho is not None:
+            raise ValueError("El método 'superposition' no admite término fuente.")
+        from .superposition import get_basis  # importación local para evitar dependencias circulares
+
+        basis = get_basis(self.N, self.h, method, float(tol))
+        b = self.boundary
+        self.V = basis.combine(b.left, b.right, b.top, b.bottom).astype(self.dtype, copy=False)
+        self.info = ConvergenceInfo(0, basis.info.max_diff, basis.info.tol)
+        return self.info
+
+    def solve(
+        self,
+        method: str = "jacobi",
+        cache=None,
+        recorder=None,
+        checkpoint=None,
+        checkpoint_every: int = 1000,
+        **kwargs,
+    ) -> ConvergenceInfo:
+        """
+        Resuelve con el método indicado por nombre.
+
+        Permite cambiar de método sin modificar el resto del código: equivale a
+        llamar ``solve_<method>(**kwargs)``.
+
+        Parameters
+        ----------
+        method : {"jacobi", "sor", "multigrid", "cg", "dst", "direct", "tiled", "adaptive"}, default="jacobi"
+            Nombre del método (ver :data:`METHODS`).
+        cache : SolutionCache or None, default=None
+            Caché de soluciones (:class:`campo_estatico_mdf.cache.SolutionCache`).
+            Si contiene una solución para los mismos ``N``, ``h``, fronteras,
+            método y argumentos, se reutiliza sin resolver; en caso contrario la
+            nueva solución y su campo eléctrico se guardan en ella.
+        recorder : Recorder or None, default=None
+            Recolector de :mod:`campo_estatico_mdf.instrument`. Con cualquier
+            método mide el tiempo total y el pico de memoria; con ``"jacobi"`` y
+            ``"sor"`` también las fases del kernel, MLUPS y el residuo
+            muestreado. Si hay suscriptores globales se crea uno
+            automáticamente.
+        checkpoint : str or os.PathLike or None, default=None
+            Directorio de checkpoint (solo ``"jacobi"`` y ``"sor"``). El estado
+            se guarda con :meth:`save` cada ``checkpoint_every`` iteraciones y al
+            terminar. Si el directorio ya contiene un checkpoint del mismo
+            problema, la solución se reanuda desde él con el mismo conteo de
+            iteraciones y el mismo resultado que sin interrupción.
+        checkpoint_every : int, default=1000
+            Iteraciones entre checkpoints.
+        **kwargs
+            Argumentos propios del método elegido.
+
+        Returns
+        -------
+        ConvergenceInfo
+            Información de la convergencia.
+
+        Raises
+        ------
+        ValueError
+            Si ``method`` no es reconocido, o si el checkpoint no es aplicable
+            al método o no corresponde al problema actual.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Método desconocido: {method!r}. Opciones: {', '.join(METHODS)}.")
+        key = None if cache is None else self._cache_key(method, kwargs)
+        if key is not None and self._load_cached(cache, key):
+            self.method = method
+            return self.info
+
+        self.method = method
+        recorder = resolve_recorder(recorder, method)
+        if checkpoint is not None:
+            self._solve_checkpointed(method, checkpoint, checkpoint_every, recorder, kwargs)
+        elif recorder is None:
+            getattr(self, f"solve_{method}")(**kwargs)
+        else:
+            from .streaming import STREAMING_METHODS
+
+            recorder.begin(method)
+            if method in STREAMING_METHODS:
+                kwargs["recorder"] = recorder
+            try:
+                getattr(self, f"solve_{method}")(**kwargs)
+            except BaseException:
+                recorder.abort()
+                raise
+            recorder.finish(self.info)
+        if key is not None:
+            self._store_cached(cache, key)
+        return self.info
+
+    def _solve_checkpointed(self, method, path, every, recorder, kwargs) -> None:
+        """Cuerpo de :meth:`solve` con checkpoints periódicos y reanudación."""
+        from .persist import CHECKPOINT_METHODS, Checkpointer, load_solver, read_meta, save_solver
+
+        if method not in CHECKPOINT_METHODS or self.mixed_precision:
+            raise ValueError(
+                f"Los checkpoints solo se admiten con {', '.join(CHECKPOINT_METHODS)} "
+                "y sin precisión mixta."
+            )
+        tol = kwargs.get("tol", 1e-5)
+        max_iter = kwargs.get("max_iter", 10000)
+        offset = 0
+        if os.path.exists(os.path.join(os.fspath(path), "meta.json")):
+            saved = load_solver(path)
+            if not self._same_problem(saved, method):
+                raise ValueError(f"El checkpoint {os.fspath(path)!r} no corresponde a este problema.")
+            self.V = np.array(saved.V)
+            self.info = saved.info
+            if read_meta(path)["complete"] or saved.info.iterations >= max_iter:
+                return
+            offset = saved.info.iterations
+
+        recorder = Recorder(method) if recorder is None else recorder
+        recorder.callbacks.append(Checkpointer(self, path, method, every, offset, tol))
+        recorder.begin(method)
+        try:
+            getattr(self, f"solve_{method}")(**dict(kwargs, max_iter=max_iter - offset, recorder=recorder))
+        except BaseException:
+            recorder.abort()
+            raise
+        self.info.iterations += offset
+        recorder.finish(self.info)
+        save_solver(self, path, method)
+
+    def _same_problem(self, other, method: str) -> bool:
+        """Indica si ``other`` describe el mismo problema discreto y método."""
+        a, b = self.boundary, other.boundary
+        return (
+            other.N == self.N and other.h == self.h and other.dtype == self.dtype
+            and other.method == method
+            and all(np.array_equal(x, y) for x, y in zip(
+                (a.left, a.right, a.top, a.bottom), (b.left, b.right, b.top, b.bottom)))
+            and other._problem_params() == self._problem_params()
+        )
+
+    def save(self, path, field: bool = False) -> None:
+        """
+        Guarda el solver en el directorio ``path`` (ver
+        :func:`campo_estatico_mdf.persist.save_solver`).
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Directorio de destino; se sustituye de forma atómica si existe.
+        field : bool, default=False
+            Guarda también el campo eléctrico.
+        """
+        from .persist import save_solver  # importación local para evitar dependencias circulares
+
+        save_solver(self, path, field=field)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "LaplaceSolver2D":
+        """
+        Carga un solver guardado con :meth:`save`.
+
+        Con ``mmap=True`` los arreglos se mapean en memoria en modo
+        copia-en-escritura, de modo que la carga no lee la malla completa.
+
+        Returns
+        -------
+        LaplaceSolver2D
+            Solver restaurado.
+        """
+        from .persist import load_solver  # importación local para evitar dependencias circulares
+
+        return load_solver(path, mmap)
+
+    def iter_solve(
+        self,
+        method: str = "jacobi",
+        every: int = 10,
+        snapshot: int | None = None,
+        cache=None,
+        tol: float = 1e-5,
+        max_iter: int = 10000,
+        **kwargs,
+    ):
+        """
+        Resuelve paso a paso, entregando el avance cada ``every`` barridos.
+
+        Es un generador: cada registro :class:`~campo_estatico_mdf.streaming.Progress`
+        indica la iteración, ``max_diff``, el tiempo transcurrido y, si se pide,
+        una vista submuestreada del potencial. Tras cada registro :attr:`V` e
+        :attr:`info` reflejan el estado actual, de modo que cerrar el generador
+        (``close()``, ``break`` o recolección) detiene la solución y deja el
+        último potencial calculado.
+
+        Parameters
+        ----------
+        method : {"jacobi", "sor"}, default="jacobi"
+            Método iterativo.
+        every : int, default=10
+            Barridos entre registros. Con Jacobi también es la frecuencia con la
+            que se evalúa la convergencia (``check_every``).
+        snapshot : int or None, default=None
+            Tamaño máximo por lado de la vista ``Progress.V``; ``None`` no la
+            genera.
+        cache : SolutionCache or None, default=None
+            Caché de soluciones compartida con :meth:`solve`. En un acierto se
+            entrega un único registro final; una solución completada se guarda
+            en ella (una cancelada, no).
+        tol : float, default=1e-5
+            Tolerancia sobre la máxima actualización absoluta.
+        max_iter : int, default=10000
+            Número máximo de barridos.
+        **kwargs
+            Argumentos adicionales del método: solo ``omega`` con ``"sor"``
+            (ver :data:`campo_estatico_mdf.streaming.STEP_OPTIONS`). Opciones de
+            :meth:`solve` como ``workers``, ``check_every`` o ``recorder`` no
+            se admiten; la frecuencia de verificación es ``every``.
+
+        Yields
+        ------
+        Progress
+            Avance de la solución; el último tiene ``converged=True`` salvo que
+            se agote ``max_iter``.
+
+        Raises
+        ------
+        ValueError
+            Si ``method`` no admite solución por pasos o ``kwargs`` contiene
+            argumentos que el método por pasos no acepta.
+
+        Notes
+        -----
+        El potencial final coincide con ``solve_jacobi(check_every=every)`` o
+        con ``solve_sor``. Con ``mixed_precision`` los barridos se hacen en
+        ``float64``.
+        """
+        from .streaming import (
+            STEP_OPTIONS, STREAMING_METHODS, Progress, downsample, jacobi_steps, sor_steps, timed,
+        )
+
+        if method not in STREAMING_METHODS:
+            raise ValueError(
+                f"Método sin solución por pasos: {method!r}. "
+                f"Opciones: {', '.join(STREAMING_METHODS)}."
+            )
+        unsupported = sorted(set(kwargs) - set(STEP_OPTIONS[method]))
+        if unsupported:
+            raise ValueError(
+                f"iter_solve({method!r}) no admite {', '.join(map(repr, unsupported))}; "
+                "use solve() para esas opciones (la frecuencia de verificación es 'every')."
+            )
+        self.method = method
+        params = dict(tol=tol, max_iter=max_iter, **kwargs)
+        if method == "jacobi":
+            params["check_every"] = every
+        key = None if cache is None else self._cache_key(method, params)
+        if key is not None and self._load_cached(cache, key):
+            info = self.info
+            yield Progress(
+                info.iterations, info.max_diff, 0.0, info.max_diff < tol,
+                downsample(self.V, snapshot),
+            )
+            return
+
+        b = self.boundary
+        steps = (jacobi_steps if method == "jacobi" else sor_steps)(
+            self.V, b.left, b.right, b.top, b.bottom,
+            tol=tol, max_iter=max_iter, every=every,
+            rhs=self._rhs(), mask=self.mask, aspect=self.aspect, **kwargs
+        )
+        stream = timed(steps, tol, snapshot)
+        finished = False
+        try:
+            for V, progress in stream:
+                self.V = V
+                self.info = ConvergenceInfo(progress.iteration, progress.max_diff, float(tol))
+                yield progress
+            finished = True
+        finally:
+            stream.close()
+        if finished and key is not None:
+            self._store_cached(cache, key)
+
+    def _cache_key(self, method: str, kwargs: dict) -> str:
+        """Clave de :mod:`campo_estatico_mdf.cache` del problema actual."""
+        from .cache import solution_key
+
+        return solution_key(
+            self.N, self.h, self.boundary, method,
+            dtype=self.dtype.str, mixed_precision=self.mixed_precision,
+            **self._problem_params(), **kwargs
+        )
+
+    def _load_cached(self, cache, key: str) -> bool:
+        """Carga la entrada ``key`` en :attr:`V` e :attr:`info` si existe."""
+        entry = cache.get(key)
+        if entry is None:
+            return False
+        self.V = entry.V.copy()
+        self._field = (entry.Ex, entry.Ey)
+        self.info = replace(entry.info, residuals=list(entry.info.residuals))
+        return True
+
+    def _store_cached(self, cache, key: str) -> None:
+        """Guarda la solución actual y su campo eléctrico bajo ``key``."""
+        from .cache import CachedSolution
+
+        Ex, Ey = self.field
+        info = replace(self.info, residuals=list(self.info.residuals))
+        cache.put(key, CachedSolution(self.V.copy(), Ex, Ey, info))
+
+    def _problem_params(self) -> dict:
+        """Resúmenes de electrodos y fuente para la clave de la caché."""
+        import hashlib
+
+        params = {}
+        if self.mask is not None:
+            digest = hashlib.sha256(np.packbits(self.mask).tobytes())
+            digest.update(np.ascontiguousarray(self.V[self.mask], dtype=np.float64).tobytes())
+            params["electrodes"] = digest.hexdigest()
+        if self.rho is not None:
+            params["rho"] = hashlib.sha256(self.rho.tobytes()).hexdigest()
+            params["eps"] = self.eps
+        return params
+
     def electric_field(self):
         """
-        Calcula y devuelve las componentes del campo eléctrico
-        :math:`(E_x, E_y)` a partir del potencial actual.
+        Devuelve las componentes del campo eléctrico :math:`(E_x, E_y)` del
+        potencial actual.
+
+        El campo se calcula solo la primera vez y se reutiliza hasta que
+        cambian ``V`` o ``h`` (ver :attr:`field`); también se toma de la caché
+        de soluciones o del archivo cargado cuando están disponibles.
 
         Returns
         -------
         Ex, Ey : numpy.ndarray
-            Componentes del campo eléctrico con la misma forma que ``V``.
+            Componentes del campo eléctrico con la misma forma que ``V``, de
+            solo lectura.
         """
-        return electric_field(self.V, self.h)
+        return self.field
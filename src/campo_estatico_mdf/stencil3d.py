@@ -0,0 +1,286 @@
+# src/campo_estatico_mdf/stencil3d.py
+from __future__ import annotations
+import numpy as np
+from .jacobi import ConvergenceInfo
+from .outofcore import WORKING_SET, tile_rows_for
+from .sor import optimal_omega
+
+# Subredes (plano, fila, columna) iniciales de cada color: (i + j + k) par → rojo.
+_RED = ((2, 2, 2), (2, 1, 1), (1, 2, 1), (1, 1, 2))
+_BLACK = ((1, 1, 1), (1, 2, 2), (2, 1, 2), (2, 2, 1))
+
+
+def face_to_array(N: int, val, dtype=np.float64) -> np.ndarray:
+    """
+    Normaliza un valor escalar o una matriz para representar una cara de
+    Dirichlet de la malla cúbica como un arreglo ``(N, N)``.
+
+    Raises
+    ------
+    ValueError
+        Si ``val`` es un arreglo de forma distinta de ``(N, N)``.
+    """
+    if np.isscalar(val):
+        return np.full((N, N), float(val), dtype=dtype)
+    arr = np.asarray(val, dtype=dtype)
+    if arr.shape != (N, N):
+        raise ValueError("Cada cara debe ser un escalar o una matriz de forma (N, N).")
+    return arr
+
+
+def impose_dirichlet_3d(V: np.ndarray, left, right, top, bottom, front, back) -> None:
+    """
+    Aplica in-place las seis caras de Dirichlet sobre ``V`` de forma
+    ``(N, N, N)``.
+
+    Se sigue el convenio ``V[z, y, x]`` y, en cada plano ``z``, el de
+    :func:`campo_estatico_mdf.bc.impose_dirichlet`:
+
+    - **left** → ``V[:, :, 0]``, **right** → ``V[:, :, -1]``
+    - **top** → ``V[:, 0, :]``, **bottom** → ``V[:, -1, :]``
+    - **front** → ``V[0]``, **back** → ``V[-1]``
+
+    Las caras se escriben en ese orden, de modo que en las aristas comunes
+    prevalece la última.
+    """
+    N = V.shape[0]
+    V[:, :, 0] = face_to_array(N, left, V.dtype)
+    V[:, :, -1] = face_to_array(N, right, V.dtype)
+    V[:, 0, :] = face_to_array(N, top, V.dtype)
+    V[:, -1, :] = face_to_array(N, bottom, V.dtype)
+    V[0] = face_to_array(N, front, V.dtype)
+    V[-1] = face_to_array(N, back, V.dtype)
+
+
+def _jacobi_sweep_3d(src: np.ndarray, dst: np.ndarray, rhs=None, mask=None) -> None:
+    """
+    Barrido de Jacobi de siete puntos de ``src`` hacia ``dst`` sin temporales;
+    solo se escribe el interior ``dst[1:-1, 1:-1, 1:-1]``.
+    """
+    inner = dst[1:-1, 1:-1, 1:-1]
+    np.add(src[1:-1, 1:-1, 2:], src[1:-1, 1:-1, :-2], out=inner)
+    np.add(inner, src[1:-1, 2:, 1:-1], out=inner)
+    np.add(inner, src[1:-1, :-2, 1:-1], out=inner)
+    np.add(inner, src[2:, 1:-1, 1:-1], out=inner)
+    np.add(inner, src[:-2, 1:-1, 1:-1], out=inner)
+    if rhs is not None:
+        np.add(inner, rhs[1:-1, 1:-1, 1:-1], out=inner)
+    np.multiply(inner, 1.0 / 6.0, out=inner)
+    if mask is not None:
+        np.copyto(inner, src[1:-1, 1:-1, 1:-1], where=mask[1:-1, 1:-1, 1:-1])
+
+
+def jacobi3d_solve(
+    V: np.ndarray,
+    left, right, top, bottom, front, back,
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    check_every: int = 1,
+    slab: int | None = None,
+    working_set: int = WORKING_SET,
+    rhs=None,
+    mask=None,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    Método de Jacobi de siete puntos que actualiza ``V`` in-place.
+
+    La malla se recorre por bloques de ``slab`` planos ``z``: cada bloque se
+    copia con sus planos de halo a un búfer, se le aplica el esquema y se
+    escribe de vuelta, conservando aparte el valor anterior del último plano
+    escrito (igual que :func:`campo_estatico_mdf.outofcore.tiled_jacobi_solve`
+    en 2D). Así la memoria adicional es de unos pocos planos en lugar de una
+    segunda copia de la malla, y el resultado es el de Jacobi exacto.
+
+    Parameters
+    ----------
+    V : numpy.ndarray of shape (N, N, N)
+        Potencial inicial con el convenio ``V[z, y, x]``; se modifica in-place.
+    left, right, top, bottom, front, back : float or array_like
+        Caras de Dirichlet (ver :func:`impose_dirichlet_3d`).
+    tol : float, default=1e-5
+        Tolerancia sobre la máxima diferencia entre iteraciones.
+    max_iter : int, default=10000
+        Número máximo de barridos.
+    check_every : int, default=1
+        Frecuencia con la que se evalúa la convergencia.
+    slab : int or None, default=None
+        Planos interiores por bloque; si es ``None`` se deduce de
+        ``working_set``.
+    working_set : int, default=64 MiB
+        Memoria de trabajo aproximada en bytes cuando ``slab`` es ``None``.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f` para :math:`-\\nabla^2 V = f`.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        El mismo arreglo ``V`` con la solución.
+    info : ConvergenceInfo
+        Iteraciones, última ``max_diff`` y tolerancia.
+
+    Raises
+    ------
+    ValueError
+        Si ``check_every < 1`` o ``slab < 1``.
+    """
+    if check_every < 1:
+        raise ValueError("check_every debe ser >= 1.")
+    n = V.shape[0]
+    plane = V.shape[1] * V.shape[2]
+    if slab is None:
+        slab = tile_rows_for(plane, V.dtype.itemsize, working_set)
+    if slab < 1:
+        raise ValueError("slab debe ser >= 1.")
+    slab = min(int(slab), max(n - 2, 1))
+
+    impose_dirichlet_3d(V, left, right, top, bottom, front, back)
+    src = np.empty((slab + 2,) + V.shape[1:], dtype=V.dtype)
+    dst = np.empty_like(src)
+    scratch = np.empty((slab, V.shape[1] - 2, V.shape[2] - 2), dtype=V.dtype)
+    prev = np.empty(V.shape[1:], dtype=V.dtype)
+    diff = float("inf")
+    k = 0
+
+    for k in range(1, max_iter + 1):
+        check = k % check_every == 0 or k == max_iter
+        diff_k = 0.0
+        prev[:] = V[0]
+        for z0 in range(1, n - 1, slab):
+            z1 = min(z0 + slab, n - 1)
+            t = z1 - z0
+            s, d = src[:t + 2], dst[:t + 2]
+
+            s[0] = prev
+            s[1:] = V[z0:z1 + 1]
+            _jacobi_sweep_3d(
+                s, d,
+                None if rhs is None else rhs[z0 - 1:z1 + 1],
+                None if mask is None else mask[z0 - 1:z1 + 1],
+            )
+            if check:
+                sc = scratch[:t]
+                np.subtract(d[1:-1, 1:-1, 1:-1], s[1:-1, 1:-1, 1:-1], out=sc)
+                np.abs(sc, out=sc)
+                diff_k = max(diff_k, float(sc.max(initial=0.0)))
+
+            prev[:] = s[t]
+            V[z0:z1, 1:-1, 1:-1] = d[1:-1, 1:-1, 1:-1]
+
+        if check:
+            diff = diff_k
+            if diff < tol:
+                break
+
+    return V, ConvergenceInfo(k, diff, float(tol))
+
+
+def _color_update_3d(V: np.ndarray, start, omega: float, rhs=None, mask=None, planes: int = 16) -> float:
+    """
+    Actualiza in-place la subred ``V[i0::2, j0::2, k0::2]`` (solo interior) por
+    bloques de ``planes`` planos y devuelve la máxima actualización absoluta.
+
+    Las seis vecinas de cada nodo pertenecen al otro color, por lo que cada
+    subred se actualiza de forma vectorizada; los temporales ocupan a lo sumo
+    ``planes`` planos de la subred.
+    """
+    i0, j0, k0 = start
+    n_z, n_y, n_x = V.shape
+    rows, cols = slice(j0, n_y - 1, 2), slice(k0, n_x - 1, 2)
+    north, south = slice(j0 - 1, n_y - 2, 2), slice(j0 + 1, n_y, 2)
+    west, east = slice(k0 - 1, n_x - 2, 2), slice(k0 + 1, n_x, 2)
+
+    diff = 0.0
+    step = 2 * planes
+    for z in range(i0, n_z - 1, step):
+        end = min(z + step, n_z - 1)
+        zs, below, above = slice(z, end, 2), slice(z - 1, end - 1, 2), slice(z + 1, end + 1, 2)
+        c = V[zs, rows, cols]
+        if c.size == 0:
+            continue
+        delta = V[zs, rows, east] + V[zs, rows, west]
+        delta += V[zs, south, cols]
+        delta += V[zs, north, cols]
+        delta += V[above, rows, cols]
+        delta += V[below, rows, cols]
+        if rhs is not None:
+            delta += rhs[zs, rows, cols]
+        delta *= 1.0 / 6.0
+        delta -= c
+        delta *= omega
+        if mask is not None:
+            np.copyto(delta, 0.0, where=mask[zs, rows, cols])
+        c += delta
+        np.abs(delta, out=delta)
+        diff = max(diff, float(delta.max()))
+    return diff
+
+
+def sor3d_solve(
+    V: np.ndarray,
+    left, right, top, bottom, front, back,
+    omega: float | None = None,
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    planes: int = 16,
+    rhs=None,
+    mask=None,
+) -> tuple[np.ndarray, ConvergenceInfo]:
+    """
+    SOR rojo-negro de siete puntos que actualiza ``V`` in-place.
+
+    Los nodos interiores se dividen en dos colores según la paridad de
+    :math:`i + j + k`; cada color se compone de cuatro subredes de paso 2 que
+    se actualizan vectorizadas y por bloques de planos, sin copia de la malla.
+
+    Parameters
+    ----------
+    V : numpy.ndarray of shape (N, N, N)
+        Potencial inicial con el convenio ``V[z, y, x]``; se modifica in-place.
+    left, right, top, bottom, front, back : float or array_like
+        Caras de Dirichlet (ver :func:`impose_dirichlet_3d`).
+    omega : float or None, default=None
+        Factor de relajación en ``(0, 2)``. Si es ``None`` se usa
+        :func:`campo_estatico_mdf.sor.optimal_omega`, que también es óptimo
+        para el cubo porque el radio espectral de Jacobi es el mismo,
+        :math:`\\cos(\\pi / (N - 1))`.
+    tol : float, default=1e-5
+        Tolerancia sobre la máxima actualización absoluta de un barrido.
+    max_iter : int, default=10000
+        Número máximo de barridos completos.
+    planes : int, default=16
+        Planos de cada subred por bloque; acota los temporales.
+    rhs : numpy.ndarray or None, default=None
+        Término fuente escalado :math:`h^2 f`.
+    mask : numpy.ndarray of bool or None, default=None
+        Nodos interiores de potencial fijo.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        El mismo arreglo ``V`` con la solución.
+    info : ConvergenceInfo
+        Iteraciones realizadas, última ``max_diff`` y tolerancia aplicada.
+
+    Raises
+    ------
+    ValueError
+        Si ``omega`` no está en ``(0, 2)`` o ``planes < 1``.
+    """
+    if omega is None:
+        omega = optimal_omega(V.shape[0])
+    if not 0.0 < omega < 2.0:
+        raise ValueError("omega debe estar en el intervalo (0, 2).")
+    if planes < 1:
+        raise ValueError("planes debe ser >= 1.")
+
+    impose_dirichlet_3d(V, left, right, top, bottom, front, back)
+    diff = float("inf")
+    for k in range(1, max_iter + 1):
+        diff = 0.0
+        for start in _RED + _BLACK:
+            diff = max(diff, _color_update_3d(V, start, omega, rhs, mask, planes))
+        if diff < tol:
+            return V, ConvergenceInfo(k, diff, float(tol))
+    return V, ConvergenceInfo(max_iter, diff, float(tol))
@@ -0,0 +1,145 @@
+# src/campo_estatico_mdf/streaming.py
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import Iterator
+import numpy as np
+from .bc import impose_dirichlet
+from .jacobi import _jacobi_sweep, _max_abs_diff
+from .sor import _red_black_sweep, optimal_omega
+
+#: Métodos que admiten solución por pasos en :meth:`LaplaceSolver2D.iter_solve`.
+STREAMING_METHODS = ("jacobi", "sor")
+
+#: Argumentos adicionales que acepta cada método por pasos (además de ``tol``,
+#: ``max_iter`` y ``every``).
+STEP_OPTIONS = {"jacobi": (), "sor": ("omega",)}
+
+
+@dataclass
+class Progress:
+    """
+    Registro ligero del avance de una solución iterativa.
+
+    Attributes
+    ----------
+    iteration : int
+        Barridos realizados hasta el momento.
+    max_diff : float
+        Máxima actualización absoluta del último barrido evaluado.
+    elapsed : float
+        Segundos transcurridos desde el inicio de la solución.
+    converged : bool
+        ``True`` si ``max_diff`` ya es menor que la tolerancia.
+    V : numpy.ndarray or None
+        Vista submuestreada del potencial actual, o ``None`` si no se pidió.
+        Comparte memoria con el solver: se sobrescribe en los barridos
+        siguientes, por lo que debe copiarse si se quiere conservar.
+    """
+    iteration: int
+    max_diff: float
+    elapsed: float
+    converged: bool = False
+    V: np.ndarray | None = None
+
+
+def downsample(V: np.ndarray, max_size: int | None) -> np.ndarray | None:
+    """
+    Devuelve una vista de ``V`` con a lo sumo ``max_size`` nodos por lado,
+    tomando uno de cada ``ceil(N / max_size)`` nodos (sin copiar).
+
+    ``max_size=None`` devuelve ``None``.
+    """
+    if max_size is None:
+        return None
+    if max_size < 1:
+        raise ValueError("max_size debe ser >= 1.")
+    step = max(1, -(-max(V.shape[-2:]) // int(max_size)))
+    return V[..., ::step, ::step]
+
+
+def jacobi_steps(
+    V0: np.ndarray,
+    left, right, top, bottom,
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    every: int = 10,
+    rhs=None,
+    mask=None,
+    aspect: float = 1.0,
+) -> Iterator[tuple[int, float, np.ndarray]]:
+    """
+    Versión por pasos de :func:`campo_estatico_mdf.jacobi.jacobi_solve`.
+
+    Cada ``every`` barridos (y en el último) entrega ``(k, max_diff, V)``, donde
+    ``V`` es el búfer que contiene la iteración ``k``. Se detiene tras entregar
+    un ``max_diff < tol`` o al llegar a ``max_iter``; el resultado coincide con
+    ``jacobi_solve(..., check_every=every)``.
+    """
+    if every < 1:
+        raise ValueError("every debe ser >= 1.")
+    A = V0.copy()
+    impose_dirichlet(A, left, right, top, bottom)
+    B = A.copy()
+    scratch = np.empty_like(A[..., 1:-1, 1:-1])
+
+    for k in range(1, max_iter + 1):
+        _jacobi_sweep(A, B, rhs, mask, aspect)
+        A, B = B, A
+        if k % every == 0 or k == max_iter:
+            diff = _max_abs_diff(A, B, scratch)
+            yield k, diff, A
+            if diff < tol:
+                return
+
+
+def sor_steps(
+    V0: np.ndarray,
+    left, right, top, bottom,
+    omega: float | None = None,
+    tol: float = 1e-5,
+    max_iter: int = 10000,
+    every: int = 10,
+    rhs=None,
+    mask=None,
+    aspect: float = 1.0,
+) -> Iterator[tuple[int, float, np.ndarray]]:
+    """
+    Versión por pasos de :func:`campo_estatico_mdf.sor.sor_solve`.
+
+    La convergencia se evalúa en cada barrido, como en ``sor_solve``, pero solo
+    se entrega ``(k, max_diff, V)`` cada ``every`` barridos, al converger y en
+    el último barrido.
+    """
+    if every < 1:
+        raise ValueError("every debe ser >= 1.")
+    V = V0.copy()
+    impose_dirichlet(V, left, right, top, bottom)
+    if omega is None:
+        omega = optimal_omega(V.shape[-2:], aspect)
+    if not 0.0 < omega < 2.0:
+        raise ValueError("omega debe estar en el intervalo (0, 2).")
+
+    for k in range(1, max_iter + 1):
+        diff = float(_red_black_sweep(V, omega, rhs, mask=mask, aspect=aspect))
+        if diff < tol or k % every == 0 or k == max_iter:
+            yield k, diff, V
+            if diff < tol:
+                return
+
+
+def timed(steps, tol: float, snapshot: int | None = None) -> Iterator[tuple[np.ndarray, Progress]]:
+    """
+    Envuelve un generador de :func:`jacobi_steps` o :func:`sor_steps` y añade el
+    tiempo transcurrido y la vista submuestreada.
+
+    Entrega pares ``(V, Progress)``; al cerrarse cierra también ``steps``.
+    """
+    start = time.perf_counter()
+    try:
+        for k, diff, V in steps:
+            yield V, Progress(
+                k, diff, time.perf_counter() - start, diff < tol, downsample(V, snapshot)
+            )
+    finally:
+        steps.close()
@@ -0,0 +1,150 @@
+# src/campo_estatico_mdf/superposition.py
+from __future__ import annotations
+from functools import lru_cache
+import numpy as np
+from .bc import edge_to_array, impose_dirichlet
+from .batch import solve_batch
+from .jacobi import ConvergenceInfo
+from .solver import LaplaceSolver2D
+
+
+def _solve_unit(N: int, h: float, method: str, tol: float, edges) -> tuple[np.ndarray, ConvergenceInfo]:
+    """Resuelve un único problema con el método indicado."""
+    s = LaplaceSolver2D(N, *edges, h=h)
+    info = s.solve(method, tol=tol)
+    return s.V, info
+
+
+class SuperpositionBasis:
+    """
+    Base de soluciones para reconstruir el potencial por superposición.
+
+    La ecuación de Laplace es lineal, por lo que el potencial interior es una
+    combinación lineal de los valores de frontera:
+
+    - con bordes uniformes, :math:`V = c_L B_L + c_R B_R + c_T B_T + c_B B_B`,
+      donde :math:`B_e` es la solución con el borde ``e`` a 1 y los demás a 0;
+    - con perfiles arbitrarios, cada nodo de frontera aporta su propia solución
+      unitaria (base *por nodo*), que se calcula de forma perezosa y solo para los
+      bordes no uniformes.
+
+    Una vez construida la base, cada reconstrucción cuesta una suma ponderada en
+    lugar de un proceso iterativo completo.
+
+    Parameters
+    ----------
+    N : int
+        Tamaño de la malla.
+    h : float, default=1.0
+        Paso espacial.
+    method : str, default="dst"
+        Método con el que se calculan las soluciones base (ver
+        :meth:`LaplaceSolver2D.solve`).
+    tol : float, default=1e-8
+        Tolerancia de los métodos iterativos al calcular la base.
+
+    Attributes
+    ----------
+    edge_basis : numpy.ndarray of shape (4, N, N)
+        Soluciones con un borde completo a potencial unitario, en el orden
+        ``(left, right, top, bottom)``.
+    info : ConvergenceInfo
+        Resumen de convergencia de la base (peor ``max_diff`` y máximo de
+        iteraciones entre las soluciones calculadas).
+
+    Notes
+    -----
+    La base por nodo de un borde ocupa ``(N - 2) × N × N`` valores, por lo que
+    solo es práctica en mallas moderadas; los nodos de esquina no intervienen en
+    el interior y se fijan directamente.
+    """
+
+    def __init__(self, N: int, h: float = 1.0, method: str = "dst", tol: float = 1e-8):
+        self.N = int(N)
+        self.h = float(h)
+        self.method = method
+        self.tol = float(tol)
+        self._node_basis: dict[int, np.ndarray] = {}
+
+        results = [
+            _solve_unit(self.N, self.h, method, self.tol, np.eye(4)[e]) for e in range(4)
+        ]
+        self.edge_basis = np.stack([V for V, _ in results])
+        self.info = ConvergenceInfo(0, 0.0, self.tol)
+        self._merge([info for _, info in results])
+
+    def _merge(self, infos) -> None:
+        """Acumula el peor caso de convergencia en :attr:`info`."""
+        for info in infos:
+            self.info.iterations = max(self.info.iterations, info.iterations)
+            self.info.max_diff = max(self.info.max_diff, info.max_diff)
+
+    def node_basis(self, edge: int) -> np.ndarray:
+        """
+        Devuelve (y calcula la primera vez) la base por nodo del borde ``edge``.
+
+        Parameters
+        ----------
+        edge : int
+            Índice del borde en el orden ``(left, right, top, bottom)``.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N - 2, N, N)
+            Solución para cada nodo interior del borde a potencial unitario.
+        """
+        if edge not in self._node_basis:
+            N = self.N
+            stack = np.zeros((N - 2, 4, N))
+            stack[:, edge, 1:-1] = np.eye(N - 2)
+            if self.method in ("jacobi", "sor"):
+                V, infos = solve_batch(N, stack, method=self.method, tol=self.tol)
+            else:
+                results = [_solve_unit(N, self.h, self.method, self.tol, s) for s in stack]
+                V = np.stack([v for v, _ in results])
+                infos = [i for _, i in results]
+            self._merge(infos)
+            self._node_basis[edge] = V
+        return self._node_basis[edge]
+
+    def combine(self, left, right, top, bottom) -> np.ndarray:
+        """
+        Reconstruye el potencial para las fronteras dadas.
+
+        Los bordes uniformes usan :attr:`edge_basis` (costo :math:`O(N^2)` por
+        borde); los no uniformes usan la base por nodo.
+
+        Parameters
+        ----------
+        left, right, top, bottom : float or array_like
+            Valores de frontera, como en :func:`campo_estatico_mdf.bc.edge_to_array`.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N, N)
+            Potencial con las fronteras impuestas.
+        """
+        N = self.N
+        V = np.zeros((N, N))
+        for e, val in enumerate((left, right, top, bottom)):
+            profile = edge_to_array(N, val)[1:-1]
+            if profile.size == 0:
+                continue
+            if np.all(profile == profile[0]):
+                if profile[0] != 0.0:
+                    V += profile[0] * self.edge_basis[e]
+            else:
+                V += np.tensordot(profile, self.node_basis(e), axes=1)
+        impose_dirichlet(V, left, right, top, bottom)
+        return V
+
+
+@lru_cache(maxsize=8)
+def get_basis(N: int, h: float = 1.0, method: str = "dst", tol: float = 1e-8) -> SuperpositionBasis:
+    """
+    Devuelve la base de superposición para ``(N, h, method, tol)``, calculándola
+    solo la primera vez.
+
+    Las bases se guardan en una caché LRU de hasta 8 entradas.
+    """
+    return SuperpositionBasis(N, h, method, tol)
@@ -0,0 +1,151 @@
+# src/campo_estatico_mdf/sweep.py
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+from multiprocessing import shared_memory
+import numpy as np
+from .grid import grid_shape
+from .jacobi import ConvergenceInfo
+from .solver import LaplaceSolver2D
+
+# Claves de un punto del barrido que configuran el solver; el resto se pasa
+# como argumento del método de solución.
+_SOLVER_KEYS = ("N", "h", "left", "right", "top", "bottom", "dtype", "mixed_precision", "method")
+
+
+def param_grid(**axes) -> list[dict]:
+    """
+    Construye el producto cartesiano de los valores de cada parámetro.
+
+    Examples
+    --------
+    >>> param_grid(N=[16, 32], right=[1.0, 10.0])  # doctest: +NORMALIZE_WHITESPACE
+    [{'N': 16, 'right': 1.0}, {'N': 16, 'right': 10.0},
+     {'N': 32, 'right': 1.0}, {'N': 32, 'right': 10.0}]
+
+    Returns
+    -------
+    list of dict
+        Un diccionario por combinación, con el último eje variando más rápido.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in product(*(axes[n] for n in names))]
+
+
+@dataclass
+class SweepResult:
+    """
+    Resultados de un barrido de parámetros, en el orden de entrada.
+
+    Attributes
+    ----------
+    params : list of dict
+        Parámetros de cada punto.
+    V : list of numpy.ndarray
+        Potencial de cada punto en ``float64``, de forma ``(Ny, Nx)``; son
+        vistas sobre un único búfer contiguo.
+    infos : list of ConvergenceInfo
+        Información de convergencia de cada punto.
+    """
+    params: list[dict]
+    V: list[np.ndarray]
+    infos: list[ConvergenceInfo]
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def __getitem__(self, i: int) -> tuple[dict, np.ndarray, ConvergenceInfo]:
+        return self.params[i], self.V[i], self.infos[i]
+
+
+def _split(point: dict, method: str, solve_kwargs: dict) -> tuple[dict, str, dict]:
+    """Separa los argumentos del constructor, el método y los del método."""
+    ctor = {k: point[k] for k in _SOLVER_KEYS if k in point and k != "method"}
+    kwargs = dict(solve_kwargs)
+    kwargs.update({k: v for k, v in point.items() if k not in _SOLVER_KEYS})
+    return ctor, point.get("method", method), kwargs
+
+
+def _solve_into(shm_name: str, offset: int, point: dict, method: str, kwargs: dict) -> ConvergenceInfo:
+    """
+    Resuelve un punto del barrido en un proceso hijo y escribe ``V`` directamente
+    en el bloque de memoria compartida.
+    """
+    ctor, method, kwargs = _split(point, method, kwargs)
+    solver = LaplaceSolver2D(**ctor)
+    info = solver.solve(method, **kwargs)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(solver.V.shape, dtype=np.float64, buffer=shm.buf, offset=offset)
+        out[...] = solver.V
+        del out
+    finally:
+        shm.close()
+    return info
+
+
+def run_sweep(
+    params,
+    method: str = "jacobi",
+    max_workers: int | None = None,
+    **solve_kwargs,
+) -> SweepResult:
+    """
+    Ejecuta un barrido de parámetros repartiendo las soluciones entre procesos.
+
+    Cada proceso del :class:`~concurrent.futures.ProcessPoolExecutor` escribe su
+    potencial en un bloque de :mod:`multiprocessing.shared_memory`, de modo que
+    solo la pequeña :class:`ConvergenceInfo` viaja de vuelta serializada.
+
+    Parameters
+    ----------
+    params : sequence of dict
+        Un diccionario por punto (ver :func:`param_grid`). Las claves ``N``,
+        ``h``, ``left``, ``right``, ``top`` y ``bottom`` configuran
+        :class:`LaplaceSolver2D` (también ``dtype`` y ``mixed_precision``);
+        ``N`` y ``h`` admiten parejas ``(Ny, Nx)`` y ``(hy, hx)``;
+        ``method`` sustituye al método por defecto y el resto se pasa al método
+        de solución (por ejemplo ``tol``).
+    method : str, default="jacobi"
+        Método por defecto (ver :meth:`LaplaceSolver2D.solve`).
+    max_workers : int or None, default=None
+        Número de procesos; ``None`` usa todos los núcleos.
+    **solve_kwargs
+        Argumentos comunes del método de solución.
+
+    Returns
+    -------
+    SweepResult
+        Potenciales y registros de convergencia en el orden de ``params``.
+
+    Raises
+    ------
+    KeyError
+        Si algún punto no define ``N``.
+    ValueError
+        Si algún ``N`` no define una malla válida.
+    """
+    params = [dict(p) for p in params]
+    shapes = [grid_shape(p["N"]) for p in params]
+    offsets = np.concatenate(([0], np.cumsum([8 * r * c for r, c in shapes]))).astype(int)
+    total = int(offsets[-1])
+    if total == 0:
+        return SweepResult(params, [], [])
+
+    shm = shared_memory.SharedMemory(create=True, size=total)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_solve_into, shm.name, int(off), p, method, solve_kwargs)
+                for p, off in zip(params, offsets[:-1])
+            ]
+            infos = [f.result() for f in futures]
+        data = np.frombuffer(shm.buf, dtype=np.float64, count=total // 8).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    V = [data[off // 8: off // 8 + r * c].reshape(r, c) for off, (r, c) in zip(offsets, shapes)]
+    return SweepResult(params, V, infos)
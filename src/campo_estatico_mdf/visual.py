@@ -1,10 +1,77 @@
 # src/campo_estatico_mdf/visual.py
 from __future__ import annotations
-import matplotlib.pyplot as plt
+import io
+import math
+from typing import TYPE_CHECKING
 import numpy as np
 from .field import electric_field
 
-def plot_potential(V: np.ndarray, cmap: str = "viridis", figsize=(6, 5)) -> plt.Figure:
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+def _pyplot():
+    """Importa ``matplotlib.pyplot`` al dibujar, no al importar el módulo."""
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+#: Número máximo de flechas cuando :func:`plot_field` elige el paso automáticamente.
+MAX_ARROWS = 40 * 40
+
+
+def block_average(A: np.ndarray, max_size: int | None) -> np.ndarray:
+    """
+    Reduce ``A`` a lo sumo ``max_size`` celdas por lado promediando bloques de
+    ``ceil(N / max_size)`` nodos (el último bloque de cada eje puede ser menor).
+
+    A diferencia de tomar uno de cada ``k`` nodos, el promedio no pierde
+    detalles finos como electrodos delgados. ``max_size=None`` devuelve ``A``.
+
+    Raises
+    ------
+    ValueError
+        Si ``max_size < 1``.
+    """
+    if max_size is None:
+        return A
+    if max_size < 1:
+        raise ValueError("max_size debe ser >= 1.")
+    n_rows, n_cols = A.shape
+    step = -(-max(n_rows, n_cols) // int(max_size))
+    if step == 1:
+        return A
+    rows, cols = np.arange(0, n_rows, step), np.arange(0, n_cols, step)
+    total = np.add.reduceat(np.add.reduceat(A, rows, axis=0), cols, axis=1)
+    counts = np.outer(np.diff(rows, append=n_rows), np.diff(cols, append=n_cols))
+    return total / counts
+
+
+def auto_stride(shape, max_arrows: int = MAX_ARROWS) -> int:
+    """Paso del quiver para dibujar a lo sumo ``max_arrows`` flechas en una malla de forma ``shape``."""
+    if max_arrows < 1:
+        raise ValueError("max_arrows debe ser >= 1.")
+    stride = max(1, math.ceil(math.sqrt(shape[0] * shape[1] / max_arrows)))
+    while -(-shape[0] // stride) * -(-shape[1] // stride) > max_arrows:
+        stride += 1
+    return stride
+
+
+def _imshow(ax, V: np.ndarray, max_pixels: int | None, **kwargs):
+    """Dibuja ``V`` reducido a ``max_pixels`` por lado conservando las coordenadas de los nodos."""
+    n_rows, n_cols = V.shape
+    extent = (-0.5, n_cols - 0.5, -0.5, n_rows - 0.5)
+    return ax.imshow(block_average(V, max_pixels), origin="lower", interpolation="nearest",
+                     extent=extent, **kwargs)
+
+
+def _aspect(h) -> float:
+    """Relación de aspecto ``hy / hx`` de los ejes en coordenadas de nodo."""
+    return 1.0 if np.isscalar(h) else float(h[0]) / float(h[1])
+
+
+def plot_potential(V: np.ndarray, cmap: str = "viridis", figsize=(6, 5),
+                   max_pixels: int | None = None, h=1.0) -> Figure:
     """
     Grafica un heatmap del potencial eléctrico V.
 
@@ -16,21 +83,29 @@ def plot_potential(V: np.ndarray, cmap: str = "viridis", figsize=(6, 5)) -> plt.
         Colormap para la visualización.
     figsize : tuple (ancho, alto), default=(6,5)
         Tamaño de la figura en pulgadas.
+    max_pixels : int or None, default=None
+        Resolución máxima de la imagen por lado; las mallas mayores se
+        promedian por bloques (ver :func:`block_average`). ``None`` usa la
+        malla completa.
+    h : float or tuple of float, default=1.0
+        Paso de la malla; con ``(hy, hx)`` los ejes se escalan para conservar
+        la geometría física de la malla anisótropa.
 
     Returns
     -------
     fig : matplotlib.figure.Figure
         Figura lista para mostrar en Streamlit o matplotlib.
     """
-    fig, ax = plt.subplots(figsize=figsize)
-    im = ax.imshow(V, origin="lower", cmap=cmap, interpolation="nearest")
+    fig, ax = _pyplot().subplots(figsize=figsize)
+    im = _imshow(ax, V, max_pixels, cmap=cmap, aspect=_aspect(h))
     ax.set_title("Potencial eléctrico V(x, y)")
     ax.set_xlabel("x")
     ax.set_ylabel("y")
     fig.colorbar(im, ax=ax, label="V")
     return fig
 
-def plot_field(V: np.ndarray, h: float = 1.0, stride: int = 1, figsize=(6, 5)) -> plt.Figure:
+def plot_field(V: np.ndarray, h=1.0, stride: int | None = 1, figsize=(6, 5), field=None,
+               max_pixels: int | None = None, max_arrows: int = MAX_ARROWS) -> Figure:
     """
     Grafica el campo eléctrico como quiver plot sobre la malla.
 
@@ -38,25 +113,39 @@ def plot_field(V: np.ndarray, h: float = 1.0, stride: int = 1, figsize=(6, 5)) -
     ----------
     V : np.ndarray
         Matriz del potencial eléctrico.
-    h : float, default=1.0
-        Paso de la malla (Δx = Δy = h).
-    stride : int, default=1
-        Intervalo para mostrar vectores, útil para no saturar la figura.
+    h : float or tuple of float, default=1.0
+        Paso de la malla (Δx = Δy = h), o ``(hy, hx)``; en ese caso los ejes se
+        escalan como en :func:`plot_potential`.
+    stride : int or None, default=1
+        Intervalo para mostrar vectores, útil para no saturar la figura. Si es
+        ``None`` se elige con :func:`auto_stride` para no superar
+        ``max_arrows`` flechas.
     figsize : tuple (ancho, alto), default=(6,5)
         Tamaño de la figura en pulgadas.
+    field : tuple (Ex, Ey) or None, default=None
+        Campo ya calculado (por ejemplo, ``solver.field``); si es ``None`` se
+        calcula a partir de ``V``.
+    max_pixels : int or None, default=None
+        Resolución máxima del mapa de fondo por lado (ver :func:`plot_potential`).
+    max_arrows : int, default=MAX_ARROWS
+        Presupuesto de flechas cuando ``stride`` es ``None``.
 
     Returns
     -------
     fig : matplotlib.figure.Figure
         Figura lista para mostrar en Streamlit o matplotlib.
     """
-    Ex, Ey = electric_field(V, h)
-    Y, X = np.meshgrid(np.arange(0, V.shape[0]), np.arange(0, V.shape[1]), indexing="ij")
+    Ex, Ey = electric_field(V, h) if field is None else field
+    if stride is None:
+        stride = auto_stride(V.shape, max_arrows)
+    # Coordenadas 1D: quiver las combina sin construir una meshgrid completa.
+    x = np.arange(0, V.shape[1], stride)
+    y = np.arange(0, V.shape[0], stride)
 
-    fig, ax = plt.subplots(figsize=figsize)
-    ax.imshow(V, origin="lower", cmap="viridis", interpolation="nearest", alpha=0.6)
+    fig, ax = _pyplot().subplots(figsize=figsize)
+    _imshow(ax, V, max_pixels, cmap="viridis", alpha=0.6, aspect=_aspect(h))
     ax.quiver(
-        X[::stride, ::stride], Y[::stride, ::stride],
+        x, y,
         Ex[::stride, ::stride], Ey[::stride, ::stride],
         color="red", scale=50
     )
@@ -64,3 +153,20 @@ def plot_field(V: np.ndarray, h: float = 1.0, stride: int = 1, figsize=(6, 5)) -
     ax.set_xlabel("x")
     ax.set_ylabel("y")
     return fig
+
+
+def to_png(fig: Figure, dpi: float = 100) -> bytes:
+    """
+    Dibuja ``fig`` una sola vez con el backend no interactivo Agg y devuelve
+    los bytes PNG; la figura se cierra después.
+
+    Los mismos bytes sirven para mostrar la imagen (``st.image``) y para
+    descargarla, sin volver a dibujar.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig)  # sustituye el lienzo del backend activo
+    fig.savefig(buf, format="png", dpi=dpi)
+    _pyplot().close(fig)
+    return buf.getvalue()
@@ -0,0 +1,58 @@
+# tests/test_amr.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.amr import Quadtree, adaptive_solve
+
+pytest.importorskip("scipy")
+
+
+def _log_source(d=0.005):
+    # Potencial armónico de una carga lineal justo fuera de la esquina (0, 0).
+    exact = lambda x, y: 0.5 * np.log((x + d) ** 2 + (y + d) ** 2)  # noqa: E731
+    edges = (lambda t: exact(0 * t, t), lambda t: exact(1 + 0 * t, t),
+             lambda t: exact(t, 0 * t), lambda t: exact(t, 1 + 0 * t))
+    return exact, edges
+
+
+def test_balance_keeps_neighbours_within_one_level():
+    tree = Quadtree(2, 5)
+    for _ in range(5):
+        level, ci, cj = tree.leaves()
+        corner = (ci == 0) & (cj == 0)
+        tree.refine(level[corner], ci[corner], cj[corner])
+    tree.balance()
+    level, ci, cj = tree.leaves()
+    s = tree.size(level)
+    for di, dj in ((1, 0), (0, 1)):
+        a, b = ci * s + di * s, cj * s + dj * s
+        inside = (a < tree.M) & (b < tree.M)
+        assert np.all(np.abs(tree.leaf_level(a[inside], b[inside]) - level[inside]) <= 1)
+    assert tree.depth == 5 and len(tree) < 4 * 64
+
+
+def test_same_accuracy_with_far_fewer_unknowns():
+    exact, edges = _log_source()
+    errors, unknowns = [], []
+    for tol in (0.1, 0.0):  # tol = 0 refina todo: malla uniforme equivalente
+        sol, info = adaptive_solve(*edges, base=4, max_level=6, tol=tol)
+        n = sol.tree.M + 1
+        t = np.linspace(0.0, 1.0, n)
+        y, x = np.meshgrid(t, t, indexing="ij")
+        errors.append(np.abs(sol.to_uniform(n) - exact(x, y)).max())
+        unknowns.append(sol.n_unknowns)
+    assert unknowns[1] == (n - 2) ** 2
+    assert unknowns[0] * 10 < unknowns[1]
+    assert errors[0] < 1.1 * errors[1]
+
+
+def test_solver_adaptive_matches_uniform_direct():
+    kw = dict(left=0.0, right=0.0, top=5.0, bottom=0.0, h=1 / 64)
+    s = LaplaceSolver2D(65, **kw)
+    info = s.solve("adaptive", tol=0.05)
+    assert s.method == "adaptive" and info.iterations >= 2
+    assert s.adaptive.n_unknowns < 63 ** 2
+    ref = LaplaceSolver2D(65, **kw)
+    ref.solve("direct")
+    np.testing.assert_allclose(s.V, ref.V, atol=1e-2)
+    assert s.V[0, 1:-1].min() == 5.0 and s.field[0].shape == (65, 65)
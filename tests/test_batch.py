@@ -0,0 +1,39 @@
+# tests/test_batch.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D, solve_batch
+from campo_estatico_mdf.batch import stack_boundaries
+from campo_estatico_mdf.solver import BoundarySpec
+
+
+def test_batch_matches_individual_solves():
+    N = 17
+    params = [(0.0, 10.0, 5.0, 0.0), (1.0, 1.0, 1.0, 1.0), (0.0, 0.0, 0.0, 0.0)]
+    V, infos = solve_batch(N, np.array(params), tol=1e-6, max_iter=5000)
+    assert V.shape == (3, N, N)
+    for p, Vb, ib in zip(params, V, infos):
+        s = LaplaceSolver2D(N, *p)
+        info = s.solve_jacobi(tol=1e-6, max_iter=5000)
+        assert ib == info
+        assert np.array_equal(Vb, s.V)
+    # Cada miembro se detiene en su propio punto de convergencia
+    assert infos[2].iterations < infos[0].iterations
+
+
+def test_batch_sor_with_boundary_specs():
+    N = 21
+    ramp = np.linspace(0.0, 1.0, N)
+    specs = [BoundarySpec(ramp, ramp, np.zeros(N), np.ones(N)), BoundarySpec(*[np.full(N, 2.0)] * 4)]
+    V, infos = solve_batch(N, specs, method="sor", tol=1e-9)
+    s = LaplaceSolver2D(N, ramp, ramp, 0.0, 1.0)
+    s.solve_sor(tol=1e-9)
+    assert np.allclose(V[0], s.V, atol=1e-7)
+    assert np.allclose(V[1], 2.0)
+    assert all(i.max_diff < 1e-9 for i in infos)
+
+
+def test_batch_rejects_rectangular_grids():
+    with pytest.raises(ValueError, match="cuadrada"):
+        solve_batch((9, 17), np.zeros((2, 4)))
+    with pytest.raises(ValueError, match="cuadrada"):
+        stack_boundaries((9, 17), np.zeros((2, 4)))
@@ -0,0 +1,87 @@
+# tests/test_cache.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.cache import CachedSolution, SolutionCache, solution_key
+
+
+def test_cache_hit_skips_solve(tmp_path):
+    cache = SolutionCache(directory=tmp_path)
+    a = LaplaceSolver2D(21, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    info_a = a.solve("jacobi", cache=cache, tol=1e-6)
+    assert len(cache) == 1
+
+    b = LaplaceSolver2D(21, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    b.solve_jacobi = None  # un acierto no debe invocar al método
+    info_b = b.solve("jacobi", cache=cache, tol=1e-6)
+    assert info_b == info_a
+    assert np.array_equal(a.V, b.V)
+
+    # La persistencia sobrevive a una caché nueva sobre el mismo directorio
+    c = LaplaceSolver2D(21, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    c.solve_jacobi = None
+    c.solve("jacobi", cache=SolutionCache(directory=tmp_path), tol=1e-6)
+    assert np.array_equal(a.V, c.V)
+
+    d = LaplaceSolver2D(21, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    d.solve("jacobi", cache=cache, tol=1e-4)
+    assert len(cache) == 2
+
+
+def test_lru_eviction_by_bytes():
+    z = np.zeros((10, 10))
+    entry = lambda: CachedSolution(z.copy(), z.copy(), z.copy(), None)
+    cache = SolutionCache(max_bytes=2 * entry().nbytes)
+    cache.put("a", entry())
+    cache.put("b", entry())
+    cache.get("a")
+    cache.put("c", entry())
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_rectangular_anisotropic_keys(tmp_path):
+    cache = SolutionCache(directory=tmp_path)
+    kw = dict(left=0.0, right=10.0, top=5.0, bottom=0.0)
+    a = LaplaceSolver2D((9, 17), h=(0.1, 0.2), **kw)
+    info_a = a.solve("sor", cache=cache, tol=1e-8)
+    b = LaplaceSolver2D((9, 17), h=(0.1, 0.2), **kw)
+    b.solve_sor = None
+    assert b.solve("sor", cache=cache, tol=1e-8) == info_a
+    assert np.array_equal(a.V, b.V) and b.V.shape == (9, 17)
+
+    c = LaplaceSolver2D((9, 17), h=(0.2, 0.1), **kw)
+    list(c.iter_solve("sor", cache=cache, tol=1e-8))
+    assert len(cache) == 2 and not np.array_equal(a.V, c.V)
+
+    square = [solution_key(n, h, a.boundary, "sor") for n, h in ((9, 0.1), ((9, 9), (0.1, 0.1)))]
+    assert square[0] == square[1]
+
+
+def test_concurrent_put_get_keeps_budget():
+    from concurrent.futures import ThreadPoolExecutor
+
+    z = np.zeros((8, 8))
+    size = CachedSolution(z, z, z, None).nbytes
+    cache = SolutionCache(max_bytes=5 * size)
+
+    def work(i):
+        for j in range(200):
+            key = f"{(i * 7 + j) % 13}"
+            cache.put(key, CachedSolution(z.copy(), z.copy(), z.copy(), None))
+            cache.get(key)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(work, range(8)))
+    assert len(cache) == 5 and cache.nbytes == 5 * size
+    assert cache.nbytes == sum(e.nbytes for e in cache._entries.values())
+
+
+def test_entries_loaded_from_disk_are_read_only(tmp_path):
+    a = LaplaceSolver2D(9, right=1.0)
+    a.solve("sor", cache=SolutionCache(directory=tmp_path), tol=1e-8)
+    entry = SolutionCache(directory=tmp_path).get(next(iter(tmp_path.glob("*.npz"))).stem)
+    for arr in (entry.V, entry.Ex, entry.Ey):
+        assert not arr.flags.writeable
+        with pytest.raises(ValueError):
+            arr[1, 1] = 0.0
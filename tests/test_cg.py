@@ -0,0 +1,41 @@
+# tests/test_cg.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.cg import PRECONDITIONERS, apply_laplacian
+
+
+def test_operator_is_symmetric():
+    rng = np.random.default_rng(1)
+    u, v = rng.normal(size=(2, 9, 9))
+    assert np.isclose(np.vdot(apply_laplacian(u), v), np.vdot(u, apply_laplacian(v)))
+
+
+@pytest.mark.parametrize("preconditioner", PRECONDITIONERS)
+def test_cg_matches_dst(preconditioner):
+    N = 65
+    ref = LaplaceSolver2D(N, left=0.0, right=10.0, top=np.linspace(0, 5, N), bottom=0.0)
+    ref.solve_dst()
+    s = LaplaceSolver2D(N, left=0.0, right=10.0, top=np.linspace(0, 5, N), bottom=0.0)
+    info = s.solve_cg(tol=1e-10, preconditioner=preconditioner)
+    assert info.residuals[-1] < 1e-10
+    assert len(info.residuals) == info.iterations + 1
+    assert np.allclose(s.V, ref.V, atol=1e-8)
+    if preconditioner == "multigrid":
+        assert info.iterations < 20
+
+
+def test_multigrid_preconditioner_on_even_grid(monkeypatch):
+    from campo_estatico_mdf import multigrid
+
+    coarse = []
+    solve = multigrid._coarse_solve
+    monkeypatch.setattr(
+        multigrid, "_coarse_solve", lambda V, *a: (coarse.append(V.shape), solve(V, *a))
+    )
+    s = LaplaceSolver2D(100, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    info = s.solve_cg(tol=1e-10)
+    assert info.residuals[-1] < 1e-10 and info.iterations < 20
+    # Un nivel grueso diminuto por aplicación del precondicionador.
+    assert len(coarse) == info.iterations
+    assert max(max(shape) for shape in coarse) <= 4
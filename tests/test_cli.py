@@ -0,0 +1,74 @@
+# tests/test_cli.py
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.cli import main, read_jobs
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _results(out):
+    return [json.loads(line) for line in (out / "results.jsonl").read_text().splitlines()]
+
+
+def test_jsonl_jobs_stream_solutions(tmp_path, capsys):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text(
+        '{"id": "a", "N": 9, "left": 1.0, "method": "sor", "tol": 1e-8}\n'
+        "\n"
+        '{"N": 7, "top": [0, 1, 2, 3, 2, 1, 0], "tol": 1e-6, "max_iter": 500}\n'
+        '{"N": 5, "method": "nope"}\n'
+    )
+    assert main([str(jobs), "--out", str(tmp_path / "out")]) == 1
+    a, b, bad = _results(tmp_path / "out")
+    assert len(capsys.readouterr().out.splitlines()) == 3
+
+    ref = LaplaceSolver2D(9, left=1.0)
+    ref.solve("sor", tol=1e-8)
+    np.testing.assert_array_equal(np.load(tmp_path / "out" / a["output"]), ref.V)
+    assert a["info"]["iterations"] == ref.info.iterations
+    assert b["id"] == 1 and b["info"]["max_diff"] < 1e-6
+    assert bad["id"] == 2 and "ValueError" in bad["error"]
+
+
+def test_csv_jobs_and_solver_format(tmp_path):
+    jobs = tmp_path / "jobs.csv"
+    jobs.write_text("id,N,h,right,method,tol\nplaca,11,0.1,5,jacobi,1e-6\n")
+    assert main([str(jobs), "--out", str(tmp_path), "--format", "solver", "--field", "-q"]) == 0
+    (rec,) = _results(tmp_path)
+    s = LaplaceSolver2D.load(tmp_path / rec["output"])
+    assert s.N == 11 and s.h == 0.1 and s.boundary.right[5] == 5.0
+    assert rec["info"]["tol"] == 1e-6
+
+
+def test_read_jobs_empty_and_cli_imports_lazily():
+    assert list(read_jobs(["# comentario\n", "\n"])) == []
+    lazy = ["matplotlib", "concurrent.futures"] + [
+        f"campo_estatico_mdf.{m}" for m in ("solver3d", "batch", "cache", "multigrid", "direct", "streaming")
+    ]
+    code = (
+        "import sys, campo_estatico_mdf.cli, campo_estatico_mdf.visual; "
+        f"print(any(m in sys.modules for m in {lazy!r}))"
+    )
+    path = os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": path}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert out.stdout.strip() == "False"
+
+
+def test_ids_cannot_escape_output_directory(tmp_path):
+    out = tmp_path / "out"
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text("".join(
+        json.dumps({"id": job_id, "N": 5}) + "\n"
+        for job_id in ("../fuera", str(tmp_path / "abs"), "a/b", "..", "ok")
+    ))
+    assert main([str(jobs), "--out", str(out), "--format", "solver", "-q"]) == 1
+    records = _results(out)
+    assert all("ValueError" in r["error"] for r in records[:4])
+    assert records[4]["output"] == "ok"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["jobs.jsonl", "out"]
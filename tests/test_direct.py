@@ -0,0 +1,61 @@
+# tests/test_direct.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf import direct
+
+pytest.importorskip("scipy")
+
+
+def _problem(N=33):
+    s = LaplaceSolver2D(N, left=0.0, right=1.0, top=0.0, bottom=0.0, h=0.1)
+    mask = np.zeros((N, N), dtype=bool)
+    mask[12:20, 8:11] = True
+    s.set_electrodes(mask, 5.0)
+    s.set_source(np.where(np.arange(N)[:, None] > N // 2, 2.0, 0.0), eps=0.5)
+    return s
+
+
+def test_direct_matches_iterative():
+    ref = _problem()
+    ref.solve_direct()
+    assert ref.info.max_diff < 1e-10
+    assert np.all(ref.V[ref.mask] == 5.0)
+    for method in ("jacobi", "sor"):
+        s = _problem()
+        s.solve(method, tol=1e-10, max_iter=20000)
+        assert np.all(s.V[s.mask] == 5.0)
+        assert np.allclose(s.V, ref.V, atol=1e-6)
+
+
+def test_direct_without_mask_matches_dst():
+    N = 17
+    a = LaplaceSolver2D(N, left=1.0, right=0.0, top=np.linspace(0, 2, N), bottom=0.0)
+    b = LaplaceSolver2D(N, left=1.0, right=0.0, top=np.linspace(0, 2, N), bottom=0.0)
+    a.set_source(1.0)
+    b.set_source(1.0)
+    a.solve_direct()
+    b.solve_dst()
+    assert np.allclose(a.V, b.V, atol=1e-10)
+
+
+def test_factorization_is_reused():
+    direct.clear_factorizations()
+    s = _problem()
+    s.solve_direct()
+    lu = direct.get_factorization(s.V.shape, s.mask)
+    s.set_electrodes(s.mask, -3.0)
+    s.set_boundaries(right=4.0)
+    s.solve_direct()
+    assert len(direct._FACTORS) == 1
+    assert direct.get_factorization(s.V.shape, s.mask) is lu
+
+
+def test_mask_rejected_by_unmasked_methods():
+    s = _problem()
+    for method in ("multigrid", "cg", "dst"):
+        with pytest.raises(ValueError, match="electrodos interiores"):
+            s.solve(method)
+    # La superposición no es un método de solve(); se llama directamente.
+    with pytest.raises(ValueError, match="'superposition' no admite electrodos interiores"):
+        s.solve_superposition()
@@ -0,0 +1,24 @@
+# tests/test_dst.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.dst import dst1
+
+
+def test_dst1_matches_definition():
+    n = 7
+    x = np.random.default_rng(0).normal(size=(3, n))
+    j = np.arange(1, n + 1)
+    S = np.sin(np.pi * np.outer(j, j) / (n + 1))
+    assert np.allclose(dst1(x), x @ S.T)
+    assert np.allclose(dst1(dst1(x)) * 2 / (n + 1), x)
+
+
+def test_dst_is_exact_reference():
+    N = 41
+    a = LaplaceSolver2D(N, left=0.0, right=10.0, top=np.linspace(0, 5, N), bottom=1.0)
+    b = LaplaceSolver2D(N, left=0.0, right=10.0, top=np.linspace(0, 5, N), bottom=1.0)
+    info = a.solve_dst()
+    assert info.iterations == 0
+    assert info.max_diff < 1e-10
+    b.solve_multigrid(tol=1e-12)
+    assert np.allclose(a.V, b.V, atol=1e-9)
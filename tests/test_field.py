@@ -0,0 +1,56 @@
+# tests/test_field.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.field import electric_field, field_quantities
+from campo_estatico_mdf.visual import plot_field
+
+
+def _plates(N=33, V0=4.0, L=2.0):
+    ramp = np.linspace(0.0, V0, N)
+    s = LaplaceSolver2D(N, left=0.0, right=V0, top=ramp, bottom=ramp, h=L / (N - 1))
+    s.V = np.tile(ramp, (N, 1))
+    return s
+
+
+def test_field_is_cached_and_invalidated():
+    s = _plates()
+    Ex, Ey = s.field
+    assert s.field[0] is Ex and s.electric_field()[1] is Ey
+    assert not Ex.flags.writeable
+    q = s.quantities
+    assert s.quantities is q
+
+    s.set_boundaries(right=8.0)
+    assert s.field[0] is not Ex and s.quantities is not q
+    Ex = s.field[0]
+    s.h = 2 * s.h
+    np.testing.assert_allclose(s.field[0], 0.5 * Ex)
+
+
+def test_quantities_parallel_plates():
+    V0, L, eps = 4.0, 2.0, 3.0
+    s = _plates(V0=V0, L=L)
+    s.set_source(np.zeros_like(s.V), eps=eps)
+    q = s.quantities
+    np.testing.assert_allclose(q.magnitude, V0 / L)
+    np.testing.assert_allclose(q.energy_density, 0.5 * eps * (V0 / L) ** 2)
+    assert np.isclose(q.energy, 0.5 * eps * V0 ** 2)
+    assert np.isclose(q.edge_charge["right"], eps * V0)
+    assert np.isclose(q.edge_charge["left"], -q.edge_charge["right"])
+    assert np.isclose(q.edge_charge["top"], 0.0, atol=1e-12)
+
+
+def test_field_quantities_blocking_matches_unblocked():
+    V = np.random.default_rng(0).random((37, 41))
+    Ex, Ey = electric_field(V, 0.1)
+    a = field_quantities(Ex, Ey, 0.1, block_rows=5)
+    b = field_quantities(Ex, Ey, 0.1, block_rows=1000)
+    np.testing.assert_allclose(a.magnitude, np.hypot(Ex, Ey))
+    np.testing.assert_allclose(a.energy_density, b.energy_density)
+    assert np.isclose(a.energy, b.energy)
+
+
+def test_plot_field_uses_precomputed_field():
+    s = _plates(N=9)
+    fig = plot_field(s.V, s.h, field=s.field)
+    assert fig.axes
@@ -0,0 +1,72 @@
+# tests/test_grid.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.field import field_quantities
+from campo_estatico_mdf.grid import allocate_potential, aspect_ratio
+
+NY, NX, HY, HX = 9, 41, 0.05, 0.2
+
+
+def _saddle():
+    # x² - y² es armónica y el esquema de cinco puntos la reproduce con
+    # cualquier pareja de pasos.
+    y, x = np.mgrid[0:NY, 0:NX] * np.array([HY, HX])[:, None, None]
+    return x ** 2 - y ** 2, x, y
+
+
+def _edges(U):
+    return dict(left=U[:, 0], right=U[:, -1], top=U[0], bottom=U[-1])
+
+
+def test_allocate_rectangular_anisotropic():
+    V, h = allocate_potential((NY, NX), (HY, HX))
+    assert V.shape == (NY, NX) and h == (HY, HX)
+    assert allocate_potential(5, (0.1, 0.1))[1] == 0.1
+    assert aspect_ratio((HY, HX)) == pytest.approx(1 / 16)
+    with pytest.raises(ValueError):
+        allocate_potential((NY, 2))
+
+
+@pytest.mark.parametrize("method,kwargs", [
+    ("jacobi", {"tol": 1e-12, "max_iter": 20000}),
+    ("jacobi", {"tol": 1e-12, "max_iter": 20000, "workers": 2}),
+    ("sor", {"tol": 1e-12}),
+    ("tiled", {"tol": 1e-12, "max_iter": 20000, "tile_rows": 3}),
+    ("dst", {}),
+    ("direct", {}),
+])
+def test_saddle_is_exact_on_anisotropic_grid(method, kwargs):
+    if method == "direct":
+        pytest.importorskip("scipy")
+    U, x, y = _saddle()
+    s = LaplaceSolver2D((NY, NX), **_edges(U), h=(HY, HX))
+    s.solve(method, **kwargs)
+    assert s.V.shape == (NY, NX) and s.N == (NY, NX)
+    np.testing.assert_allclose(s.V, U, atol=1e-9)
+    Ex, Ey = s.field
+    np.testing.assert_allclose(Ex, -2 * x, atol=1e-8)
+    np.testing.assert_allclose(Ey, 2 * y, atol=1e-8)
+
+    q = s.quantities
+    ref = field_quantities(Ex, Ey, (HY, HX))
+    assert q.energy == ref.energy and q.edge_charge == ref.edge_charge
+    V, Ex_p, Ey_p = s.probe([[4 * HX, 2.5 * HY]], "bicubic")
+    assert V[0] == pytest.approx((4 * HX) ** 2 - (2.5 * HY) ** 2, abs=1e-6)
+    assert Ex_p[0] == pytest.approx(-8 * HX, abs=1e-6)
+
+
+def test_anisotropic_rejections_and_roundtrip(tmp_path):
+    U, _, _ = _saddle()
+    s = LaplaceSolver2D((NY, NX), **_edges(U), h=(HY, HX))
+    with pytest.raises(ValueError, match="hx == hy"):
+        s.solve("cg")
+    with pytest.raises(ValueError, match="cuadrada"):
+        LaplaceSolver2D((NY, NX)).solve("adaptive")
+
+    s.set_source(1.0)
+    s.solve("sor", tol=1e-10)
+    s.save(tmp_path / "sol")
+    t = LaplaceSolver2D.load(tmp_path / "sol")
+    assert t.N == s.N and t.h == s.h and t.shape == (NY, NX)
+    assert np.array_equal(t.V, s.V) and np.array_equal(t.boundary.top, s.boundary.top)
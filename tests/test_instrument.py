@@ -0,0 +1,90 @@
+# tests/test_instrument.py
+import tracemalloc
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.instrument import Recorder, subscribe
+from campo_estatico_mdf.jacobi import jacobi_solve
+
+
+def _solver(**kwargs):
+    return LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0, **kwargs)
+
+
+@pytest.mark.parametrize("kernel,workers", [("buffered", 1), ("buffered", 2), ("simple", 1)])
+def test_recorder_fills_info_without_changing_result(kernel, workers):
+    V0 = _solver().V
+    ref, ref_info = jacobi_solve(V0, 0.0, 10.0, 5.0, 0.0, tol=1e-4, check_every=3, kernel=kernel)
+    rec = Recorder(residual_stride=10, track_memory=True)
+    V, info = jacobi_solve(
+        V0, 0.0, 10.0, 5.0, 0.0, tol=1e-4, check_every=3,
+        kernel=kernel, workers=workers, recorder=rec,
+    )
+    assert np.array_equal(V, ref)
+    assert info.iterations == ref_info.iterations
+    assert {"stencil", "boundary", "total"} <= set(info.timings)
+    assert info.timings["stencil"]["calls"] == info.iterations
+    assert info.mlups > 0
+    assert info.peak_memory > 0
+    assert len(info.residuals) == info.iterations // 10
+
+
+def test_subscribers_receive_events_from_solve():
+    events = []
+    unsubscribe = subscribe(events.append)
+    try:
+        s = _solver(mixed_precision=True)
+        info = s.solve("sor", tol=1e-8)
+        _solver().solve("dst")
+    finally:
+        unsubscribe()
+    kinds = [(e.kind, e.method) for e in events]
+    assert kinds.count(("start", "sor")) == kinds.count(("end", "sor")) == 1
+    assert ("end", "dst") in kinds
+    assert sum(k == ("iteration", "sor") for k in kinds) == info.iterations
+    assert info.timings["total"]["wall"] > 0
+    _solver().solve("jacobi", tol=1e-3)
+    assert len(events) == len(kinds)
+
+
+def test_uninstrumented_info_is_plain():
+    info = _solver().solve("jacobi", tol=1e-3)
+    assert info.timings == {} and info.mlups is None and info.peak_memory is None
+
+
+@pytest.mark.parametrize("method,kwargs", [
+    ("jacobi", {}), ("sor", {}), ("jacobi", {"mixed_precision": True}),
+])
+def test_callback_error_undoes_begin(method, kwargs):
+    def fail(event):
+        if event.kind == "iteration":
+            raise RuntimeError("interrumpido")
+
+    rec = Recorder(track_memory=True, callbacks=[fail])
+    s = _solver(**kwargs)
+    with pytest.raises(RuntimeError, match="interrumpido"):
+        s.solve(method, recorder=rec, tol=1e-6)
+    assert rec._depth == 0 and not tracemalloc.is_tracing()
+
+    rec.callbacks.clear()
+    info = s.solve(method, recorder=rec, tol=1e-6)
+    assert info.peak_memory > 0 and not tracemalloc.is_tracing()
+
+
+def test_start_error_and_reuse_reset_state():
+    def fail(event):
+        if event.kind == "start":
+            raise RuntimeError("inicio")
+
+    rec = Recorder(residual_stride=5, track_memory=True, callbacks=[fail])
+    with pytest.raises(RuntimeError, match="inicio"):
+        _solver().solve("sor", recorder=rec, tol=1e-6)
+    assert rec._depth == 0 and not tracemalloc.is_tracing()
+
+    rec.callbacks.clear()
+    first = _solver().solve("sor", recorder=rec, tol=1e-6)
+    calls = first.timings["stencil"]["calls"]
+    second = _solver().solve("sor", recorder=rec, tol=1e-6)
+    assert second.timings["stencil"]["calls"] == calls == second.iterations
+    assert second.residuals == first.residuals and len(second.residuals) == second.iterations // 5
+    assert rec.updates == second.iterations * 31 ** 2
@@ -0,0 +1,43 @@
+# tests/test_jacobi.py
+import numpy as np
+import pytest
+from campo_estatico_mdf.grid import allocate_potential
+from campo_estatico_mdf.jacobi import jacobi_solve
+
+
+def test_buffered_kernel_matches_reference():
+    V0, _ = allocate_potential(21)
+    bcs = (0.0, 10.0, np.linspace(0, 5, 21), 1.0)
+    Va, ia = jacobi_solve(V0, *bcs, tol=1e-6, max_iter=3000, kernel="buffered")
+    Vb, ib = jacobi_solve(V0, *bcs, tol=1e-6, max_iter=3000, kernel="simple")
+    assert ia == ib
+    assert np.array_equal(Va, Vb)
+
+
+def test_check_every_stops_on_multiple():
+    V0, _ = allocate_potential(15)
+    _, ref = jacobi_solve(V0, 0.0, 1.0, 0.0, 0.0, tol=1e-5, max_iter=5000)
+    V, info = jacobi_solve(V0, 0.0, 1.0, 0.0, 0.0, tol=1e-5, max_iter=5000, check_every=7)
+    assert info.iterations % 7 == 0
+    assert ref.iterations <= info.iterations < ref.iterations + 7
+    assert info.max_diff < 1e-5
+
+
+def test_invalid_check_every():
+    V0, _ = allocate_potential(5)
+    with pytest.raises(ValueError):
+        jacobi_solve(V0, 0, 0, 0, 0, check_every=0)
+
+
+def test_threaded_strips_match_single_thread():
+    from campo_estatico_mdf.sor import sor_solve
+
+    V0, _ = allocate_potential(40)
+    bcs = (0.0, 10.0, np.linspace(0, 5, 40), 1.0)
+    Va, ia = jacobi_solve(V0, *bcs, tol=1e-6, max_iter=2000, check_every=3)
+    Vb, ib = jacobi_solve(V0, *bcs, tol=1e-6, max_iter=2000, check_every=3, workers=3)
+    assert ia == ib and np.array_equal(Va, Vb)
+
+    Va, ia = sor_solve(V0, *bcs, tol=1e-9)
+    Vb, ib = sor_solve(V0, *bcs, tol=1e-9, workers=4)
+    assert ia == ib and np.array_equal(Va, Vb)
@@ -0,0 +1,51 @@
+# tests/test_multigrid.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.multigrid import hierarchy, prolong, restrict
+
+
+def test_transfer_operators_preserve_constants():
+    ec = np.zeros((9, 9))
+    ec[1:-1, 1:-1] = 1.0
+    ef = prolong(ec)
+    assert ef.shape == (17, 17)
+    assert np.allclose(ef[2:-2, 2:-2], 1.0)
+    rc = restrict(np.ones((17, 17)))
+    assert rc.shape == (9, 9)
+    assert np.allclose(rc[1:-1, 1:-1], 1.0)
+
+
+def test_multigrid_matches_sor():
+    for N in (65, 50):
+        a = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=0.0)
+        b = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=0.0)
+        a.solve_sor(tol=1e-11)
+        info = b.solve_multigrid(tol=1e-9)
+        assert info.max_diff < 1e-9
+        assert info.iterations < 20
+        assert np.allclose(a.V, b.V, atol=1e-7)
+
+
+def test_multigrid_residual_reduction():
+    s = LaplaceSolver2D(129, left=0.0, right=1.0, top=np.linspace(0, 1, 129), bottom=0.0)
+    info = s.solve_multigrid(tol=1e-12, fmg=False)
+    r = np.array(info.residuals)
+    assert len(r) == info.iterations + 1
+    assert np.all(r[1:4] / r[:3] < 0.2)
+
+
+def test_multigrid_even_size_builds_full_hierarchy():
+    levels = hierarchy((100, 100))
+    assert len(levels) > 1 and max(levels[-1]) <= 4
+    assert levels[1] == (51, 51)
+    r = restrict(np.ones((100, 100)), levels[1])
+    assert np.allclose(r[1:-1, 1:-1], 1.0, atol=1e-3)
+    assert np.allclose(prolong(np.ones(levels[1]), (100, 100)), 1.0)
+
+    s = LaplaceSolver2D(100, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    info = s.solve_multigrid(tol=1e-9, fmg=False)
+    assert info.iterations <= 15
+    assert np.all(np.diff(np.log(info.residuals[:6])) < np.log(0.2))
+    ref = LaplaceSolver2D(100, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    ref.solve_sor(tol=1e-11)
+    np.testing.assert_allclose(s.V, ref.V, atol=1e-7)
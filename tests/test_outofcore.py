@@ -0,0 +1,53 @@
+# tests/test_outofcore.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.jacobi import jacobi_solve
+from campo_estatico_mdf.outofcore import open_potential, tile_rows_for, tiled_jacobi_solve
+
+
+@pytest.mark.parametrize("tile_rows", [1, 4, 7, 100])
+def test_tiled_matches_jacobi_bitwise(tile_rows):
+    N = 24
+    rng = np.random.default_rng(3)
+    rhs = rng.normal(size=(N, N)) * 0.01
+    mask = np.zeros((N, N), dtype=bool)
+    mask[8:12, 5:9] = True
+    V0 = np.zeros((N, N))
+    V0[mask] = 2.0
+    edges = (0.0, 1.0, np.linspace(0, 3, N), 0.5)
+
+    ref, ref_info = jacobi_solve(V0, *edges, tol=1e-6, check_every=3, rhs=rhs, mask=mask)
+    V, info = tiled_jacobi_solve(
+        V0.copy(), *edges, tol=1e-6, check_every=3, tile_rows=tile_rows, rhs=rhs, mask=mask
+    )
+    assert info.iterations == ref_info.iterations
+    assert info.max_diff == ref_info.max_diff
+    assert np.array_equal(V, ref)
+
+
+def test_memmap_backed_solver_and_zero_copy_reopen(tmp_path):
+    path = tmp_path / "V.npy"
+    s = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0, path=path)
+    assert isinstance(s.V, np.memmap)
+    info = s.solve("tiled", tol=1e-5, check_every=5, tile_rows=6)
+
+    ref = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    ref_info = ref.solve_jacobi(tol=1e-5, check_every=5)
+    assert info.iterations == ref_info.iterations
+    assert np.array_equal(s.V, ref.V)
+
+    V = open_potential(path)
+    assert isinstance(V, np.memmap) and not V.flags.writeable
+    assert np.array_equal(V, ref.V)
+
+    # Los métodos en memoria escriben el resultado en el mismo archivo.
+    s.solve("dst")
+    assert isinstance(s.V, np.memmap)
+    assert np.allclose(open_potential(path), s.V)
+
+
+def test_tile_rows_for_bounds_working_set():
+    rows = tile_rows_for(50_000, 8, working_set=64 * 2**20)
+    assert 3 * (rows + 2) * 50_000 * 8 <= 64 * 2**20
+    assert tile_rows_for(10**9, 8) == 1
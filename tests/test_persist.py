@@ -0,0 +1,74 @@
+# tests/test_persist.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.instrument import Recorder
+from campo_estatico_mdf.persist import read_meta
+
+
+class _Crash(Exception):
+    pass
+
+
+def _solver():
+    s = LaplaceSolver2D(33, left=0.0, right=10.0, top=np.linspace(0, 5, 33), bottom=0.0, h=0.5)
+    mask = np.zeros((33, 33), dtype=bool)
+    mask[10:14, 10:14] = True
+    s.set_electrodes(mask, 3.0)
+    return s
+
+
+def _crash_at(k):
+    def callback(event):
+        if event.kind == "iteration" and event.iteration >= k:
+            raise _Crash
+    return Recorder(callbacks=[callback])
+
+
+@pytest.mark.parametrize("method,kwargs", [("jacobi", {"check_every": 4}), ("sor", {})])
+def test_resume_matches_uninterrupted(tmp_path, method, kwargs):
+    ref = _solver()
+    ref_info = ref.solve(method, tol=1e-7, **kwargs)
+
+    path = tmp_path / "ckpt"
+    s = _solver()
+    with pytest.raises(_Crash):
+        s.solve(method, tol=1e-7, checkpoint=path, checkpoint_every=20,
+                recorder=_crash_at(ref_info.iterations // 2), **kwargs)
+    assert not read_meta(path)["complete"]
+    assert 0 < LaplaceSolver2D.load(path).info.iterations < ref_info.iterations
+
+    t = _solver()
+    info = t.solve(method, tol=1e-7, checkpoint=path, checkpoint_every=20, **kwargs)
+    assert info.iterations == ref_info.iterations
+    assert np.array_equal(t.V, ref.V)
+    assert read_meta(path)["complete"]
+
+    with pytest.raises(ValueError):
+        LaplaceSolver2D(33).solve(method, checkpoint=path)
+
+
+def test_save_load_roundtrip_is_lazy(tmp_path):
+    s = _solver()
+    s.set_source(1.0, eps=2.0)
+    s.solve("sor", tol=1e-8)
+    s.save(tmp_path / "sol", field=True)
+
+    t = LaplaceSolver2D.load(tmp_path / "sol")
+    assert isinstance(t.V, np.memmap)
+    assert np.array_equal(t.V, s.V)
+    assert t.method == "sor" and t.info == s.info and t.h == s.h
+    assert np.array_equal(t.boundary.top, s.boundary.top)
+    assert np.array_equal(t.mask, s.mask) and t.eps == 2.0
+    Ex, Ey = s.electric_field()
+    assert isinstance(t.field[0], np.memmap)
+    assert np.array_equal(t.field[0], Ex) and np.array_equal(t.field[1], Ey)
+
+    # Copia en escritura: resolver de nuevo no altera el archivo.
+    t.solve("jacobi", tol=1e-3)
+    assert np.array_equal(LaplaceSolver2D.load(tmp_path / "sol").V, s.V)
+
+
+def test_checkpoint_rejects_unsupported_methods(tmp_path):
+    with pytest.raises(ValueError):
+        LaplaceSolver2D(17).solve("cg", checkpoint=tmp_path / "c")
@@ -0,0 +1,29 @@
+# tests/test_precision.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+
+
+@pytest.mark.parametrize("method", ["jacobi", "sor", "multigrid", "dst"])
+def test_float32_end_to_end(method):
+    s = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0, dtype=np.float32)
+    assert s.V.dtype == np.float32 and s.boundary.left.dtype == np.float32
+    s.solve(method, tol=1e-4)
+    Ex, Ey = s.electric_field()
+    assert s.V.dtype == Ex.dtype == Ey.dtype == np.float32
+
+    ref = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    ref.solve(method, tol=1e-4)
+    assert np.allclose(s.V, ref.V, atol=1e-3)
+
+
+def test_mixed_precision_meets_float64_tolerance():
+    s = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0, mixed_precision=True)
+    info = s.solve_sor(tol=1e-10)
+    assert s.V.dtype == np.float64
+    assert info.max_diff < 1e-10
+    assert info.residuals[-1] < 1e-8
+
+    ref = LaplaceSolver2D(33, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    ref.solve_dst()
+    assert np.allclose(s.V, ref.V, atol=1e-8)
@@ -0,0 +1,48 @@
+# tests/test_probe.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.probe import Interpolant
+
+
+def _harmonic(x, y):
+    return x ** 3 - 3 * x * y ** 2 + 2 * y, -(3 * x ** 2 - 3 * y ** 2), -(-6 * x * y + 2)
+
+
+def test_probe_reproduces_nodes_and_smooth_function():
+    N, h = 41, 0.05
+    y, x = np.mgrid[0:N, 0:N] * h
+    s = LaplaceSolver2D(N, h=h)
+    s.V = _harmonic(x, y)[0]
+
+    nodes = np.column_stack([x.ravel(), y.ravel()])
+    for method in ("bilinear", "bicubic"):
+        V, Ex, Ey = s.probe(nodes, method)
+        np.testing.assert_allclose(V, s.V.ravel(), atol=1e-12)
+
+    pts = np.random.default_rng(0).random((500, 2)) * (N - 1) * h
+    exact = _harmonic(*pts.T)
+    lin = s.probe(pts, "bilinear")
+    cub = s.probe(pts, "bicubic")
+    assert np.abs(cub[0] - exact[0]).max() < 0.1 * np.abs(lin[0] - exact[0]).max()
+    for got in (lin, cub):
+        np.testing.assert_allclose(got[1], exact[1], atol=1e-2)
+        np.testing.assert_allclose(got[2], exact[2], atol=1e-2)
+
+
+def test_interpolant_cached_until_solution_changes():
+    s = LaplaceSolver2D(9, left=1.0)
+    it = s.interpolant("bicubic")
+    assert s.interpolant("bicubic") is it
+    s.solve("jacobi", tol=1e-6)
+    assert s.interpolant("bicubic") is not it
+
+
+def test_probe_outside_and_invalid_input():
+    it = Interpolant(np.zeros((5, 5)), h=0.5)
+    V, Ex, Ey = it([[-0.1, 0.0], [2.0, 2.0], [1.0, 2.01]])
+    assert np.isnan(V[[0, 2]]).all() and V[1] == 0.0
+    with pytest.raises(ValueError):
+        it(np.zeros(3))
+    with pytest.raises(ValueError):
+        Interpolant(np.zeros((5, 5)), method="spline")
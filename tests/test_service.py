@@ -0,0 +1,152 @@
+# tests/test_service.py
+import asyncio
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.cache import SolutionCache
+from campo_estatico_mdf.service import ServiceThread, SolveService, request
+
+JOB = {"N": 17, "left": 1.0, "right": 3.0, "method": "jacobi", "tol": 1e-6}
+
+
+def test_identical_requests_are_coalesced():
+    async def main():
+        async with SolveService(workers=2) as service:
+            ids = await asyncio.gather(*(service.submit(dict(JOB)) for _ in range(5)))
+            other = await service.submit({**JOB, "right": 4.0})
+            assert len(set(ids)) == 1 and other != ids[0]
+            job = await service.wait(ids[0])
+            return job, (await service.wait(other)).state
+
+    job, other_state = asyncio.run(main())
+    ref = LaplaceSolver2D(17, left=1.0, right=3.0)
+    ref.solve("jacobi", tol=1e-6)
+    assert job.state == "done" and other_state == "done" and job.requests == 5
+    np.testing.assert_array_equal(job.solver.V, ref.V)
+    assert job.history[-1][0] == ref.info.iterations
+
+
+def test_priority_backpressure_and_cancel():
+    async def main():
+        order = []
+        service = SolveService(workers=1, max_queue=2)
+        await service.start()
+        blocker = await service.submit({**JOB, "N": 65, "tol": 0.0, "max_iter": 200000})
+        await asyncio.sleep(0.05)  # el trabajador toma el primer trabajo
+        low = await service.submit({**JOB, "right": 5.0}, priority=5)
+        high = await service.submit({**JOB, "right": 6.0}, priority=0)
+        with pytest.raises(asyncio.QueueFull):
+            await service.submit({**JOB, "right": 7.0}, wait=False)
+        assert service.status(blocker).state == "running"
+        assert service.cancel(blocker)
+        for job_id in (low, high):
+            job = await service.wait(job_id)
+            order.append((job.started, job_id))
+        states = service.status(blocker).state, service.status(low).state
+        await service.stop()
+        return [job_id for _, job_id in sorted(order)], high, low, states
+
+    order, high, low, states = asyncio.run(main())
+    assert order == [high, low]
+    assert states == ("cancelled", "done")
+
+
+def test_thread_socket_and_cache():
+    cache = SolutionCache()
+    service = ServiceThread(workers=1, cache=cache)
+    try:
+        job_id = service.submit(JOB)
+        assert service.wait(job_id, timeout=30).state == "done"
+        assert len(cache) == 1
+
+        port = service.serve()
+        reply = request({"op": "submit", "job": JOB}, port=port)
+        assert reply["id"] == job_id
+        result = request({"op": "result", "id": job_id}, port=port)
+        np.testing.assert_array_equal(np.array(result["V"]), service.status(job_id).solver.V)
+        assert "error" in request({"op": "submit", "job": {**JOB, "method": "nope"}}, port=port)
+    finally:
+        service.close()
+
+
+def test_rectangular_anisotropic_job_is_cached():
+    job = {**JOB, "N": [9, 17], "h": [0.1, 0.2], "method": "sor", "tol": 1e-8}
+    cache = SolutionCache()
+
+    async def main():
+        async with SolveService(workers=1, cache=cache) as service:
+            first = await service.wait(await service.submit(dict(job)))
+            again = await service.wait(await service.submit(dict(job)))
+            return first, again
+
+    first, again = asyncio.run(main())
+    ref = LaplaceSolver2D((9, 17), left=1.0, right=3.0, h=(0.1, 0.2))
+    ref.solve("sor", tol=1e-8)
+    assert first.state == again.state == "done" and len(cache) == 1
+    np.testing.assert_array_equal(again.solver.V, ref.V)
+
+
+def test_cancel_detaches_coalesced_submitters():
+    async def main():
+        async with SolveService(workers=1) as service:
+            slow = {**JOB, "N": 65, "tol": 0.0, "max_iter": 200000}
+            first = await service.submit(slow)
+            second = await service.submit(slow)
+            await asyncio.sleep(0.05)
+            assert first == second and service.status(first).waiting == 2
+            assert service.cancel(first)
+            await asyncio.sleep(0.05)
+            job = service.status(first)
+            running = job.state, job.cancel_requested, job.waiting
+            assert service.cancel(second)
+            job = await service.wait(first)
+            return running, job.state, service.cancel(first)
+
+    running, state, again = asyncio.run(main())
+    assert running == ("running", False, 1)
+    assert state == "cancelled" and not again
+
+
+def test_resubmit_after_cancel_starts_fresh_job():
+    async def main():
+        async with SolveService(workers=1) as service:
+            slow = {**JOB, "N": 33, "tol": 0.0, "max_iter": 20000}
+            job_id = await service.submit(slow)
+            while service.status(job_id).state != "running":
+                await asyncio.sleep(0.001)
+            old = service.status(job_id)
+            assert service.cancel(job_id)
+            again = await service.submit(slow)
+            new = service.status(again)
+            assert again == job_id and new is not old and not new.cancel_requested
+            return old, await service.wait(again)
+
+    old, job = asyncio.run(main())
+    assert job.state == "done" and job.solver.info.iterations == 20000
+    assert old.state == "cancelled"
+
+
+def test_blocked_submit_coalesces_and_promotion_is_free():
+    async def main():
+        service = SolveService(workers=1, max_queue=1)
+        await service.start()
+        blocker = await service.submit({**JOB, "N": 65, "tol": 0.0, "max_iter": 200000})
+        await asyncio.sleep(0.05)
+        queued = await service.submit({**JOB, "right": 5.0}, priority=5)
+        # La promoción no ocupa capacidad aunque la cola esté llena.
+        assert await service.submit({**JOB, "right": 5.0}, priority=0, wait=False) == queued
+        assert service.pending == 1 and service.status(queued).priority == 0
+
+        first = asyncio.create_task(service.submit({**JOB, "right": 6.0}))
+        await asyncio.sleep(0.01)
+        assert not first.done()  # espera espacio en la cola
+        # Un envío idéntico se une al trabajo que espera en lugar de duplicarlo.
+        second = await asyncio.wait_for(service.submit({**JOB, "right": 6.0}), 1.0)
+        service.cancel(blocker)
+        assert await first == second
+        job = await service.wait(second)
+        await service.stop()
+        return job
+
+    job = asyncio.run(main())
+    assert job.state == "done" and job.requests == 2
@@ -0,0 +1,60 @@
+# tests/test_solver3d.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver3D
+from campo_estatico_mdf.stencil3d import impose_dirichlet_3d, jacobi3d_solve
+
+
+def _quadratic(N, h):
+    z, y, x = np.mgrid[0:N, 0:N, 0:N] * h
+    return x ** 2 + y ** 2 - 2 * z ** 2, (x, y, z)
+
+
+def _faces(U):
+    return U[:, :, 0], U[:, :, -1], U[:, 0, :], U[:, -1, :], U[0], U[-1]
+
+
+@pytest.mark.parametrize("method", ["jacobi", "sor"])
+def test_quadratic_harmonic_is_recovered(method):
+    N, h = 13, 0.1
+    U, (x, y, z) = _quadratic(N, h)
+    s = LaplaceSolver3D(N, *_faces(U), h=h)
+    info = s.solve(method, tol=1e-11, max_iter=20000)
+    assert info.max_diff < 1e-11 and s.method == method
+    np.testing.assert_allclose(s.V, U, atol=1e-8)
+
+    Ex, Ey, Ez = s.field
+    assert s.electric_field()[0] is Ex and not Ez.flags.writeable
+    np.testing.assert_allclose(Ex, -2 * x, atol=1e-6)
+    np.testing.assert_allclose(Ez, 4 * z, atol=1e-6)
+
+
+def test_inplace_jacobi_matches_double_buffer():
+    rng = np.random.default_rng(0)
+    V0 = rng.random((9, 9, 9))
+    faces = (1.0, 2.0, 0.0, 0.5, -1.0, rng.random((9, 9)))
+    ref = V0.copy()
+    impose_dirichlet_3d(ref, *faces)
+    for _ in range(7):
+        new = ref.copy()
+        inner = ref[1:-1, 1:-1, 2:] + ref[1:-1, 1:-1, :-2]
+        inner += ref[1:-1, 2:, 1:-1]
+        inner += ref[1:-1, :-2, 1:-1]
+        inner += ref[2:, 1:-1, 1:-1]
+        inner += ref[:-2, 1:-1, 1:-1]
+        new[1:-1, 1:-1, 1:-1] = inner * (1.0 / 6.0)
+        ref = new
+    V = V0.copy()
+    out, info = jacobi3d_solve(V, *faces, tol=0.0, max_iter=7, slab=2)
+    assert out is V and info.iterations == 7
+    np.testing.assert_array_equal(V, ref)
+
+
+def test_set_boundaries_and_validation():
+    s = LaplaceSolver3D(5, left=1.0)
+    s.set_boundaries(back=3.0)
+    assert s.V[-1, 2, 2] == 3.0 and s.V[2, 2, 0] == 1.0
+    with pytest.raises(ValueError):
+        s.set_boundaries(top=np.zeros((4, 4)))
+    with pytest.raises(ValueError):
+        s.solve("multigrid")
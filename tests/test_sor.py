@@ -0,0 +1,24 @@
+# tests/test_sor.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.sor import optimal_omega
+
+
+def test_sor_matches_jacobi_with_fewer_iterations():
+    N = 33
+    a = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    b = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=0.0)
+    ia = a.solve_jacobi(tol=1e-9, max_iter=50000)
+    ib = b.solve_sor(tol=1e-9)
+    assert ib.max_diff < 1e-9
+    assert ib.iterations * 10 < ia.iterations
+    assert np.allclose(a.V, b.V, atol=1e-5)
+
+
+def test_gauss_seidel_and_optimal_omega():
+    assert optimal_omega(3) == 1.0
+    assert 1.0 < optimal_omega(101) < 2.0
+    s = LaplaceSolver2D(17, left=1.0, right=1.0, top=1.0, bottom=1.0)
+    info = s.solve_sor(omega=1.0, tol=1e-8)
+    assert info.max_diff < 1e-8
+    assert np.allclose(s.V, 1.0, atol=1e-6)
@@ -0,0 +1,62 @@
+# tests/test_streaming.py
+import numpy as np
+import pytest
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.cache import SolutionCache
+
+
+def _solver(N=33):
+    return LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=0.0)
+
+
+@pytest.mark.parametrize("method", ["jacobi", "sor"])
+def test_iter_solve_matches_solve(method):
+    ref = _solver()
+    if method == "jacobi":
+        ref.solve_jacobi(tol=1e-6, check_every=7)
+    else:
+        ref.solve_sor(tol=1e-6)
+    s = _solver()
+    records = list(s.iter_solve(method, every=7, tol=1e-6))
+    assert records[-1].converged
+    assert [r.iteration for r in records] == sorted(r.iteration for r in records)
+    assert all(r.elapsed >= 0 for r in records)
+    assert s.info.iterations == ref.info.iterations
+    assert np.array_equal(s.V, ref.V)
+
+
+def test_close_stops_and_keeps_partial_state():
+    s = _solver()
+    gen = s.iter_solve("jacobi", every=5, snapshot=8, tol=1e-12)
+    first = next(gen)
+    second = next(gen)
+    gen.close()
+    assert (first.iteration, second.iteration) == (5, 10)
+    assert second.V.shape == (7, 7)
+    assert s.info.iterations == 10
+    assert not second.converged
+    with pytest.raises(StopIteration):
+        next(gen)
+
+
+def test_iter_solve_uses_cache():
+    cache = SolutionCache()
+    s = _solver()
+    s.solve("jacobi", cache=cache, tol=1e-5, max_iter=10000, check_every=10)
+    t = _solver()
+    records = list(t.iter_solve("jacobi", every=10, cache=cache, tol=1e-5))
+    assert len(records) == 1
+    assert np.array_equal(t.V, s.V)
+    with pytest.raises(ValueError):
+        next(t.iter_solve("dst"))
+
+
+@pytest.mark.parametrize("method,option", [
+    ("jacobi", {"workers": 2}), ("jacobi", {"check_every": 5}),
+    ("sor", {"recorder": None}), ("jacobi", {"omega": 1.5}),
+])
+def test_iter_solve_rejects_unsupported_options(method, option):
+    s = LaplaceSolver2D(9, right=1.0)
+    with pytest.raises(ValueError, match=f"no admite '{next(iter(option))}'"):
+        next(s.iter_solve(method, **option))
+    assert list(s.iter_solve("sor", omega=1.5, tol=1e-8))[-1].converged
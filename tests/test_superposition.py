@@ -0,0 +1,31 @@
+# tests/test_superposition.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.superposition import get_basis
+
+
+def test_superposition_scalar_edges_matches_direct():
+    N = 31
+    s = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=-2.0)
+    s.solve_superposition()
+    ref = LaplaceSolver2D(N, left=0.0, right=10.0, top=5.0, bottom=-2.0)
+    ref.solve_dst()
+    assert np.allclose(s.V, ref.V, atol=1e-10)
+
+    s.set_boundaries(right=1.0)
+    s.solve_superposition()
+    ref.set_boundaries(right=1.0)
+    ref.solve_dst()
+    assert np.allclose(s.V, ref.V, atol=1e-10)
+    assert get_basis(N, 1.0, "dst", 1e-8) is get_basis(N, 1.0, "dst", 1e-8)
+
+
+def test_superposition_profiles_per_node():
+    N = 13
+    top = np.sin(np.linspace(0, np.pi, N))
+    s = LaplaceSolver2D(N, left=1.0, right=0.0, top=top, bottom=0.0)
+    s.solve_superposition(method="sor", tol=1e-10)
+    ref = LaplaceSolver2D(N, left=1.0, right=0.0, top=top, bottom=0.0)
+    ref.solve_dst()
+    assert np.allclose(s.V, ref.V, atol=1e-8)
+    assert np.array_equal(s.V[0], top)
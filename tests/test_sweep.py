@@ -0,0 +1,26 @@
+# tests/test_sweep.py
+import numpy as np
+from campo_estatico_mdf import LaplaceSolver2D
+from campo_estatico_mdf.sweep import param_grid, run_sweep
+
+
+def test_sweep_matches_serial_in_input_order():
+    params = param_grid(N=[9, 14], right=[1.0, 10.0])
+    params.append({"N": 11, "top": 3.0, "method": "dst"})
+    result = run_sweep(params, method="sor", max_workers=2, tol=1e-8)
+    assert len(result) == 5
+    for p, V, info in (result[i] for i in range(len(result))):
+        s = LaplaceSolver2D(**{k: v for k, v in p.items() if k != "method"})
+        ref = s.solve(p.get("method", "sor"), tol=1e-8)
+        assert V.shape == (p["N"], p["N"])
+        assert np.array_equal(V, s.V)
+        assert info == ref
+
+
+def test_sweep_rectangular_anisotropic_points():
+    params = [{"N": (9, 17), "h": (0.1, 0.2), "top": 1.0}, {"N": 7, "right": 2.0}]
+    result = run_sweep(params, method="sor", max_workers=2, tol=1e-8)
+    assert [V.shape for V in result.V] == [(9, 17), (7, 7)]
+    s = LaplaceSolver2D((9, 17), top=1.0, h=(0.1, 0.2))
+    assert result.infos[0] == s.solve("sor", tol=1e-8)
+    assert np.array_equal(result.V[0], s.V)
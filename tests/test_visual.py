@@ -0,0 +1,34 @@
+# tests/test_visual.py
+import numpy as np
+import pytest
+from campo_estatico_mdf.visual import auto_stride, block_average, plot_field, plot_potential, to_png
+
+
+def test_block_average_preserves_mean_and_budget():
+    A = np.random.default_rng(0).random((103, 57))
+    B = block_average(A, 10)
+    assert max(B.shape) <= 10
+    assert B.shape == (10, 6)
+    np.testing.assert_allclose(B[0, 0], A[:11, :11].mean())
+    np.testing.assert_allclose(B[-1, -1], A[99:, 55:].mean())
+    assert block_average(A, None) is A and block_average(A, 200) is A
+    with pytest.raises(ValueError):
+        block_average(A, 0)
+
+
+def test_auto_stride_respects_arrow_budget():
+    for shape, budget in [((1001, 1001), 1600), ((50, 50), 100), ((7, 300), 20), ((5, 5), 1000)]:
+        s = auto_stride(shape, budget)
+        assert -(-shape[0] // s) * -(-shape[1] // s) <= budget
+        assert s == 1 or -(-shape[0] // (s - 1)) * -(-shape[1] // (s - 1)) > budget
+
+
+def test_lod_figures_render_to_png():
+    V = np.random.default_rng(1).random((301, 301))
+    fig = plot_field(V, stride=None, max_pixels=50, max_arrows=100)
+    ax = fig.axes[0]
+    assert max(ax.images[0].get_array().shape) <= 50
+    assert ax.collections[0].N <= 100
+    png = to_png(fig)
+    assert png.startswith(b"\x89PNG")
+    assert to_png(plot_potential(V, max_pixels=64)).startswith(b"\x89PNG")